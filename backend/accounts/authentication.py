@@ -0,0 +1,144 @@
+"""
+캐시된 JWT 인증
+기본 JWTAuthentication은 요청마다 users 테이블을 조회한다.
+여기서는 인증/권한 확인에 필요한 컬럼(CACHED_USER_FIELDS)만 프로세스 메모리(짧은 TTL)
+-> 캐시(Redis) 순서로 찾고, 둘 다 없을 때만 DB에서 읽는다. 비밀번호 해시는 캐시에
+넣지 않고, 토큰 폐기 확인(CHECK_REVOKE_TOKEN)용 MD5 값만 보관한다.
+캐시에서 만든 사용자도 일반 User 인스턴스이므로 FK 할당, 저장 등 기존 코드가
+그대로 동작하며, 나머지 컬럼은 처음 접근할 때 DB에서 읽는 지연 로드(deferred) 필드다.
+
+사용자가 저장/삭제되면 signals.py에서 두 캐시를 모두 지운다.
+다른 프로세스의 메모리 캐시는 지울 수 없으므로 ACCOUNTS_USER_LOCAL_CACHE_TIMEOUT(초)
+동안은 옛 값(예: 비활성화 전 상태)이 보일 수 있다.
+"""
+import threading
+
+from cachetools import TTLCache
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import User
+
+# 캐시(Redis)에 사용자 행을 보관하는 시간 (초, 시그널로 무효화하고 TTL은 안전장치)
+USER_CACHE_TIMEOUT = getattr(settings, 'ACCOUNTS_USER_CACHE_TIMEOUT', 60 * 5)
+
+# 프로세스 메모리 캐시 보관 시간 (초) / 최대 사용자 수
+USER_LOCAL_CACHE_TIMEOUT = getattr(settings, 'ACCOUNTS_USER_LOCAL_CACHE_TIMEOUT', 10)
+USER_LOCAL_CACHE_SIZE = getattr(settings, 'ACCOUNTS_USER_LOCAL_CACHE_SIZE', 1024)
+
+_local_users = TTLCache(maxsize=USER_LOCAL_CACHE_SIZE, ttl=USER_LOCAL_CACHE_TIMEOUT)
+_local_lock = threading.Lock()
+
+
+# 캐시에 보관하는 컬럼 (인증/권한 확인용)
+CACHED_USER_FIELDS = ('id', 'email', 'username', 'is_active', 'is_staff', 'is_superuser')
+
+
+def user_cache_key(user_id):
+    return f'accounts:user:{user_id}'
+
+
+def dump_user(values):
+    """User 컬럼 값(CACHED_USER_FIELDS + password) -> 캐시에 저장할 dict
+
+    비밀번호 해시 대신 토큰 폐기 확인에 쓰는 MD5 값만 남긴다.
+    """
+    data = {name: values[name] for name in CACHED_USER_FIELDS}
+    data['password_md5'] = get_md5_hash_password(values['password'])
+    return data
+
+
+def load_user(data):
+    """캐시된 컬럼 값 -> User (CACHED_USER_FIELDS만 읽은 인스턴스와 같은 상태)
+
+    요청마다 새 인스턴스를 만들어 요청 사이에 수정한 값이 공유되지 않게 한다.
+    """
+    # from_db는 값이 모델 필드 순서대로 와야 함
+    fields = [field.attname for field in User._meta.concrete_fields if field.attname in CACHED_USER_FIELDS]
+    return User.from_db('default', fields, [data[name] for name in fields])
+
+
+def get_cached_user_data(user_id):
+    """메모리 -> 캐시 -> DB 순서로 사용자 컬럼 값을 찾는다. (없으면 None)"""
+    key = user_cache_key(user_id)
+    with _local_lock:
+        data = _local_users.get(key)
+    if data is None:
+        data = cache.get(key)
+        # 이전 형식(전체 행)으로 저장된 값은 무시하고 다시 읽는다
+        if data is None or 'password_md5' not in data:
+            values = User.objects.filter(pk=user_id).values(*CACHED_USER_FIELDS, 'password').first()
+            if values is None:
+                return None
+            data = dump_user(values)
+            cache.set(key, data, USER_CACHE_TIMEOUT)
+        with _local_lock:
+            _local_users[key] = data
+    return data
+
+
+def get_cached_user(user_id):
+    """캐시된 사용자 (없으면 None)"""
+    data = get_cached_user_data(user_id)
+    return load_user(data) if data is not None else None
+
+
+def invalidate_cached_users(*user_ids):
+    """사용자 캐시를 지운다.
+
+    즉시 지우고, 트랜잭션 커밋 후 한 번 더 지워서 커밋 전에
+    다른 요청이 옛 데이터로 다시 채운 캐시도 제거한다.
+    """
+    keys = [user_cache_key(user_id) for user_id in user_ids if user_id]
+    if not keys:
+        return
+
+    def delete():
+        cache.delete_many(keys)
+        with _local_lock:
+            for key in keys:
+                _local_users.pop(key, None)
+
+    delete()
+    transaction.on_commit(delete)
+
+
+def clear_local_user_cache():
+    """프로세스 메모리 캐시 전체 삭제 (테스트용)"""
+    with _local_lock:
+        _local_users.clear()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """users 테이블 조회 대신 캐시된 사용자를 쓰는 JWTAuthentication"""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+
+        try:
+            data = get_cached_user_data(user_id)
+        except (ValueError, TypeError) as e:
+            # 형식이 맞지 않는 사용자 ID
+            raise AuthenticationFailed(_('User not found'), code='user_not_found') from e
+        if data is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not data['is_active']:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != data['password_md5']:
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code='password_changed'
+                )
+
+        return load_user(data)
@@ -4,10 +4,16 @@
 """
 
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Cast, Substr
 from django.utils import timezone
+import re
 import uuid
 
+# username 자동 생성 후 저장 시도 횟수 (동시 가입으로 같은 이름이 선점된 경우 재시도)
+USERNAME_SAVE_ATTEMPTS = 5
+
 #
 # 기본 유저를 생성해주는 모델
 #
@@ -115,20 +121,45 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.first_name
 
     def save(self, *args, **kwargs):
-        # username이 없으면 자동 생성
-        if not self.username:
-            base_username = self.email.split('@')[0] if self.email else f'user_{self.id.hex[:8]}'
+        # username이 있으면 그대로 저장
+        if self.username:
+            return super().save(*args, **kwargs)
+
+        # 없으면 자동 생성. 동시에 가입한 사용자와 같은 이름을 골라
+        # unique 제약에 걸리면 다음 번호로 다시 시도
+        base_username = self.email.split('@')[0] if self.email else f'user_{self.id.hex[:8]}'
+        for attempt in range(USERNAME_SAVE_ATTEMPTS):
             self.username = self.generate_unique_username(base_username)
-        super().save(*args, **kwargs)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                taken = User.objects.filter(username=self.username).exists()
+                if not taken or attempt == USERNAME_SAVE_ATTEMPTS - 1:
+                    self.username = None
+                    raise
 
     def generate_unique_username(self, base_username):
-        username = base_username
-        counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f'{base_username}_{counter}'
-            counter += 1
-        return username
-    
+        """base_username 또는 base_username_<다음 번호> (쿼리 한 번)
+
+        base_username과 base_username_<숫자> 중 가장 큰 번호를 집계해 그다음 번호를 쓴다.
+        (username__startswith는 username 인덱스로 범위를 좁히고, 번호는 bigint 범위로 제한)
+        """
+        prefix = f'{base_username}_'
+        taken = User.objects.filter(
+            Q(username=base_username)
+            | Q(username__startswith=prefix, username__regex=rf'^{re.escape(prefix)}[0-9]{{1,18}}$')
+        ).aggregate(
+            exact=Count('pk', filter=Q(username=base_username)),
+            last=Max(
+                Cast(Substr('username', len(prefix) + 1), models.BigIntegerField()),
+                filter=~Q(username=base_username),
+            ),
+        )
+        if not taken['exact']:
+            return base_username
+        return f'{prefix}{(taken["last"] or 0) + 1}'
+
     # 유저의 마지막 로그인 일시 저장
     def update_last_login(self):
         self.last_login = timezone.now()
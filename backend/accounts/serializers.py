@@ -1,9 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from .models import User, SocialAccount
-import requests
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
+from . import social
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -58,50 +56,14 @@ class SocialLoginSerializer(serializers.Serializer):
 
     def validate_google_token(self, token):
         try:
-            # Google OAuth2 토큰 검증
-            idinfo = id_token.verify_oauth2_token(
-                token, 
-                google_requests.Request(), 
-                settings.GOOGLE_CLIENT_ID
-            )
-            
-            if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
-                raise ValueError('Wrong issuer.')
-                
-            return {
-                'social_id': idinfo['sub'],
-                'email': idinfo.get('email'),
-                'first_name': idinfo.get('given_name', ''),
-                'last_name': idinfo.get('family_name', ''),
-                'profile_image_url': idinfo.get('picture', ''),
-                'is_verified': idinfo.get('email_verified', False),
-            }
-        except ValueError:
+            return social.verify_google_token(token)
+        except social.SocialTokenError:
             raise serializers.ValidationError('유효하지 않은 Google 토큰입니다.')
 
     def validate_kakao_token(self, token):
         try:
-            # Kakao 토큰 검증
-            response = requests.get(
-                'https://kapi.kakao.com/v2/user/me',
-                headers={'Authorization': f'Bearer {token}'}
-            )
-            
-            if response.status_code != 200:
-                raise ValueError('Invalid token')
-                
-            user_info = response.json()
-            kakao_account = user_info.get('kakao_account', {})
-            profile = kakao_account.get('profile', {})
-            
-            return {
-                'social_id': str(user_info['id']),
-                'email': kakao_account.get('email'),
-                'first_name': profile.get('nickname', ''),
-                'profile_image_url': profile.get('profile_image_url', ''),
-                'is_verified': kakao_account.get('is_email_verified', False),
-            }
-        except Exception:
+            return social.verify_kakao_token(token)
+        except social.SocialTokenError:
             raise serializers.ValidationError('유효하지 않은 Kakao 토큰입니다.')
 
     def validate(self, attrs):
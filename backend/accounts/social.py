@@ -0,0 +1,181 @@
+"""
+소셜 로그인 토큰 검증 (Google ID 토큰 / Kakao 액세스 토큰)
+
+- 외부 호출은 연결 풀을 가진 requests.Session 하나를 공유하고 모두 타임아웃을 건다
+- Google 서명 인증서는 응답의 Cache-Control max-age 동안 프로세스 메모리와 캐시(Redis)에
+  보관하고 로그인마다 다시 받지 않는다. 토큰의 kid가 보관 중인 인증서에 없으면
+  (키 교체) 한 번만 새로 받는다.
+- 토큰이 잘못되면 SocialTokenError(ValueError),
+  제공자 서버에 연결할 수 없으면 SocialProviderUnavailable(503)
+"""
+import re
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from google.auth import exceptions as google_exceptions
+from google.auth import jwt as google_jwt
+from requests.adapters import HTTPAdapter
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+GOOGLE_CERTS_URL = getattr(settings, 'GOOGLE_CERTS_URL', 'https://www.googleapis.com/oauth2/v1/certs')
+GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+KAKAO_USER_URL = getattr(settings, 'KAKAO_USER_URL', 'https://kapi.kakao.com/v2/user/me')
+
+# 외부 호출 타임아웃 (연결, 읽기) 초
+SOCIAL_LOGIN_TIMEOUT = getattr(settings, 'SOCIAL_LOGIN_TIMEOUT', (3, 5))
+
+# 제공자별(호스트별) 연결 풀 크기
+SOCIAL_LOGIN_POOL_SIZE = getattr(settings, 'SOCIAL_LOGIN_POOL_SIZE', 20)
+
+# 인증서 응답에 max-age가 없을 때 보관 시간 (초)
+GOOGLE_CERTS_DEFAULT_TIMEOUT = getattr(settings, 'GOOGLE_CERTS_DEFAULT_TIMEOUT', 60 * 60)
+
+# 보관 중인 인증서에 없는 kid로 인증서를 다시 받는 최소 간격 (초)
+GOOGLE_CERTS_MIN_REFRESH = getattr(settings, 'GOOGLE_CERTS_MIN_REFRESH', 60)
+
+# exp/iat 검증 시 허용할 시계 오차 (초)
+GOOGLE_TOKEN_CLOCK_SKEW = getattr(settings, 'GOOGLE_TOKEN_CLOCK_SKEW', 10)
+
+GOOGLE_CERTS_CACHE_KEY = 'accounts:google_certs'
+
+
+class SocialTokenError(ValueError):
+    """유효하지 않은 소셜 토큰"""
+
+
+class SocialProviderUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '소셜 로그인 서버에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.'
+    default_code = 'social_provider_unavailable'
+
+
+def _build_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SOCIAL_LOGIN_POOL_SIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_session = _build_session()
+
+# 프로세스 메모리의 Google 인증서 {'certs', 'fetched_at', 'expires_at'}
+_google_certs = None
+_google_certs_lock = threading.Lock()
+
+
+def _max_age(response):
+    match = re.search(r'max-age=(\d+)', response.headers.get('Cache-Control', ''))
+    return int(match.group(1)) if match else GOOGLE_CERTS_DEFAULT_TIMEOUT
+
+
+def _fetch_google_certs():
+    """인증서를 내려받아 캐시에 저장한다. 반환값: {'certs', 'fetched_at', 'expires_at'}"""
+    try:
+        response = _session.get(GOOGLE_CERTS_URL, timeout=SOCIAL_LOGIN_TIMEOUT)
+        response.raise_for_status()
+        certs = response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise SocialProviderUnavailable() from e
+    timeout = _max_age(response)
+    now = time.time()
+    entry = {'certs': certs, 'fetched_at': now, 'expires_at': now + timeout}
+    if timeout > 0:
+        cache.set(GOOGLE_CERTS_CACHE_KEY, entry, timeout)
+    return entry
+
+
+def get_google_certs(refresh=False):
+    """{kid: 인증서 PEM} 메모리 -> 캐시 -> 다운로드 순서
+
+    refresh면 새로 받는다. (단, 받은 지 GOOGLE_CERTS_MIN_REFRESH초가 안 됐으면 그대로 사용해
+    임의의 kid를 담은 토큰으로 매번 다운로드를 일으키지 못하게 함)
+    """
+    global _google_certs
+    now = time.time()
+    entry = _google_certs
+    if entry and entry['expires_at'] > now and (
+        not refresh or entry['fetched_at'] > now - GOOGLE_CERTS_MIN_REFRESH
+    ):
+        return entry['certs']
+
+    # 동시에 만료를 본 요청들이 한 번만 받도록 잠금 후 다시 확인
+    with _google_certs_lock:
+        current = _google_certs
+        if current is not None and current is not entry and current['expires_at'] > now:
+            return current['certs']
+        entry = None if refresh else cache.get(GOOGLE_CERTS_CACHE_KEY)
+        if entry is None or entry['expires_at'] <= now:
+            entry = _fetch_google_certs()
+        _google_certs = entry
+        return entry['certs']
+
+
+def clear_google_certs():
+    """보관 중인 인증서 삭제 (테스트용)"""
+    global _google_certs
+    with _google_certs_lock:
+        _google_certs = None
+    cache.delete(GOOGLE_CERTS_CACHE_KEY)
+
+
+def verify_google_token(token):
+    """Google ID 토큰 검증 -> 사용자 정보"""
+    try:
+        kid = google_jwt.decode_header(token).get('kid')
+    except (ValueError, TypeError) as e:
+        raise SocialTokenError('형식이 잘못된 토큰입니다.') from e
+
+    certs = get_google_certs()
+    if kid not in certs:
+        certs = get_google_certs(refresh=True)
+    try:
+        idinfo = google_jwt.decode(
+            token, certs=certs, audience=settings.GOOGLE_CLIENT_ID,
+            clock_skew_in_seconds=GOOGLE_TOKEN_CLOCK_SKEW,
+        )
+    except (ValueError, google_exceptions.GoogleAuthError) as e:
+        raise SocialTokenError(str(e)) from e
+    if idinfo.get('iss') not in GOOGLE_ISSUERS:
+        raise SocialTokenError('Wrong issuer.')
+
+    return {
+        'social_id': idinfo['sub'],
+        'email': idinfo.get('email'),
+        'first_name': idinfo.get('given_name', ''),
+        'last_name': idinfo.get('family_name', ''),
+        'profile_image_url': idinfo.get('picture', ''),
+        'is_verified': idinfo.get('email_verified', False),
+    }
+
+
+def verify_kakao_token(token):
+    """Kakao 액세스 토큰으로 사용자 정보 조회"""
+    try:
+        response = _session.get(
+            KAKAO_USER_URL, headers={'Authorization': f'Bearer {token}'}, timeout=SOCIAL_LOGIN_TIMEOUT,
+        )
+    except requests.RequestException as e:
+        raise SocialProviderUnavailable() from e
+    if response.status_code >= 500:
+        raise SocialProviderUnavailable()
+    if response.status_code != 200:
+        raise SocialTokenError('Invalid token')
+
+    try:
+        user_info = response.json()
+        kakao_account = user_info.get('kakao_account', {})
+        profile = kakao_account.get('profile', {})
+        return {
+            'social_id': str(user_info['id']),
+            'email': kakao_account.get('email'),
+            'first_name': profile.get('nickname', ''),
+            'profile_image_url': profile.get('profile_image_url', ''),
+            'is_verified': kakao_account.get('is_email_verified', False),
+        }
+    except (ValueError, KeyError, AttributeError) as e:
+        raise SocialTokenError('Invalid response') from e
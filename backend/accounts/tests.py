@@ -1,3 +1,301 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import redis
+import rsa
+from django.conf import settings
+from django.core.cache import cache, caches
 from django.test import TestCase
+from rest_framework.test import APIClient
+from google.auth import crypt
+from google.auth import jwt as google_jwt
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import social
+from .authentication import clear_local_user_cache, user_cache_key
+from .tokens import TOKEN_BLACKLIST_CACHE, blacklist_cache_key
+from .models import User
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local_user_cache()
+        self.user = User.objects.create_user(email='user@test.com', password='pass1234', first_name='길동')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def test_user_lookup_is_cached(self):
+        # 인증용 사용자 1 + 프로필 1
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/accounts/user/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['email'], 'user@test.com')
+
+        # 두 번째부터는 프로필 조회만
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/accounts/user/')
+        self.assertEqual(response.data['first_name'], '길동')
+
+    def test_redis_cache_used_when_local_cache_is_empty(self):
+        self.client.get('/api/accounts/user/')
+        clear_local_user_cache()
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/accounts/user/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_cache_holds_auth_fields_only(self):
+        self.client.get('/api/accounts/user/')
+        data = cache.get(user_cache_key(self.user.pk))
+        self.assertEqual(
+            set(data), {'id', 'email', 'username', 'is_active', 'is_staff', 'is_superuser', 'password_md5'}
+        )
+        self.assertNotIn(self.user.password, data.values())
+
+    @patch.object(api_settings, 'CHECK_REVOKE_TOKEN', True)
+    def test_password_change_revokes_old_access_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+        self.assertEqual(self.client.get('/api/accounts/user/').status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('newpass5678')
+            self.user.save()
+        response = self.client.get('/api/accounts/user/')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data['code'], 'password_changed')
+
+    def test_update_invalidates_cache(self):
+        self.client.get('/api/accounts/user/')
+        response = self.client.patch('/api/accounts/user/', {'first_name': '철수'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.client.get('/api/accounts/user/').data['first_name'], '철수')
+
+    def test_inactive_and_deleted_users_rejected(self):
+        self.client.get('/api/accounts/user/')
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/accounts/user/').status_code, 401)
+
+        self.user.delete()
+        response = self.client.get('/api/accounts/user/')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data['code'], 'user_not_found')
+
+
+class UsernameGenerationTests(TestCase):
+    def test_next_free_suffix_in_one_query(self):
+        for username in ('kim', 'kim_1', 'kim_7', 'kim_lee', 'kimchi_9'):
+            User.objects.create_user(username=username)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(User().generate_unique_username('kim'), 'kim_8')
+        self.assertEqual(User().generate_unique_username('lee'), 'lee')
+        self.assertEqual(User.objects.create_user(email='kim@test.com').username, 'kim_8')
+        self.assertEqual(User.objects.create_user(email='kim@other.com').username, 'kim_9')
+
+    def test_retry_when_username_taken_concurrently(self):
+        User.objects.create_user(username='park')
+        with patch.object(User, 'generate_unique_username', side_effect=['park', 'park_1']):
+            user = User.objects.create_user(email='park@test.com')
+        self.assertEqual(user.username, 'park_1')
+        self.assertEqual(User.objects.filter(username__startswith='park').count(), 2)
+
+
+class StubProviderHandler(BaseHTTPRequestHandler):
+    """Google 인증서 / Kakao 사용자 정보 API 흉내"""
+
+    def do_GET(self):
+        server = self.server
+        if self.path == '/certs':
+            server.cert_requests += 1
+            self._send(200, server.certs, {'Cache-Control': 'public, max-age=3600'})
+        elif self.path == '/kakao/me':
+            token = self.headers.get('Authorization', '')
+            if token == 'Bearer slow':
+                # 클라이언트가 타임아웃으로 먼저 연결을 끊음
+                time.sleep(1)
+                self.close_connection = True
+            elif token == 'Bearer good':
+                self._send(200, {
+                    'id': 1234,
+                    'kakao_account': {'email': 'kakao@test.com', 'profile': {'nickname': '카카오'}},
+                })
+            else:
+                self._send(401, {'msg': 'this access token does not exist'})
+        else:
+            self._send(404, {})
+
+    def _send(self, code, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class SocialLoginTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.keys = {kid: rsa.newkeys(512) for kid in ('key-1', 'key-2')}
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubProviderHandler)
+        cls.server.certs = {}
+        cls.server.cert_requests = 0
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{cls.server.server_port}'
+        cls.patches = [
+            patch.object(social, 'GOOGLE_CERTS_URL', f'{base_url}/certs'),
+            patch.object(social, 'KAKAO_USER_URL', f'{base_url}/kakao/me'),
+            patch.object(social, 'SOCIAL_LOGIN_TIMEOUT', (1, 0.3)),
+        ]
+        for patcher in cls.patches:
+            patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in cls.patches:
+            patcher.stop()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        social.clear_google_certs()
+        self.publish_keys('key-1')
+        self.server.cert_requests = 0
+        self.client = APIClient()
+
+    def publish_keys(self, *kids):
+        self.server.certs = {kid: self.keys[kid][0].save_pkcs1().decode() for kid in kids}
+
+    def google_token(self, kid='key-1', key_id=None, **claims):
+        now = int(time.time())
+        payload = {
+            'iss': 'https://accounts.google.com', 'aud': settings.GOOGLE_CLIENT_ID,
+            'sub': 'google-1', 'email': 'google@test.com', 'iat': now, 'exp': now + 600,
+            **claims,
+        }
+        signer = crypt.RSASigner.from_string(self.keys[kid][1].save_pkcs1().decode(), key_id=key_id or kid)
+        return google_jwt.encode(signer, payload).decode()
+
+    def login(self, provider, token):
+        return self.client.post('/api/accounts/social-login/', {
+            'provider': provider, 'access_token': token,
+        }, format='json')
+
+    def test_google_certs_fetched_once(self):
+        for _ in range(3):
+            response = self.login('google', self.google_token())
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user']['email'], 'google@test.com')
+        self.assertEqual(self.server.cert_requests, 1)
+
+        # 다른 프로세스: 메모리에는 없어도 캐시(Redis)의 인증서를 사용
+        social._google_certs = None
+        self.assertEqual(self.login('google', self.google_token()).status_code, 200)
+        self.assertEqual(self.server.cert_requests, 1)
+
+    def test_google_key_rotation_refreshes_certs(self):
+        self.assertEqual(self.login('google', self.google_token()).status_code, 200)
+        self.publish_keys('key-1', 'key-2')
+        social._google_certs['fetched_at'] -= social.GOOGLE_CERTS_MIN_REFRESH
+
+        self.assertEqual(self.login('google', self.google_token('key-2')).status_code, 200)
+        self.assertEqual(self.server.cert_requests, 2)
+
+        # 알 수 없는 kid가 반복돼도 최소 간격 안에서는 다시 받지 않음
+        for _ in range(3):
+            self.assertEqual(self.login('google', self.google_token(key_id='unknown')).status_code, 400)
+        self.assertEqual(self.server.cert_requests, 2)
+
+    def test_invalid_google_tokens_rejected(self):
+        for token in (
+            self.google_token(exp=int(time.time()) - 3600),
+            self.google_token(iss='https://evil.example.com'),
+            self.google_token(aud='other-client'),
+            'not-a-token',
+        ):
+            self.assertEqual(self.login('google', token).status_code, 400)
+
+    def test_kakao_login(self):
+        response = self.login('kakao', 'good')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user']['email'], 'kakao@test.com')
+        self.assertEqual(self.login('kakao', 'expired').status_code, 400)
+
+    def test_kakao_timeout_returns_503(self):
+        response = self.login('kakao', 'slow')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.data['detail'].code, 'social_provider_unavailable')
+
+
+class RefreshTokenBlacklistTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.store = caches[TOKEN_BLACKLIST_CACHE]
+        self.store.clear()
+        self.user = User.objects.create_user(email='user@test.com', password='pass1234')
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client = APIClient()
+
+    def refresh_token(self, token):
+        return self.client.post('/api/accounts/token/refresh/', {'refresh': str(token)}, format='json')
+
+    def test_rotation_blacklists_used_token_until_expiry(self):
+        with patch.object(self.store, 'add', wraps=self.store.add) as add:
+            response = self.refresh_token(self.refresh)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.data['refresh'], str(self.refresh))
+        key, _, timeout = add.call_args.args
+        self.assertEqual(key, blacklist_cache_key(self.refresh['jti']))
+        self.assertAlmostEqual(timeout, self.refresh['exp'] - time.time(), delta=5)
+
+        # 사용한 토큰은 다시 쓸 수 없고, 새 토큰은 사용 가능
+        self.assertEqual(self.refresh_token(self.refresh).status_code, 401)
+        self.assertEqual(self.refresh_token(response.data['refresh']).status_code, 200)
+
+    def test_logout_blacklists_refresh_token(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post('/api/accounts/logout/', {'refresh': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.refresh_token(self.refresh).status_code, 401)
+        response = self.client.post('/api/token/verify/', {'token': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 400)
+        # 이미 폐기된 토큰으로 다시 로그아웃해도 성공
+        response = self.client.post('/api/accounts/logout/', {'refresh': str(self.refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_inactive_user_cannot_refresh(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.refresh_token(self.refresh).status_code, 401)
+
+    def test_store_outage_rejects_instead_of_allowing(self):
+        self.assertEqual(self.refresh_token(self.refresh).status_code, 200)
+
+        # 저장소 장애 중에는 폐기된 토큰이 다시 통과하지 않도록 503
+        with patch.object(self.store, 'get', side_effect=redis.ConnectionError('down')):
+            response = self.refresh_token(self.refresh)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.data['detail'].code, 'token_store_unavailable')
 
-# Create your tests here.
+        fresh = RefreshToken.for_user(self.user)
+        with patch.object(self.store, 'add', side_effect=redis.ConnectionError('down')):
+            self.assertEqual(self.refresh_token(fresh).status_code, 503)
+            self.client.force_authenticate(self.user)
+            response = self.client.post('/api/accounts/logout/', {'refresh': str(fresh)}, format='json')
+            self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.refresh_token(fresh).status_code, 200)
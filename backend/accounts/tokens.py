@@ -0,0 +1,117 @@
+"""
+refresh 토큰 블랙리스트 (캐시/Redis)
+token_blacklist 앱(DB 테이블) 대신 jti를 키로 캐시에 저장하고,
+TTL을 토큰 만료 시각에 맞춰 만료된 토큰은 저절로 사라지게 한다.
+
+- 회전(ROTATE_REFRESH_TOKENS): 사용한 refresh 토큰을 블랙리스트에 넣는다.
+  cache.add로 넣으므로 같은 토큰으로 동시에 갱신해도 한 요청만 성공한다.
+- 로그아웃: 전달한 refresh 토큰을 블랙리스트에 넣는다.
+- 블랙리스트는 오류를 무시하지 않는 별도 캐시(TOKEN_BLACKLIST_CACHE)를 사용하고,
+  저장소에 연결할 수 없으면 폐기된 토큰을 통과시키는 대신 503으로 거부한다.
+"""
+import time
+
+import redis
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from django_redis.exceptions import ConnectionInterrupted
+from rest_framework import serializers, status
+from rest_framework.exceptions import APIException, AuthenticationFailed
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import get_cached_user
+
+# 블랙리스트를 저장할 캐시 별칭 (IGNORE_EXCEPTIONS가 꺼져 있어야 함)
+TOKEN_BLACKLIST_CACHE = getattr(settings, 'TOKEN_BLACKLIST_CACHE', 'tokens')
+
+STORE_ERRORS = (redis.RedisError, ConnectionInterrupted, OSError)
+
+
+class TokenStoreUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '토큰 저장소에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.'
+    default_code = 'token_store_unavailable'
+
+
+def blacklist_cache_key(jti):
+    return f'accounts:blacklist:{jti}'
+
+
+def is_blacklisted(payload):
+    jti = payload.get(api_settings.JTI_CLAIM)
+    if not jti:
+        return False
+    try:
+        return caches[TOKEN_BLACKLIST_CACHE].get(blacklist_cache_key(jti)) is not None
+    except STORE_ERRORS as e:
+        raise TokenStoreUnavailable() from e
+
+
+def blacklist_payload(payload):
+    """토큰을 만료 시각까지 블랙리스트에 넣는다.
+    반환값: 새로 넣었으면 True, 이미 있었으면 False (저장소 장애면 TokenStoreUnavailable)
+    """
+    timeout = int(payload['exp'] - time.time())
+    if timeout <= 0:
+        # 이미 만료된 토큰은 어차피 검증에서 거부됨
+        return True
+    try:
+        return caches[TOKEN_BLACKLIST_CACHE].add(blacklist_cache_key(payload[api_settings.JTI_CLAIM]), 1, timeout)
+    except STORE_ERRORS as e:
+        raise TokenStoreUnavailable() from e
+
+
+class RefreshToken(tokens.RefreshToken):
+    """캐시 블랙리스트를 확인하는 refresh 토큰"""
+
+    def verify(self, *args, **kwargs):
+        if is_blacklisted(self.payload):
+            raise TokenError(_('Token is blacklisted'))
+        super().verify(*args, **kwargs)
+
+    def blacklist(self):
+        return blacklist_payload(self.payload)
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """refresh 토큰 갱신 (SIMPLE_JWT['TOKEN_REFRESH_SERIALIZER'])
+
+    사용자 확인도 인증과 같은 사용자 캐시를 사용한다.
+    """
+    token_class = RefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id:
+            user = get_cached_user(user_id)
+            if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+                raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            # 다른 요청이 먼저 같은 토큰으로 갱신했으면 거부
+            if api_settings.BLACKLIST_AFTER_ROTATION and refresh.blacklist() is False:
+                raise TokenError(_('Token is blacklisted'))
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+
+        return data
+
+
+class TokenVerifySerializer(jwt_serializers.TokenVerifySerializer):
+    """토큰 검증 (SIMPLE_JWT['TOKEN_VERIFY_SERIALIZER']) 블랙리스트에 있는 refresh 토큰은 거부"""
+
+    def validate(self, attrs):
+        token = tokens.UntypedToken(attrs['token'])
+        if is_blacklisted(token.payload):
+            raise serializers.ValidationError(_('Token is blacklisted'))
+        return {}
@@ -3,10 +3,11 @@ from rest_framework.views import APIView
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from .models import User, SocialAccount
+from .tokens import RefreshToken
 from .serializers import (
     UserSerializer, 
     RegisterSerializer, 
@@ -145,16 +146,20 @@ class SocialLoginView(APIView):
 
 class UserView(APIView):
     permission_classes = [IsAuthenticated]
+
+    def get_object(self):
+        """프로필 전체 컬럼을 읽은 사용자 (인증 캐시의 사용자는 일부 컬럼만 가짐)"""
+        return User.objects.get(pk=self.request.user.pk)
     
     def get(self, request):
         """현재 로그인한 사용자 정보 조회"""
-        serializer = UserSerializer(request.user)
+        serializer = UserSerializer(self.get_object())
         return Response(serializer.data)
     
     def patch(self, request):
         """사용자 정보 업데이트"""
         serializer = UserSerializer(
-            request.user, 
+            self.get_object(), 
             data=request.data, 
             partial=True
         )
@@ -254,15 +259,15 @@ class LogoutView(APIView):
     
     def post(self, request):
         try:
-            # Refresh 토큰 블랙리스트 추가 (선택사항)
+            # Refresh 토큰 블랙리스트 추가 (만료 시각까지 캐시에 보관)
             refresh_token = request.data.get('refresh')
             if refresh_token:
                 token = RefreshToken(refresh_token)
                 token.blacklist()
             
             return Response({'message': '로그아웃되었습니다.'})
-        except Exception as e:
-            # 블랙리스트 실패해도 로그아웃은 성공으로 처리
+        except TokenError:
+            # 이미 만료/폐기된 토큰이어도 로그아웃은 성공으로 처리
             return Response({'message': '로그아웃되었습니다.'})
 
 
@@ -0,0 +1,134 @@
+"""
+공휴일 데이터
+공휴일은 연도/국가 단위로 holidays 테이블에 적재해 두고(load_holidays 명령),
+조회는 연도 단위 캐시 키(holidays:<국가>:<연도>)에서 읽는다.
+공휴일은 거의 바뀌지 않으므로 캐시를 길게 두고, 다시 적재할 때만 지운다.
+요청 처리 중에는 외부 API를 호출하지 않는다.
+
+원본 형식
+- 공공데이터포털 특일 정보(getRestDeInfo) JSON 응답 또는 그 item 목록
+  {"locdate": 20250101, "dateName": "1월1일", "isHoliday": "Y"}
+- 간단한 목록 [{"date": "2025-01-01", "name": "신정"}]
+"""
+import json
+from datetime import date, datetime, timedelta
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Holiday
+
+# 연도별 공휴일 캐시 보관 시간 (초)
+HOLIDAY_CACHE_TIMEOUT = getattr(settings, 'HOLIDAY_CACHE_TIMEOUT', 60 * 60 * 24 * 30)
+
+# 한 번에 조회할 수 있는 최대 기간 (일)
+HOLIDAY_QUERY_MAX_DAYS = getattr(settings, 'HOLIDAY_QUERY_MAX_DAYS', 400)
+
+HOLIDAY_API_URL = getattr(
+    settings, 'HOLIDAY_API_URL',
+    'https://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/getRestDeInfo',
+)
+HOLIDAY_API_TIMEOUT = getattr(settings, 'HOLIDAY_API_TIMEOUT', 10)
+
+
+def holiday_cache_key(country, year):
+    return f'holidays:{country}:{year}'
+
+
+def _parse_item(item):
+    """원본 항목 -> (날짜, 이름) (공휴일이 아니면 None)"""
+    if 'locdate' in item:
+        if item.get('isHoliday', 'Y') != 'Y':
+            return None
+        return datetime.strptime(str(item['locdate']), '%Y%m%d').date(), str(item['dateName']).strip()
+    return date.fromisoformat(str(item['date'])), str(item['name']).strip()
+
+
+def parse_holidays(data):
+    """원본 JSON -> [(날짜, 이름), ...] (형식이 잘못되면 ValueError)"""
+    if isinstance(data, dict):
+        # 공공데이터포털 응답: response.body.items.item (1건이면 dict, 없으면 빈 문자열)
+        try:
+            data = data['response']['body']['items']
+        except (KeyError, TypeError):
+            raise ValueError('공휴일 응답 형식이 올바르지 않습니다.')
+        data = data.get('item', []) if isinstance(data, dict) else []
+        if isinstance(data, dict):
+            data = [data]
+    if not isinstance(data, list):
+        raise ValueError('공휴일 목록 형식이 올바르지 않습니다.')
+    try:
+        parsed = [_parse_item(item) for item in data]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f'잘못된 공휴일 항목입니다: {e}')
+    return sorted({item for item in parsed if item is not None})
+
+
+def read_holiday_file(path):
+    """로컬 JSON 파일(원본 API 응답 저장본 등)을 읽는다."""
+    with open(path, encoding='utf-8') as file:
+        return parse_holidays(json.load(file))
+
+
+def fetch_holidays(year):
+    """공공데이터포털 특일 정보 API에서 한 해의 공휴일(한국)을 가져온다."""
+    # 설정의 키는 이미 URL 인코딩되어 있으므로 그대로 붙임
+    url = f'{HOLIDAY_API_URL}?serviceKey={settings.HOLIDAY_API_KEY}'
+    response = requests.get(url, params={
+        'solYear': year, 'numOfRows': 100, '_type': 'json',
+    }, timeout=HOLIDAY_API_TIMEOUT)
+    response.raise_for_status()
+    return parse_holidays(response.json())
+
+
+def store_holidays(country, year, holidays):
+    """한 해의 공휴일을 교체 저장하고 캐시를 지운다. 반환값: 저장한 수"""
+    rows = [
+        Holiday(country=country, date=day, name=name)
+        for day, name in holidays if day.year == year
+    ]
+    with transaction.atomic():
+        Holiday.objects.filter(
+            country=country, date__gte=date(year, 1, 1), date__lt=date(year + 1, 1, 1)
+        ).delete()
+        Holiday.objects.bulk_create(rows)
+        transaction.on_commit(lambda: cache.delete(holiday_cache_key(country, year)))
+    return len(rows)
+
+
+def get_year_holidays(country, years):
+    """{연도: [{'date', 'name'}, ...]} 캐시에 없는 연도는 한 번의 쿼리로 채운다."""
+    keys = {holiday_cache_key(country, year): year for year in years}
+    cached = cache.get_many(list(keys))
+    result = {keys[key]: value for key, value in cached.items()}
+
+    missing = sorted(set(years) - set(result))
+    if missing:
+        loaded = {year: [] for year in missing}
+        for day, name in Holiday.objects.filter(
+            country=country, date__gte=date(missing[0], 1, 1), date__lt=date(missing[-1] + 1, 1, 1)
+        ).values_list('date', 'name'):
+            if day.year in loaded:
+                loaded[day.year].append({'date': day.isoformat(), 'name': name})
+        # 적재하지 않은 연도도 빈 목록으로 캐시 (적재 시 삭제됨)
+        cache.set_many(
+            {holiday_cache_key(country, year): value for year, value in loaded.items()},
+            HOLIDAY_CACHE_TIMEOUT,
+        )
+        result.update(loaded)
+    return result
+
+
+def get_holidays(country, start, end):
+    """[start, end) 구간의 공휴일 목록 (날짜순)"""
+    last = end - timedelta(days=1)
+    by_year = get_year_holidays(country, range(start.year, last.year + 1))
+    start_key, end_key = start.isoformat(), end.isoformat()
+    return [
+        holiday
+        for year in sorted(by_year)
+        for holiday in by_year[year]
+        if start_key <= holiday['date'] < end_key
+    ]
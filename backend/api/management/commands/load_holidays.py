@@ -0,0 +1,45 @@
+"""
+공휴일 적재
+
+    python manage.py load_holidays 2025 2026              # 공공데이터포털 API (한국)
+    python manage.py load_holidays 2025 --file kr-2025.json [--country KR]
+
+같은 연도/국가의 기존 공휴일은 교체하고 해당 연도 캐시를 지운다.
+--file에는 API 응답을 저장한 JSON이나 [{"date", "name"}] 목록을 줄 수 있다.
+"""
+import re
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+from api.holidays import fetch_holidays, read_holiday_file, store_holidays
+
+
+class Command(BaseCommand):
+    help = '공휴일 데이터를 연도 단위로 적재합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('years', nargs='+', type=int, help='적재할 연도')
+        parser.add_argument('--country', default='KR', help='ISO 3166-1 두 글자 국가 코드 (기본: KR)')
+        parser.add_argument('--file', help='원본 대신 읽을 로컬 JSON 파일')
+
+    def handle(self, *args, **options):
+        country = options['country'].strip().upper()
+        # Holiday.country는 두 글자 (max_length=2)
+        if not re.fullmatch(r'[A-Z]{2}', country):
+            raise CommandError(f"국가 코드는 두 글자 영문이어야 합니다: {options['country']}")
+        if not options['file'] and country != 'KR':
+            raise CommandError('KR 외의 국가는 --file이 필요합니다.')
+
+        try:
+            holidays = read_holiday_file(options['file']) if options['file'] else None
+        except (OSError, ValueError) as e:
+            raise CommandError(f'공휴일 파일을 읽을 수 없습니다: {e}') from e
+
+        for year in options['years']:
+            try:
+                data = holidays if holidays is not None else fetch_holidays(year)
+            except (requests.RequestException, ValueError) as e:
+                raise CommandError(f'{year}년 공휴일을 가져올 수 없습니다: {e}') from e
+            count = store_holidays(country, year, data)
+            self.stdout.write(self.style.SUCCESS(f'{country} {year}년 공휴일 {count}건을 적재했습니다.'))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Holiday',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('country', models.CharField(default='KR', max_length=2, verbose_name='국가 코드')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('name', models.CharField(max_length=100, verbose_name='이름')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='적재일')),
+            ],
+            options={
+                'verbose_name': '공휴일',
+                'verbose_name_plural': '공휴일',
+                'db_table': 'holidays',
+                'ordering': ['date'],
+                'constraints': [models.UniqueConstraint(fields=('country', 'date', 'name'), name='unique_holiday')],
+            },
+        ),
+    ]
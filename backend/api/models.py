@@ -1,3 +1,21 @@
 from django.db import models
 
-# Create your models here.
+
+class Holiday(models.Model):
+    """공휴일 (연도/국가 단위로 load_holidays 명령으로 적재)"""
+    country = models.CharField(max_length=2, default='KR', verbose_name='국가 코드')
+    date = models.DateField(verbose_name='날짜')
+    name = models.CharField(max_length=100, verbose_name='이름')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='적재일')
+
+    class Meta:
+        verbose_name = '공휴일'
+        verbose_name_plural = '공휴일'
+        db_table = 'holidays'
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(fields=['country', 'date', 'name'], name='unique_holiday'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.name} ({self.country})"
@@ -1,3 +1,83 @@
+import io
+import json
+import tempfile
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .models import Holiday
+
+# 공공데이터포털 특일 정보 응답 형식
+UPSTREAM_RESPONSE = {
+    'response': {'body': {'items': {'item': [
+        {'locdate': 20250101, 'dateName': '1월1일', 'isHoliday': 'Y'},
+        {'locdate': 20251003, 'dateName': '개천절', 'isHoliday': 'Y'},
+        {'locdate': 20251006, 'dateName': '추석', 'isHoliday': 'Y'},
+        {'locdate': 20251008, 'dateName': '대체공휴일', 'isHoliday': 'Y'},
+        {'locdate': 20251010, 'dateName': '평일', 'isHoliday': 'N'},
+    ]}}},
+}
+
+
+class HolidayTests(TestCase):
+    """공휴일 적재 / 조회"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user(email='user@planpie.com', password='password123'))
+
+    def load(self, data, *years, country='KR'):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+            file.flush()
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('load_holidays', *map(str, years), '--file', file.name,
+                             '--country', country, stdout=io.StringIO())
+
+    def test_invalid_country_rejected(self):
+        for country in ('KOR', 'K', '12'):
+            with self.subTest(country=country), self.assertRaises(CommandError):
+                self.load(UPSTREAM_RESPONSE, 2025, country=country)
+        self.assertFalse(Holiday.objects.exists())
+
+    def test_load_from_file_replaces_year(self):
+        self.load(UPSTREAM_RESPONSE, 2025)
+        self.assertEqual(Holiday.objects.count(), 4)
+        self.load([{'date': '2025-01-01', 'name': '신정'}], 2025)
+        self.assertEqual(list(Holiday.objects.values_list('name', flat=True)), ['신정'])
+
+    def test_range_served_from_cache(self):
+        self.load(UPSTREAM_RESPONSE, 2025)
+        params = {'start_date': '2025-10-01', 'end_date': '2025-11-01'}
+        response = self.client.get('/api/holidays/', params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [holiday['name'] for holiday in response.data], ['개천절', '추석', '대체공휴일']
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/api/holidays/', params).data, response.data)
+
+        # 다시 적재하면 해당 연도 캐시가 지워짐
+        self.load([{'date': '2025-10-03', 'name': '개천절'}], 2025)
+        self.assertEqual(len(self.client.get('/api/holidays/', params).data), 1)
+
+    def test_range_across_years(self):
+        self.load([
+            {'date': '2025-12-25', 'name': '기독탄신일'}, {'date': '2026-01-01', 'name': '신정'},
+        ], 2025, 2026)
+        response = self.client.get('/api/holidays/', {'start_date': '2025-12-01', 'end_date': '2026-02-01'})
+        self.assertEqual([holiday['date'] for holiday in response.data], ['2025-12-25', '2026-01-01'])
+        self.assertEqual(len(self.client.get('/api/holidays/', {'year': 2026}).data), 1)
 
-# Create your tests here.
+    def test_invalid_range(self):
+        self.assertEqual(self.client.get('/api/holidays/').status_code, 400)
+        response = self.client.get('/api/holidays/', {'start_date': '2025-01-01', 'end_date': '2027-01-01'})
+        self.assertEqual(response.status_code, 400)
+        # 날짜 범위를 넘는 값
+        self.assertEqual(self.client.get('/api/holidays/', {'start_date': '9999-12-31'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/holidays/', {'year': 9999}).status_code, 400)
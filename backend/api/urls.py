@@ -1,6 +1,7 @@
 from django.urls import path
-# from .views import your_views
+
+from .views import HolidayListView
 
 urlpatterns = [
-    # 여기에 API 엔드포인트 추가
+    path('holidays/', HolidayListView.as_view(), name='holiday-list'),
 ]
@@ -1,3 +1,52 @@
-from django.shortcuts import render
+from datetime import date, timedelta
 
-# Create your views here.
+from django.utils.dateparse import parse_date
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .holidays import HOLIDAY_QUERY_MAX_DAYS, get_holidays
+
+
+class HolidayListView(APIView):
+    """공휴일 조회 (캐시에서 읽으며 외부 API를 호출하지 않음)
+
+    GET /api/holidays/?start_date=2025-09-01&end_date=2025-10-01[&country=KR]
+    GET /api/holidays/?year=2025
+    구간은 [start_date, end_date) 이며 end_date가 없으면 start_date 하루만 조회한다.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        country = params.get('country', 'KR').upper()[:2]
+        try:
+            if params.get('year'):
+                year = int(params['year'])
+                start, end = date(year, 1, 1), date(year + 1, 1, 1)
+            else:
+                start = parse_date(params.get('start_date') or '')
+                if start is None:
+                    raise ValueError
+                end = parse_date(params['end_date']) if params.get('end_date') else start + timedelta(days=1)
+                if end is None:
+                    raise ValueError
+        except (ValueError, OverflowError):
+            # OverflowError: 9999-12-31의 다음 날처럼 날짜 범위를 넘는 경우
+            return Response(
+                {'error': 'start_date(YYYY-MM-DD) 또는 year가 필요합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if end <= start:
+            return Response(
+                {'error': 'end_date는 start_date 이후여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if (end - start).days > HOLIDAY_QUERY_MAX_DAYS:
+            return Response(
+                {'error': f'조회 기간은 최대 {HOLIDAY_QUERY_MAX_DAYS}일까지 가능합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(get_holidays(country, start, end))
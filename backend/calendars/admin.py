@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Calendar, CalendarTag, CalendarMember, Event
+from .models import Calendar, CalendarTag, CalendarMember, Event, EventImport
 
 
 class CalendarTagInline(admin.TabularInline):
@@ -36,3 +36,10 @@ class EventAdmin(admin.ModelAdmin):
     list_display = ("title", "calendar", "start_date", "end_date", "all_day")
     list_filter = ("calendar", "all_day")
     search_fields = ("title", "calendar__name")
+
+
+@admin.register(EventImport)
+class EventImportAdmin(admin.ModelAdmin):
+    list_display = ("file_name", "calendar", "status", "created_count", "updated_count", "skipped_count", "created_at")
+    list_filter = ("status",)
+    search_fields = ("file_name", "calendar__name")
@@ -0,0 +1,245 @@
+"""
+일정 일괄 처리 (POST /api/events/batch/)
+
+    {"operations": [
+        {"op": "create", "data": {...}},
+        {"op": "update", "id": "<event id>", "data": {...}},
+        {"op": "delete", "id": "<event id>"}
+    ]}
+
+필요한 캘린더/태그/일정을 한 번씩만 조회한 뒤 모든 작업을 검증하고,
+하나라도 실패하면 아무것도 저장하지 않는다. 모두 통과하면 한 트랜잭션에서
+bulk_create / bulk_update / 삭제를 실행한다.
+"""
+import uuid
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Calendar, CalendarTag, Event
+from .permissions import get_permissions_from_context
+from .realtime import publish_change
+from .serializers import EventSerializer
+from .stats import invalidate_calendar_stats
+
+# 한 요청에서 처리할 수 있는 최대 작업 수
+EVENT_BATCH_MAX_OPERATIONS = getattr(settings, 'EVENT_BATCH_MAX_OPERATIONS', 100)
+
+OPERATIONS = ('create', 'update', 'delete')
+
+# 개별 수정 발생 중복 제약 (Event.Meta.constraints)
+OVERRIDE_CONSTRAINT = 'unique_event_override'
+OVERRIDE_CONFLICT_ERROR = '이미 개별 수정된 발생이 있습니다.'
+
+
+class BatchFailed(Exception):
+    """검증에 실패한 작업이 있음 (errors: 실패한 항목별 결과)"""
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def _uuid(value):
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def parse_operations(payload):
+    """요청 본문의 작업 목록 형식을 검증한다. (형식 오류는 ValueError)"""
+    operations = payload.get('operations') if isinstance(payload, dict) else None
+    if not isinstance(operations, list) or not operations:
+        raise ValueError('operations 목록이 필요합니다.')
+    if len(operations) > EVENT_BATCH_MAX_OPERATIONS:
+        raise ValueError(f'한 번에 최대 {EVENT_BATCH_MAX_OPERATIONS}개의 작업만 처리할 수 있습니다.')
+
+    seen = set()
+    for index, operation in enumerate(operations):
+        kind = operation.get('op') if isinstance(operation, dict) else None
+        if kind not in OPERATIONS:
+            raise ValueError(f'{index}번 작업의 op는 create, update, delete 중 하나여야 합니다.')
+        if kind != 'delete' and not isinstance(operation.get('data'), dict):
+            raise ValueError(f'{index}번 작업에 data가 필요합니다.')
+        if kind != 'create':
+            event_id = _uuid(operation.get('id'))
+            if event_id is None:
+                raise ValueError(f'{index}번 작업에 올바른 일정 id가 필요합니다.')
+            if event_id in seen:
+                raise ValueError(f'{index}번 작업: 같은 일정에 대한 작업이 중복되었습니다.')
+            seen.add(event_id)
+    return operations
+
+
+def load_batch_objects(operations, permissions):
+    """작업에 필요한 일정/캘린더/태그를 종류별로 한 번씩 조회한다.
+
+    반환값은 EventSerializer context에 그대로 넣는다.
+    (PreloadedPrimaryKeyRelatedField / validate_tag_id가 DB 대신 사용)
+    """
+    def data_ids(field):
+        return {
+            _uuid(operation['data'][field])
+            for operation in operations
+            if operation['op'] != 'delete' and operation['data'].get(field)
+        } - {None}
+
+    event_ids = {_uuid(operation['id']) for operation in operations if operation['op'] != 'create'}
+    event_ids |= data_ids('recurrence_parent')
+    events = {
+        event.pk: event
+        for event in permissions.filter_visible(Event.objects.filter(pk__in=event_ids), 'calendar_id')
+    }
+    # 개별 수정 발생의 원본 (반복 규칙 검증에 사용)
+    parent_ids = {event.recurrence_parent_id for event in events.values()} - set(events) - {None}
+    if parent_ids:
+        events.update(
+            (event.pk, event)
+            for event in permissions.filter_visible(Event.objects.filter(pk__in=parent_ids), 'calendar_id')
+        )
+
+    calendar_ids = data_ids('calendar') | {event.calendar_id for event in events.values()}
+    calendars = Calendar.objects.in_bulk(calendar_ids & set(permissions.calendar_ids()))
+    tags = CalendarTag.objects.filter(calendar_id__in=list(calendars)).in_bulk()
+
+    for event in events.values():
+        event.calendar = calendars[event.calendar_id]
+        if event.recurrence_parent_id:
+            event.recurrence_parent = events.get(event.recurrence_parent_id)
+    return {'events': events, 'calendars': calendars, 'tags': tags}
+
+
+def find_override_conflicts(changed):
+    """같은 (원본, 발생 시각)의 개별 수정 발생이 배치 안이나 DB에 이미 있는 작업의 결과 목록
+
+    changed: 저장할 (index, op, 일정) 목록
+    """
+    keys, conflicts = {}, []
+    for index, kind, event in changed:
+        if not (event.recurrence_parent_id and event.recurrence_id):
+            continue
+        key = (event.recurrence_parent_id, event.recurrence_id)
+        if key in keys:
+            conflicts.append((index, kind))
+        else:
+            keys[key] = (index, kind)
+    if keys:
+        condition = Q()
+        for parent_id, recurrence_id in keys:
+            condition |= Q(recurrence_parent_id=parent_id, recurrence_id=recurrence_id)
+        # 수정하는 일정 자신의 기존 행은 제외
+        existing = Event.objects.filter(condition).exclude(
+            pk__in=[event.pk for _, kind, event in changed if kind == 'update']
+        ).values_list('recurrence_parent_id', 'recurrence_id')
+        conflicts += [keys[key] for key in existing if key in keys]
+    return [
+        {'index': index, 'op': kind, 'status': 409, 'errors': {'error': OVERRIDE_CONFLICT_ERROR}}
+        for index, kind in sorted(set(conflicts))
+    ]
+
+
+def run_event_batch(operations, context):
+    """작업을 검증하고 한 트랜잭션에서 저장한다.
+
+    반환값: 작업 순서대로의 결과 목록. 실패한 작업이 있으면 BatchFailed.
+    """
+    request = context['request']
+    permissions = get_permissions_from_context(context)
+    preloaded = load_batch_objects(operations, permissions)
+    context = {**context, **preloaded}
+    now = timezone.now()
+
+    errors = []
+    to_create, to_update, to_delete = [], [], []
+    changed = []
+    update_fields = {'updated_at', 'recurrence_end'}
+
+    for index, operation in enumerate(operations):
+        kind = operation['op']
+        event = None
+        if kind != 'create':
+            event = preloaded['events'].get(_uuid(operation['id']))
+            if event is None:
+                errors.append({'index': index, 'op': kind, 'status': 404,
+                               'errors': {'error': '일정을 찾을 수 없습니다.'}})
+                continue
+
+        if kind == 'delete':
+            if not event.can_delete(request.user, permissions):
+                errors.append({'index': index, 'op': kind, 'status': 403,
+                               'errors': {'error': '이 일정을 삭제할 권한이 없습니다.'}})
+                continue
+            to_delete.append(event)
+            continue
+
+        serializer = EventSerializer(
+            event, data=operation['data'], partial=kind == 'update', context=context
+        )
+        if not serializer.is_valid():
+            errors.append({'index': index, 'op': kind, 'status': 400, 'errors': serializer.errors})
+            continue
+
+        if kind == 'create':
+            event = Event(**serializer.validated_data, created_by=request.user)
+            to_create.append(event)
+        else:
+            for field, value in serializer.validated_data.items():
+                setattr(event, field, value)
+                update_fields.add(Event._meta.get_field(field).name)
+            # bulk_update는 auto_now를 갱신하지 않으므로 직접 설정 (증분 동기화 기준)
+            event.updated_at = now
+            to_update.append(event)
+        event.update_recurrence_end()
+        changed.append((index, kind, event))
+
+    if errors:
+        raise BatchFailed(errors)
+    errors = find_override_conflicts(changed)
+    if errors:
+        raise BatchFailed(errors)
+
+    changes = [('created', event) for event in to_create] + [('updated', event) for event in to_update]
+    try:
+        with transaction.atomic():
+            Event.objects.bulk_create(to_create)
+            if to_update:
+                Event.objects.bulk_update(to_update, sorted(update_fields))
+            if to_delete:
+                # 삭제 기록/알림은 post_delete 시그널에서 처리
+                Event.objects.filter(pk__in=[event.pk for event in to_delete]).delete()
+            # bulk_create/bulk_update는 post_save 시그널을 보내지 않으므로 직접 알림/통계 캐시 삭제
+            # (캘린더를 옮긴 일정도 있으므로 관련된 캘린더 모두)
+            invalidate_calendar_stats(*preloaded['calendars'])
+            transaction.on_commit(lambda: [
+                publish_change(
+                    event.calendar_id, 'event', action, event.pk,
+                    updated_at=event.updated_at.isoformat(),
+                )
+                for action, event in changes
+            ])
+    except IntegrityError as e:
+        # 검증 후 다른 요청이 먼저 저장한 경우 등
+        message = OVERRIDE_CONFLICT_ERROR if OVERRIDE_CONSTRAINT in str(e) else '다른 데이터와 충돌하여 저장하지 못했습니다.'
+        raise BatchFailed([{'status': 409, 'errors': {'error': message}}])
+
+    saved = Event.objects.filter(pk__in=[event.pk for _, event in changes]).select_related(
+        'calendar', 'tag', 'created_by'
+    ).in_bulk()
+    results = []
+    created, updated = iter(to_create), iter(to_update)
+    for index, operation in enumerate(operations):
+        kind = operation['op']
+        if kind == 'delete':
+            results.append({'index': index, 'op': kind, 'status': 204, 'id': operation['id']})
+            continue
+        event = next(created if kind == 'create' else updated)
+        results.append({
+            'index': index,
+            'op': kind,
+            'status': 201 if kind == 'create' else 200,
+            'event': EventSerializer(saved[event.pk], context=context).data,
+        })
+    return results
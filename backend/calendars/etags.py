@@ -0,0 +1,136 @@
+"""
+조건부 GET (ETag / If-None-Match)
+응답 본문을 직렬화하지 않고 updated_at 최대값과 행 수만으로 ETag를 계산한다.
+django.views.decorators.http.condition과 함께 사용해 변경이 없으면 304를 반환한다.
+"""
+import hashlib
+import uuid
+
+from django.db.models import Count, Max, OuterRef, Subquery
+
+from .models import Calendar, CalendarMember, CalendarTag, Event
+from .permissions import get_calendar_permissions
+from .utils import filter_events_in_window, parse_event_window
+
+
+def _make_etag(*parts):
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def _stat(queryset, expression):
+    """캘린더별 집계 서브쿼리 (Calendar 쿼리의 annotate에 사용)"""
+    return Subquery(
+        queryset.filter(calendar=OuterRef('pk'))
+        .order_by()
+        .values('calendar')
+        .annotate(value=expression)
+        .values('value')[:1]
+    )
+
+
+def _visible_calendar_id(request, value):
+    """URL의 캘린더 ID가 사용자가 볼 수 있는 캘린더면 (UUID, 역할)을 반환한다."""
+    try:
+        calendar_id = uuid.UUID(str(value))
+    except ValueError:
+        return None, None
+    role = get_calendar_permissions(request).get_role(calendar_id)
+    if role is None:
+        return None, None
+    return calendar_id, role
+
+
+def _calendar_stats(calendar_id, **annotations):
+    """캘린더 updated_at과 관련 행 집계를 한 번의 쿼리로 조회한다."""
+    return Calendar.objects.filter(pk=calendar_id).annotate(**annotations).order_by().values_list(
+        'updated_at', *annotations
+    ).first()
+
+
+def _member_annotations():
+    members = CalendarMember.objects.all()
+    return {
+        'member_count': _stat(members, Count('pk')),
+        'member_latest': _stat(members, Max('updated_at')),
+        'member_user_latest': _stat(members, Max('user__updated_at')),
+    }
+
+
+def _tag_annotations():
+    tags = CalendarTag.objects.all()
+    return {
+        'tag_count': _stat(tags, Count('pk')),
+        'tag_latest': _stat(tags, Max('updated_at')),
+    }
+
+
+def calendar_etag(request, pk=None, **kwargs):
+    """캘린더 상세: 캘린더/소유자/멤버/태그/일정 수 + 현재 사용자 역할"""
+    calendar_id, role = _visible_calendar_id(request, pk)
+    if calendar_id is None:
+        return None
+    stats = _calendar_stats(
+        calendar_id,
+        owner_latest=Max('owner__updated_at'),
+        event_count=_stat(Event.objects.all(), Count('pk')),
+        **_member_annotations(),
+        **_tag_annotations(),
+    )
+    return _make_etag('calendar', calendar_id, role, stats) if stats else None
+
+
+def calendar_tags_etag(request, pk=None, **kwargs):
+    """캘린더 태그 목록"""
+    calendar_id, _ = _visible_calendar_id(request, pk)
+    if calendar_id is None:
+        return None
+    stats = _calendar_stats(calendar_id, **_tag_annotations())
+    return _make_etag('tags', calendar_id, stats[1:]) if stats else None
+
+
+def calendar_members_etag(request, pk=None, **kwargs):
+    """캘린더 멤버 목록"""
+    calendar_id, _ = _visible_calendar_id(request, pk)
+    if calendar_id is None:
+        return None
+    stats = _calendar_stats(calendar_id, **_member_annotations())
+    return _make_etag('members', calendar_id, stats[1:]) if stats else None
+
+
+def calendar_events_etag(request, pk=None, calendar_id=None, **kwargs):
+    """캘린더 일정 목록: 조회 구간(쿼리 문자열)별 일정 집계 + 태그 + 권한 관련 사용자 정보
+
+    start_date/end_date 검증 오류 등은 뷰에서 처리하도록 None을 반환한다.
+    """
+    calendar_id, role = _visible_calendar_id(
+        request, pk or calendar_id or request.GET.get('calendar_id')
+    )
+    if calendar_id is None:
+        return None
+    try:
+        window = parse_event_window(request.GET)
+    except ValueError:
+        return None
+
+    events = Event.objects.all()
+    annotations = {}
+    if window:
+        events = filter_events_in_window(events, *window)
+        # 개별 수정된 발생은 구간 밖으로 옮겨져도 원본의 발생을 가리므로 함께 집계
+        masters = events.filter(calendar_id=calendar_id).exclude(recurrence_rule='').values('pk')
+        overrides = Event.objects.filter(recurrence_parent__in=masters)
+        annotations = {
+            'override_count': _stat(overrides, Count('pk')),
+            'override_latest': _stat(overrides, Max('updated_at')),
+        }
+    stats = _calendar_stats(
+        calendar_id,
+        event_count=_stat(events, Count('pk')),
+        event_latest=_stat(events, Max('updated_at')),
+        creator_latest=_stat(events, Max('created_by__updated_at')),
+        **annotations,
+        **_tag_annotations(),
+    )
+    if not stats:
+        return None
+    return _make_etag('events', calendar_id, request.GET.urlencode(), request.user.pk, role, stats)
@@ -0,0 +1,84 @@
+"""
+바쁜 시간(free/busy) 조회
+여러 캘린더의 일정을 구간 [start, end)에서 한 번의 범위 조회로 읽고,
+시작 시간 순으로 정렬한 뒤 겹치거나 맞닿은 구간을 합쳐 반환한다.
+제목/메모 등 일정 내용은 응답에 포함하지 않는다.
+"""
+from .models import Calendar, CalendarMember, Event
+from .utils import expand_occurrences, filter_events_in_window
+
+# 구간 계산에 필요한 필드만 조회
+BUSY_FIELDS = (
+    'id', 'calendar_id', 'start_date', 'end_date',
+    'recurrence_rule', 'recurrence_exdates', 'recurrence_parent_id', 'recurrence_id',
+)
+
+
+def merge_intervals(intervals):
+    """(시작, 끝) 목록을 정렬 후 한 번 훑어 겹치거나 맞닿은 구간을 합친다."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def busy_by_calendar(calendar_ids, start, end):
+    """{calendar_id: [(시작, 끝), ...]} (구간에 맞게 잘라냄, 반복 일정은 발생별로 펼침)"""
+    events = filter_events_in_window(
+        Event.objects.filter(calendar_id__in=list(calendar_ids)), start, end
+    ).only(*BUSY_FIELDS).order_by()
+
+    intervals = {calendar_id: [] for calendar_id in calendar_ids}
+    for event in expand_occurrences(events, start, end):
+        intervals[event.calendar_id].append(
+            (max(event.start_date, start), min(max(event.end_date, event.start_date), end))
+        )
+    return intervals
+
+
+def serialize_busy(intervals):
+    return [{'start': start, 'end': end} for start, end in merge_intervals(intervals)]
+
+
+def calendars_free_busy(calendar_ids, start, end):
+    """선택한 캘린더들의 일정을 모두 합친 바쁜 구간"""
+    intervals = busy_by_calendar(calendar_ids, start, end)
+    return serialize_busy(interval for values in intervals.values() for interval in values)
+
+
+def member_calendar_ids(calendar_id):
+    """{user_id: {calendar_id, ...}} 공유 캘린더의 소유자/멤버 각자가 속한 캘린더 (한 번의 쿼리)"""
+    user_ids = Calendar.objects.filter(pk=calendar_id).values('owner_id').order_by().union(
+        CalendarMember.objects.filter(calendar_id=calendar_id).values('user_id').order_by(), all=True
+    )
+    owned = Calendar.objects.filter(owner_id__in=user_ids).values_list('owner_id', 'id').order_by()
+    joined = CalendarMember.objects.filter(user_id__in=user_ids).values_list(
+        'user_id', 'calendar_id'
+    ).order_by()
+
+    result = {}
+    for user_id, member_calendar_id in owned.union(joined, all=True):
+        result.setdefault(user_id, set()).add(member_calendar_id)
+    return result
+
+
+def members_free_busy(calendar_id, start, end):
+    """공유 캘린더 멤버별 바쁜 구간 (각 멤버가 속한 모든 캘린더 기준)
+
+    멤버들의 캘린더를 모아 일정은 한 번만 조회하고, 멤버별로 나눠 합친다.
+    """
+    by_user = member_calendar_ids(calendar_id)
+    intervals = busy_by_calendar(set().union(*by_user.values()), start, end)
+    return [
+        {
+            'user': user_id,
+            'busy': serialize_busy(
+                interval for calendar_id in calendar_ids for interval in intervals[calendar_id]
+            ),
+        }
+        for user_id, calendar_ids in by_user.items()
+    ]
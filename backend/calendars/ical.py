@@ -0,0 +1,452 @@
+"""
+iCalendar (RFC 5545) 내보내기 / 읽기
+내보내기는 일정을 청크 단위로 읽어 VEVENT를 한 건씩 만들어 내보내고,
+읽기는 파일을 줄 단위로 읽어 VEVENT를 한 건씩 반환하므로
+일정 수와 관계없이 메모리 사용량이 일정하다.
+"""
+import functools
+import json
+import re
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.renderers import BaseRenderer
+
+from .recurrence import parse_exdates
+
+# 서버 측 커서로 한 번에 읽어올 일정 수
+ICS_EXPORT_CHUNK_SIZE = getattr(settings, 'ICS_EXPORT_CHUNK_SIZE', 2000)
+
+PRODID = '-//PlanPie//PlanPie Calendar//KO'
+UID_DOMAIN = 'planpie'
+
+# RFC 5545 3.1: 한 줄은 75 옥텟을 넘지 않도록 접는다
+MAX_LINE_OCTETS = 75
+
+# VTIMEZONE에 담을 UTC 오프셋 전환 범위 [시작 연도, 끝 연도)
+VTIMEZONE_YEARS = (1970, 2038)
+
+
+class ICalendarRenderer(BaseRenderer):
+    """text/calendar 요청(Accept)을 받아들이기 위한 렌더러
+
+    정상 응답은 뷰에서 StreamingHttpResponse로 내보내므로,
+    여기서는 오류 응답({'detail': ...})만 JSON 문자열로 렌더링한다.
+    """
+    media_type = 'text/calendar'
+    format = 'ics'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return json.dumps(data, ensure_ascii=False).encode()
+
+
+def escape_text(value):
+    """TEXT 값 이스케이프 (\\, ;, ,, 줄바꿈)"""
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold_line(line):
+    """75 옥텟마다 CRLF + 공백으로 접는다 (UTF-8 문자 중간에서 자르지 않음)"""
+    encoded = line.encode()
+    if len(encoded) <= MAX_LINE_OCTETS:
+        return line + '\r\n'
+
+    parts = []
+    current, size, limit = [], 0, MAX_LINE_OCTETS
+    for char in line:
+        char_size = len(char.encode())
+        if size + char_size > limit:
+            parts.append(''.join(current))
+            # 이어지는 줄은 앞의 공백 1옥텟을 포함해 75옥텟
+            current, size, limit = [], 0, MAX_LINE_OCTETS - 1
+        current.append(char)
+        size += char_size
+    parts.append(''.join(current))
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def format_datetime(value):
+    """UTC DATE-TIME (예: 20250901T000000Z)"""
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def format_date(value):
+    return value.strftime('%Y%m%d')
+
+
+def format_local_datetime(value):
+    """서버 시간대(TIME_ZONE)의 현지 DATE-TIME (TZID와 함께 사용, 예: 20250901T090000)"""
+    return timezone.localtime(value).strftime('%Y%m%dT%H%M%S')
+
+
+def local_property(name, value, all_day=False):
+    """반복 일정의 날짜 속성: 종일이면 VALUE=DATE, 아니면 TZID + 현지 시각
+
+    반복 규칙은 서버 시간대의 현지 시각으로 펼치므로, UTC로 내보내면
+    다른 캘린더 앱이 BYDAY 등을 UTC 기준의 다른 요일/날짜로 펼친다.
+    """
+    if all_day:
+        return f'{name};VALUE=DATE:{format_date(timezone.localtime(value).date())}'
+    return f'{name};TZID={settings.TIME_ZONE}:{format_local_datetime(value)}'
+
+
+def format_utc_offset(offset):
+    """UTC-OFFSET (예: +0900, 초 단위가 있으면 +093000)"""
+    seconds = int(offset.total_seconds())
+    sign = '-' if seconds < 0 else '+'
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f'{sign}{hours:02d}{minutes:02d}' + (f'{seconds:02d}' if seconds else '')
+
+
+def zone_transitions(zone, start, end):
+    """[start, end) 사이 zone의 (UTC 오프셋, DST, 이름)이 바뀌는 시점 목록
+
+    하루 간격으로 훑다가 상태가 바뀌면 그 하루 안에서 초 단위로 이분 탐색한다.
+    반환값은 (전환 시각(UTC), 이전 상태, 새 상태)의 목록이다.
+    """
+    def state(timestamp):
+        local = datetime.fromtimestamp(timestamp, zone)
+        return local.utcoffset(), local.dst(), local.tzname()
+
+    day = 24 * 60 * 60
+    transitions = []
+    moment, current = int(start.timestamp()), state(start.timestamp())
+    while moment < end.timestamp():
+        following = moment + day
+        if state(following) != current:
+            low, high = moment, following
+            while high - low > 1:
+                middle = (low + high) // 2
+                if state(middle) == current:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append((datetime.fromtimestamp(high, dt_timezone.utc), current, state(high)))
+            current = state(high)
+        moment = following
+    return transitions
+
+
+def observance_lines(moment, before, after):
+    """VTIMEZONE의 STANDARD/DAYLIGHT 하위 구성요소 하나
+
+    DTSTART는 전환 직전 오프셋(TZOFFSETFROM) 기준의 현지 시각이다.
+    """
+    component = 'DAYLIGHT' if after[1] else 'STANDARD'
+    lines = [
+        f'BEGIN:{component}',
+        f'DTSTART:{(moment + before[0]).strftime("%Y%m%dT%H%M%S")}',
+        f'TZOFFSETFROM:{format_utc_offset(before[0])}',
+        f'TZOFFSETTO:{format_utc_offset(after[0])}',
+    ]
+    if after[2]:
+        lines.append(f'TZNAME:{escape_text(after[2])}')
+    lines.append(f'END:{component}')
+    return lines
+
+
+@functools.lru_cache(maxsize=None)
+def vtimezone_lines(tzid):
+    """TZID로 참조하는 시간대의 VTIMEZONE 구성요소 (RFC 5545 3.6.5)
+
+    zoneinfo에서 VTIMEZONE_YEARS 범위의 오프셋 전환을 찾아 전환마다
+    하위 구성요소를 하나씩 만든다. 범위 시작 시점의 오프셋도 함께 넣어
+    첫 전환 이전 시각도 해석할 수 있게 한다. 시간대마다 한 번만 계산한다.
+    """
+    zone = ZoneInfo(tzid)
+    start = datetime(VTIMEZONE_YEARS[0], 1, 1, tzinfo=dt_timezone.utc)
+    end = datetime(VTIMEZONE_YEARS[1], 1, 1, tzinfo=dt_timezone.utc)
+    local = start.astimezone(zone)
+    initial = (local.utcoffset(), local.dst(), local.tzname())
+
+    lines = ['BEGIN:VTIMEZONE', f'TZID:{tzid}']
+    lines += observance_lines(start, initial, initial)
+    for moment, before, after in zone_transitions(zone, start, end):
+        lines += observance_lines(moment, before, after)
+    lines.append('END:VTIMEZONE')
+    return tuple(lines)
+
+
+def event_uid(event_id):
+    return f'{event_id}@{UID_DOMAIN}'
+
+
+def all_day_dates(event):
+    """종일 일정의 (DTSTART, DTEND) 날짜
+
+    PlanPie는 종일 일정을 마지막 날 23:59:59까지로 저장하므로,
+    배타적 종료일인 DTEND는 마지막 날의 다음 날이 된다.
+    """
+    start = timezone.localtime(event.start_date).date()
+    end = timezone.localtime(event.end_date)
+    end_date = end.date() if end.time() == time.min else end.date() + timedelta(days=1)
+    return start, max(end_date, start + timedelta(days=1))
+
+
+def event_lines(event):
+    """일정 한 건의 VEVENT 줄 목록
+
+    개별 수정된 발생은 원본과 같은 UID에 RECURRENCE-ID를 붙여 내보낸다.
+    반복 일정(원본/수정된 발생)의 시각은 UTC 대신 TZID를 붙인 현지 시각으로 내보낸다.
+    """
+    recurring = bool(event.recurrence_rule or event.recurrence_parent_id)
+    uid = event_uid(event.recurrence_parent_id or event.pk)
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{uid}',
+        f'DTSTAMP:{format_datetime(event.updated_at)}',
+        f'CREATED:{format_datetime(event.created_at)}',
+        f'LAST-MODIFIED:{format_datetime(event.updated_at)}',
+    ]
+    if event.all_day:
+        start, end = all_day_dates(event)
+        lines += [f'DTSTART;VALUE=DATE:{format_date(start)}', f'DTEND;VALUE=DATE:{format_date(end)}']
+    elif recurring:
+        lines += [local_property('DTSTART', event.start_date), local_property('DTEND', event.end_date)]
+    else:
+        lines += [f'DTSTART:{format_datetime(event.start_date)}', f'DTEND:{format_datetime(event.end_date)}']
+
+    lines.append(f'SUMMARY:{escape_text(event.title)}')
+    if event.description:
+        lines.append(f'DESCRIPTION:{escape_text(event.description)}')
+    if event.location:
+        lines.append(f'LOCATION:{escape_text(event.location)}')
+    if event.tag_id:
+        lines.append(f'CATEGORIES:{escape_text(event.tag.name)}')
+
+    if event.recurrence_rule:
+        rule = event.recurrence_rule
+        if rule.upper().startswith('RRULE:'):
+            rule = rule[len('RRULE:'):]
+        lines.append(f'RRULE:{rule}')
+        for exdate in sorted(parse_exdates(event.recurrence_exdates)):
+            lines.append(local_property('EXDATE', exdate, event.all_day))
+    if event.recurrence_parent_id and event.recurrence_id:
+        lines.append(local_property('RECURRENCE-ID', event.recurrence_id, event.all_day))
+
+    lines.append('END:VEVENT')
+    return lines
+
+
+def iter_ics(events, name, chunk_size=ICS_EXPORT_CHUNK_SIZE):
+    """VCALENDAR 문서를 VEVENT 단위 문자열로 내보내는 제너레이터
+
+    events는 Event queryset이며, iterator()로 청크 단위(서버 측 커서)로 읽는다.
+    """
+    header = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{escape_text(name)}',
+        f'X-WR-TIMEZONE:{settings.TIME_ZONE}',
+        # 반복 일정의 DTSTART/EXDATE/RECURRENCE-ID가 참조하는 TZID 정의
+        *vtimezone_lines(settings.TIME_ZONE),
+    ]
+    yield ''.join(fold_line(line) for line in header)
+
+    events = events.select_related('tag').order_by('start_date', 'id')
+    for event in events.iterator(chunk_size=chunk_size):
+        yield ''.join(fold_line(line) for line in event_lines(event))
+
+    yield fold_line('END:VCALENDAR')
+
+
+# ===== 읽기 (가져오기) =====
+
+DURATION = re.compile(
+    r'^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?'
+    r'(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$'
+)
+
+
+def unescape_text(value):
+    """escape_text의 역변환"""
+    result, chars = [], iter(value)
+    for char in chars:
+        if char == '\\':
+            char = next(chars, '')
+            result.append('\n' if char in ('n', 'N') else char)
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def unfold_lines(lines):
+    """접힌 줄(CRLF + 공백/탭)을 이어 붙여 논리적 한 줄씩 반환한다."""
+    current = None
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def parse_property(line):
+    """'DTSTART;TZID=Asia/Seoul:20250901T090000' -> ('DTSTART', {'TZID': 'Asia/Seoul'}, '20250901T090000')"""
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ':' and not quoted:
+            head, value = line[:index], line[index + 1:]
+            break
+    else:
+        raise ValueError(f'잘못된 iCalendar 줄입니다: {line[:50]}')
+
+    name, *params = head.split(';')
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition('=')
+        parameters[key.upper()] = param_value.strip('"')
+    return name.upper(), parameters, value
+
+
+def iter_vevents(lines):
+    """VEVENT마다 {속성 이름: [(파라미터, 값), ...]}을 반환한다.
+    VEVENT 안의 VALARM 등 하위 컴포넌트와 VTIMEZONE은 건너뛴다.
+    """
+    event, nested = None, 0
+    for line in unfold_lines(lines):
+        try:
+            name, params, value = parse_property(line)
+        except ValueError:
+            # 빈 줄이나 깨진 줄은 건너뛴다
+            continue
+        if name == 'BEGIN':
+            if value.upper() == 'VEVENT' and event is None:
+                event = {}
+            elif event is not None:
+                nested += 1
+        elif name == 'END':
+            if event is not None and nested:
+                nested -= 1
+            elif event is not None and value.upper() == 'VEVENT':
+                yield event
+                event = None
+        elif event is not None and not nested:
+            event.setdefault(name, []).append((params, value))
+
+
+def parse_datetime_value(value, params):
+    """DATE / DATE-TIME 값 -> (aware datetime 또는 date)
+
+    UTC('Z'), TZID, 시간대 없는(floating) 값을 지원하며,
+    알 수 없는 TZID는 서버 기본 시간대로 해석한다.
+    """
+    value = value.strip()
+    if params.get('VALUE') == 'DATE' or len(value) == 8:
+        return datetime.strptime(value, '%Y%m%d').date()
+
+    if value.endswith('Z'):
+        return datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=dt_timezone.utc)
+
+    parsed = datetime.strptime(value, '%Y%m%dT%H%M%S')
+    tzinfo = None
+    if params.get('TZID'):
+        try:
+            tzinfo = ZoneInfo(params['TZID'])
+        except (ZoneInfoNotFoundError, ValueError):
+            tzinfo = None
+    return timezone.make_aware(parsed, tzinfo or timezone.get_current_timezone())
+
+
+def parse_duration(value):
+    match = DURATION.match(value.strip())
+    if not match:
+        raise ValueError(f'잘못된 DURATION입니다: {value}')
+    duration = timedelta(**{
+        unit: int(match[unit] or 0) for unit in ('weeks', 'days', 'hours', 'minutes', 'seconds')
+    })
+    return -duration if match['sign'] == '-' else duration
+
+
+def local_day_start(value):
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def vevent_fields(properties):
+    """VEVENT 속성 -> Event 필드 값
+
+    반환값: (UID, 필드 dict, 첫 번째 CATEGORIES 값, RECURRENCE-ID)
+    종일 일정은 PlanPie 방식대로 마지막 날 23:59:59까지로 변환한다.
+    필수 값이 없거나 형식이 잘못되면 ValueError.
+    """
+    def first(name, default=None):
+        values = properties.get(name)
+        return values[0] if values else (None, default)
+
+    params, value = first('DTSTART')
+    if value is None:
+        raise ValueError('DTSTART가 없습니다.')
+    start = parse_datetime_value(value, params)
+    all_day = isinstance(start, date) and not isinstance(start, datetime)
+
+    end_params, end_value = first('DTEND')
+    _, duration = first('DURATION')
+    if end_value:
+        end = parse_datetime_value(end_value, end_params)
+    elif duration:
+        end = start + parse_duration(duration)
+    else:
+        end = start + timedelta(days=1) if all_day else start
+
+    if all_day:
+        end = end if isinstance(end, date) and not isinstance(end, datetime) else end.date()
+        last_day = max(end - timedelta(days=1), start)
+        start = local_day_start(start)
+        end = timezone.make_aware(datetime.combine(last_day, time(23, 59, 59)))
+    if end < start:
+        raise ValueError('DTEND가 DTSTART보다 빠릅니다.')
+
+    exdates = []
+    for exdate_params, exdate_value in properties.get('EXDATE', []):
+        for item in exdate_value.split(','):
+            exdate = parse_datetime_value(item, exdate_params)
+            if not isinstance(exdate, datetime):
+                exdate = timezone.localtime(start).replace(
+                    year=exdate.year, month=exdate.month, day=exdate.day
+                )
+            exdates.append(exdate.isoformat())
+
+    _, rule = first('RRULE', '')
+    recurrence_params, recurrence_value = first('RECURRENCE-ID')
+    recurrence_id = None
+    if recurrence_value:
+        recurrence_id = parse_datetime_value(recurrence_value, recurrence_params)
+        if not isinstance(recurrence_id, datetime):
+            recurrence_id = local_day_start(recurrence_id)
+
+    _, categories = first('CATEGORIES', '')
+    category = unescape_text(categories.split(',')[0]).strip()[:50] if categories else ''
+
+    fields = {
+        'title': unescape_text(first('SUMMARY', '')[1])[:200] or '(제목 없음)',
+        'description': unescape_text(first('DESCRIPTION', '')[1]),
+        'location': unescape_text(first('LOCATION', '')[1])[:200],
+        'start_date': start,
+        'end_date': end,
+        'all_day': all_day,
+        'recurrence_rule': '' if recurrence_id else rule,
+        'recurrence_exdates': exdates,
+    }
+    uid = first('UID', '')[1].strip()[:255]
+    return uid, fields, category, recurrence_id
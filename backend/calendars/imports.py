@@ -0,0 +1,335 @@
+"""
+iCalendar(.ics) 가져오기
+파일을 줄 단위로 읽으며 VEVENT를 청크로 모아 bulk_create / bulk_update로 저장한다.
+
+- 같은 캘린더에 같은 UID의 일정이 있으면 새로 만들지 않고 갱신한다 (다시 가져오기)
+- CATEGORIES의 첫 번째 값은 같은 이름의 CalendarTag로 연결하고, 없으면 태그를 만든다
+- RECURRENCE-ID가 있는 VEVENT(개별 수정된 발생)도 청크 단위로 원본 시리즈에 연결해 저장한다
+  (원본이 파일 뒤쪽에 있어 아직 저장되지 않은 발생만 모아 두었다가 마지막에 저장)
+- 청크마다 트랜잭션을 커밋하고 EventImport에 진행 상황(updated_at)을 기록한다
+- 프로세스가 죽어 EVENT_IMPORT_STALE_SECONDS 동안 진행이 없는 running 작업은
+  상태 조회나 `import_ics --fail-stale`에서 실패로 표시한다
+"""
+import codecs
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .ical import iter_vevents, vevent_fields
+from .models import CalendarTag, Event, EventImport, DEFAULT_TAG_COLORS
+from .realtime import publish_change
+from .recurrence import build_rule
+from .sharing import invalidate_public_snapshot
+from .stats import invalidate_calendar_stats
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 저장할 일정 수
+EVENT_IMPORT_CHUNK_SIZE = getattr(settings, 'EVENT_IMPORT_CHUNK_SIZE', 1000)
+
+# 업로드 최대 크기 (바이트)
+EVENT_IMPORT_MAX_BYTES = getattr(settings, 'EVENT_IMPORT_MAX_BYTES', 50 * 1024 * 1024)
+
+# 업로드 요청은 작업만 등록하고 별도 스레드에서 처리 (False면 커밋 직후 같은 스레드에서 처리)
+EVENT_IMPORT_IN_THREAD = getattr(settings, 'EVENT_IMPORT_IN_THREAD', True)
+
+# 이 시간(초) 동안 진행 기록이 없는 running 작업은 중단된 것으로 본다
+EVENT_IMPORT_STALE_SECONDS = getattr(settings, 'EVENT_IMPORT_STALE_SECONDS', 10 * 60)
+
+STALE_IMPORT_ERROR = '오랫동안 진행되지 않아 중단되었습니다.'
+
+# 진행 상황으로 저장하는 필드
+PROGRESS_FIELDS = [
+    'status', 'bytes_read', 'created_count', 'updated_count', 'skipped_count', 'finished_at', 'updated_at',
+]
+
+# 다시 가져올 때 갱신하는 필드
+UPDATE_FIELDS = [
+    'title', 'description', 'location', 'start_date', 'end_date', 'all_day', 'tag',
+    'recurrence_rule', 'recurrence_exdates', 'recurrence_end', 'updated_at',
+]
+
+
+class ImportAborted(Exception):
+    """작업이 이미 실패로 표시됨 (중단된 것으로 판단)"""
+
+
+def fail_stale_imports(queryset=None):
+    """진행 기록이 EVENT_IMPORT_STALE_SECONDS보다 오래된 running 작업을 실패로 표시한다.
+    반환값: 실패로 표시한 작업 수
+    """
+    now = timezone.now()
+    queryset = EventImport.objects.all() if queryset is None else queryset
+    return queryset.filter(
+        status='running', updated_at__lt=now - timedelta(seconds=EVENT_IMPORT_STALE_SECONDS)
+    ).update(status='failed', error=STALE_IMPORT_ERROR, finished_at=now, updated_at=now)
+
+
+def iter_lines(file, job):
+    """파일을 한 줄씩 UTF-8로 읽으며 처리한 바이트 수를 job에 기록한다."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    for raw in file:
+        job.bytes_read += len(raw)
+        yield decoder.decode(raw)
+
+
+class TagResolver:
+    """CATEGORIES 이름 -> CalendarTag (없는 이름은 청크마다 한 번에 생성)"""
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        tags = list(calendar.tags.all())
+        self.by_name = {tag.name: tag for tag in tags}
+        self.colors = {tag.color.upper() for tag in tags}
+        self.next_order = max((tag.order for tag in tags), default=-1) + 1
+
+    def next_color(self, name):
+        candidates = [color for color in DEFAULT_TAG_COLORS if color.upper() not in self.colors]
+        if candidates:
+            return candidates[0]
+        value = sum(name.encode()) * 2654435761 % 0xFFFFFF
+        while f'#{value:06X}' in self.colors:
+            value = (value + 0x10101) % 0xFFFFFF
+        return f'#{value:06X}'
+
+    def ensure(self, names):
+        new_tags = []
+        for name in sorted(set(names) - set(self.by_name) - {''}):
+            color = self.next_color(name)
+            self.colors.add(color.upper())
+            tag = CalendarTag(calendar=self.calendar, name=name, color=color, order=self.next_order)
+            self.next_order += 1
+            self.by_name[name] = tag
+            new_tags.append(tag)
+        if new_tags:
+            CalendarTag.objects.bulk_create(new_tags)
+            invalidate_public_snapshot(self.calendar.pk)
+
+    def get(self, name):
+        return self.by_name.get(name) if name else None
+
+
+class EventImporter:
+    """EventImport 작업 하나를 처리한다."""
+
+    def __init__(self, job, chunk_size=None):
+        self.job = job
+        self.calendar = job.calendar
+        self.chunk_size = chunk_size or EVENT_IMPORT_CHUNK_SIZE
+        self.tags = TagResolver(self.calendar)
+
+    def run(self, file):
+        job = self.job
+        job.status = 'running'
+        self.save_progress()
+
+        # overrides: 아직 저장하지 않은 개별 수정 발생, waiting: 원본 시리즈가 아직 없는 발생
+        chunk, overrides, waiting = [], [], []
+        for properties in iter_vevents(iter_lines(file, job)):
+            row = self.parse(properties)
+            if row is None:
+                continue
+            if row[3] is not None:
+                overrides.append(row)
+            else:
+                chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                self.save_series(chunk)
+                chunk = []
+            if len(overrides) >= self.chunk_size:
+                self.save_series(chunk)
+                chunk = []
+                waiting += self.save_overrides(overrides)
+                overrides = []
+        self.save_series(chunk)
+        overrides = waiting + overrides
+        for start in range(0, len(overrides), self.chunk_size):
+            self.save_overrides(overrides[start:start + self.chunk_size], final=True)
+
+        job.status = 'completed'
+        job.finished_at = timezone.now()
+        self.save_progress()
+        transaction.on_commit(
+            lambda: publish_change(self.calendar.pk, 'calendar', 'imported', job.pk)
+        )
+
+    def parse(self, properties):
+        """VEVENT -> (UID, 필드, 분류, RECURRENCE-ID) / 잘못된 일정은 None"""
+        try:
+            uid, fields, category, recurrence_id = vevent_fields(properties)
+            Event(start_date=fields['start_date'], end_date=fields['end_date']).check_duration()
+            if fields['recurrence_rule']:
+                build_rule(fields['recurrence_rule'], fields['start_date'])
+        except ValueError:
+            self.job.skipped_count += 1
+            return None
+        return uid, fields, category, recurrence_id
+
+    def build(self, event, fields, category):
+        for field, value in fields.items():
+            setattr(event, field, value)
+        event.tag = self.tags.get(category)
+        event.update_recurrence_end()
+        return event
+
+    def save_series(self, rows):
+        """시리즈 원본/일반 일정 한 청크 저장"""
+        if not rows:
+            return
+        self.tags.ensure(category for _, _, category, _ in rows)
+
+        # 청크 안에서 UID가 중복되면 마지막 것을 사용
+        by_uid, anonymous = {}, []
+        for row in rows:
+            if row[0]:
+                by_uid[row[0]] = row
+            else:
+                anonymous.append(row)
+        existing = {
+            event.ical_uid: event
+            for event in Event.objects.filter(
+                calendar=self.calendar, ical_uid__in=list(by_uid), recurrence_parent__isnull=True
+            )
+        }
+
+        now = timezone.now()
+        to_create, to_update = [], []
+        for uid, fields, category, _ in list(by_uid.values()) + anonymous:
+            event = existing.get(uid) if uid else None
+            if event is None:
+                to_create.append(self.build(
+                    Event(calendar=self.calendar, created_by=self.job.created_by, ical_uid=uid),
+                    fields, category,
+                ))
+            else:
+                # bulk_update는 auto_now를 갱신하지 않으므로 직접 설정 (증분 동기화 기준)
+                event.updated_at = now
+                to_update.append(self.build(event, fields, category))
+
+        with transaction.atomic():
+            Event.objects.bulk_create(to_create)
+            Event.objects.bulk_update(to_update, UPDATE_FIELDS)
+            self.job.created_count += len(to_create)
+            self.job.updated_count += len(to_update)
+            self.job.skipped_count += len(rows) - len(by_uid) - len(anonymous)
+            self.save_progress()
+
+    def save_overrides(self, overrides, final=False):
+        """개별 수정된 발생 한 청크를 원본 시리즈(UID)에 연결해 저장
+
+        원본 시리즈가 없는 발생은 반환해 나중에 다시 저장하고, final이면 건너뛴다.
+        """
+        if not overrides:
+            return []
+        parents = {
+            event.ical_uid: event
+            for event in Event.objects.filter(
+                calendar=self.calendar,
+                ical_uid__in={row[0] for row in overrides},
+                recurrence_parent__isnull=True,
+            ).exclude(recurrence_rule='')
+        }
+        orphans = [row for row in overrides if row[0] not in parents]
+        if final:
+            self.job.skipped_count += len(orphans)
+            orphans = []
+        self.tags.ensure(category for uid, _, category, _ in overrides if uid in parents)
+        existing = {
+            (event.recurrence_parent_id, event.recurrence_id): event
+            for event in Event.objects.filter(
+                recurrence_parent__in=list(parents.values()),
+                recurrence_id__in={row[3] for row in overrides},
+            )
+        }
+
+        now = timezone.now()
+        rows = {}
+        for uid, fields, category, recurrence_id in overrides:
+            parent = parents.get(uid)
+            if parent is None:
+                continue
+            if (parent.pk, recurrence_id) in rows:
+                self.job.skipped_count += 1
+            rows[(parent.pk, recurrence_id)] = (parent, fields, category, recurrence_id)
+
+        to_create, to_update = [], []
+        for key, (parent, fields, category, recurrence_id) in rows.items():
+            event = existing.get(key)
+            if event is None:
+                to_create.append(self.build(
+                    Event(
+                        calendar=self.calendar, created_by=self.job.created_by, ical_uid=parent.ical_uid,
+                        recurrence_parent=parent, recurrence_id=recurrence_id,
+                    ),
+                    fields, category,
+                ))
+            else:
+                event.updated_at = now
+                to_update.append(self.build(event, fields, category))
+
+        with transaction.atomic():
+            Event.objects.bulk_create(to_create)
+            Event.objects.bulk_update(to_update, UPDATE_FIELDS)
+            self.job.created_count += len(to_create)
+            self.job.updated_count += len(to_update)
+            self.save_progress()
+        return orphans
+
+    def save_progress(self):
+        # 청크마다 커밋되므로 통계 캐시도 청크마다 삭제
+        invalidate_calendar_stats(self.calendar.pk)
+        self.job.updated_at = timezone.now()
+        # 중단된 것으로 보고 이미 실패 처리된 작업이면 더 진행하지 않음
+        saved = EventImport.objects.filter(pk=self.job.pk, status__in=['pending', 'running']).update(
+            **{field: getattr(self.job, field) for field in PROGRESS_FIELDS}
+        )
+        if not saved:
+            raise ImportAborted(STALE_IMPORT_ERROR)
+
+
+def run_import(job, file=None):
+    """가져오기 작업 실행 (file이 없으면 업로드된 job.file을 읽는다)
+
+    실패하면 작업을 failed로 표시한다. 이미 저장된 청크는 유지되며,
+    같은 파일을 다시 가져오면 UID 기준으로 이어서 갱신된다.
+    """
+    try:
+        if file is not None:
+            EventImporter(job).run(file)
+        else:
+            with job.file.open('rb') as upload:
+                EventImporter(job).run(upload)
+    except Exception as e:
+        logger.exception('일정 가져오기 실패: import=%s', job.pk)
+        job.status = 'failed'
+        job.error = str(e)[:1000]
+        job.finished_at = timezone.now()
+        job.save(update_fields=['error', *PROGRESS_FIELDS])
+    finally:
+        if job.file:
+            # 처리한 업로드 파일은 보관하지 않음
+            job.file.delete(save=False)
+            EventImport.objects.filter(pk=job.pk).update(file='')
+
+
+def _run_in_background(job_id):
+    close_old_connections()
+    try:
+        run_import(EventImport.objects.select_related('calendar', 'created_by').get(pk=job_id))
+    finally:
+        close_old_connections()
+
+
+def start_import(job):
+    """트랜잭션 커밋 후 가져오기를 시작한다 (요청은 바로 응답)"""
+    def start():
+        if EVENT_IMPORT_IN_THREAD:
+            threading.Thread(target=_run_in_background, args=(job.pk,), daemon=True).start()
+        else:
+            run_import(job)
+
+    transaction.on_commit(start)
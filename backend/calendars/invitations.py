@@ -0,0 +1,239 @@
+"""
+캘린더 초대 생성 / 초대 이메일 발송
+초대 요청은 CalendarInvitation 행을 한 번에 저장하고 바로 응답하며,
+이메일은 커밋 후 백그라운드에서 발송한다. (CalendarInvitation.email_* 필드가 발송 대기열)
+
+- 발송할 행은 select_for_update(skip_locked)로 선점해 여러 작업자가 나눠 보낸다
+- 배치마다 SMTP 연결 하나를 열어 재사용한다
+- 템플릿은 (캘린더, 초대한 사람, 역할, 메시지) 묶음마다 한 번만 렌더링하고
+  초대 토큰 자리만 바꿔 끼운다
+- 실패하면 지수 백오프로 다시 예약하고, 최대 횟수를 넘으면 failed로 표시한다
+  (예약된 재시도는 `python manage.py send_invitation_emails`가 처리)
+"""
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import close_old_connections, transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from accounts.models import User
+from .models import CalendarInvitation, CalendarMember
+
+logger = logging.getLogger(__name__)
+
+# 한 요청에서 초대할 수 있는 최대 이메일 수
+INVITATION_MAX_EMAILS = getattr(settings, 'INVITATION_MAX_EMAILS', 1000)
+
+# 한 번에 선점해 같은 SMTP 연결로 보낼 이메일 수
+INVITATION_EMAIL_BATCH_SIZE = getattr(settings, 'INVITATION_EMAIL_BATCH_SIZE', 100)
+
+# 최대 발송 시도 횟수 / 첫 재시도 대기 시간(초, 시도마다 2배)
+INVITATION_EMAIL_MAX_ATTEMPTS = getattr(settings, 'INVITATION_EMAIL_MAX_ATTEMPTS', 5)
+INVITATION_EMAIL_RETRY_DELAY = getattr(settings, 'INVITATION_EMAIL_RETRY_DELAY', 60)
+
+# 선점한 행을 다른 작업자가 가져가지 않는 시간(초) (작업자가 중간에 죽으면 이후 다시 발송)
+INVITATION_EMAIL_CLAIM_SECONDS = getattr(settings, 'INVITATION_EMAIL_CLAIM_SECONDS', 60 * 10)
+
+# 커밋 후 별도 스레드에서 발송 (False면 같은 스레드에서 발송)
+INVITATION_EMAIL_IN_THREAD = getattr(settings, 'INVITATION_EMAIL_IN_THREAD', True)
+
+# 렌더링한 템플릿에서 초대마다 바꿔 끼울 토큰 자리
+TOKEN_PLACEHOLDER = '__invitation_token__'
+
+EMAIL_FIELDS = ['email_status', 'email_attempts', 'email_next_attempt_at', 'email_sent_at', 'email_error']
+
+
+def normalize_emails(emails):
+    """소문자로 맞추고 중복 제거 (순서 유지)"""
+    return list(dict.fromkeys(email.strip().lower() for email in emails))
+
+
+def create_invitations(calendar, inviter, emails, role='member', message=''):
+    """초대를 한 번에 저장한다. 반환값: (저장한 초대 목록, 오류 메시지 목록)
+
+    이미 멤버인 사용자와 아직 유효한 대기 중 초대는 건너뛰고,
+    만료/거절된 초대는 같은 행을 새 토큰으로 다시 사용한다.
+    """
+    emails = normalize_emails(emails)
+    now = timezone.now()
+    users = {user.email.lower(): user for user in User.objects.filter(email__in=emails)}
+    member_ids = set(
+        CalendarMember.objects.filter(calendar=calendar).values_list('user_id', flat=True)
+    ) | {calendar.owner_id}
+    existing = {
+        invitation.invitee_email.lower(): invitation
+        for invitation in CalendarInvitation.objects.filter(calendar=calendar, invitee_email__in=emails)
+    }
+
+    invitations, to_create, to_reset, errors = [], [], [], []
+    for email in emails:
+        user = users.get(email)
+        if user is not None and user.pk in member_ids:
+            errors.append(f'{email}: 이미 캘린더 멤버입니다.')
+            continue
+        invitation = existing.get(email)
+        if invitation is None:
+            invitation = CalendarInvitation(calendar=calendar, invitee_email=email)
+            to_create.append(invitation)
+        elif invitation.status == 'pending' and invitation.expires_at > now:
+            errors.append(f'{email}: 이미 초대한 이메일입니다.')
+            continue
+        else:
+            invitation.status = 'pending'
+            invitation.invitation_token = ''
+            invitation.expires_at = None
+            invitation.responded_at = None
+            to_reset.append(invitation)
+
+        invitation.inviter = inviter
+        invitation.invitee = user
+        invitation.role = role
+        invitation.message = message
+        invitation.email_status = 'pending'
+        invitation.email_attempts = 0
+        invitation.email_next_attempt_at = now
+        invitation.email_sent_at = None
+        invitation.email_error = ''
+        invitations.append(invitation.prepare())
+
+    with transaction.atomic():
+        CalendarInvitation.objects.bulk_create(to_create)
+        CalendarInvitation.objects.bulk_update(to_reset, [
+            'inviter', 'invitee', 'role', 'message', 'status', 'invitation_token',
+            'expires_at', 'responded_at', *EMAIL_FIELDS,
+        ])
+    return invitations, errors
+
+
+def build_messages(invitations, connection):
+    """(초대, 이메일) 목록. 템플릿은 같은 캘린더/초대한 사람/역할/메시지 묶음마다 한 번만 렌더링한다."""
+    rendered = {}
+    for invitation in invitations:
+        key = (invitation.calendar_id, invitation.inviter_id, invitation.role, invitation.message)
+        if key not in rendered:
+            inviter = invitation.inviter
+            html = render_to_string('calendars/invitation_email.html', {
+                'accept_url': f'{settings.FRONTEND_URL}/calendar/invitation/{TOKEN_PLACEHOLDER}',
+                'calendar': invitation.calendar,
+                'inviter': inviter,
+                'role': invitation.get_role_display(),
+                'message': invitation.message,
+            })
+            subject = f"{inviter.get_full_name() or inviter.email}님이 '{invitation.calendar.name}' 캘린더에 초대했습니다"
+            rendered[key] = (subject, html, strip_tags(html))
+
+        subject, html, text = rendered[key]
+        token = invitation.invitation_token
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=text.replace(TOKEN_PLACEHOLDER, token),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[invitation.invitee_email],
+            connection=connection,
+        )
+        email.attach_alternative(html.replace(TOKEN_PLACEHOLDER, token), 'text/html')
+        yield invitation, email
+
+
+def _mark_sent(invitation, now):
+    invitation.email_attempts += 1
+    invitation.email_status = 'sent'
+    invitation.email_sent_at = now
+    invitation.email_next_attempt_at = None
+    invitation.email_error = ''
+
+
+def _mark_failed(invitation, now, error):
+    invitation.email_attempts += 1
+    invitation.email_error = str(error)[:1000]
+    if invitation.email_attempts >= INVITATION_EMAIL_MAX_ATTEMPTS:
+        invitation.email_status = 'failed'
+        invitation.email_next_attempt_at = None
+    else:
+        delay = INVITATION_EMAIL_RETRY_DELAY * 2 ** (invitation.email_attempts - 1)
+        invitation.email_next_attempt_at = now + timedelta(seconds=delay)
+
+
+def send_invitation_emails(invitations):
+    """초대 이메일을 SMTP 연결 하나로 보내고 결과(성공/재시도 예약/실패)를 저장한다."""
+    invitations = list(invitations)
+    if not invitations:
+        return
+    now = timezone.now()
+    done = set()
+    try:
+        with get_connection() as connection:
+            for invitation, email in build_messages(invitations, connection):
+                try:
+                    email.send()
+                    _mark_sent(invitation, now)
+                except Exception as e:
+                    logger.warning('초대 이메일 발송 실패: invitation=%s (%s)', invitation.pk, e)
+                    _mark_failed(invitation, now, e)
+                done.add(invitation.pk)
+    except Exception as e:
+        # 연결/템플릿 오류: 아직 처리하지 못한 초대는 모두 재시도 예약
+        logger.exception('초대 이메일 배치 발송 실패')
+        for invitation in invitations:
+            if invitation.pk not in done:
+                _mark_failed(invitation, now, e)
+    CalendarInvitation.objects.bulk_update(invitations, EMAIL_FIELDS)
+
+
+def claim_due_invitations(limit=None, ids=None):
+    """발송할 초대를 선점한다. (다른 작업자가 선점한 행은 건너뜀)"""
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = CalendarInvitation.objects.select_for_update(skip_locked=True, of=('self',)).filter(
+            email_status='pending', email_next_attempt_at__lte=now
+        )
+        if ids is not None:
+            queryset = queryset.filter(pk__in=ids)
+        batch = list(
+            queryset.select_related('calendar', 'inviter')
+            .order_by('email_next_attempt_at')[:limit or INVITATION_EMAIL_BATCH_SIZE]
+        )
+        if batch:
+            CalendarInvitation.objects.filter(pk__in=[invitation.pk for invitation in batch]).update(
+                email_next_attempt_at=now + timedelta(seconds=INVITATION_EMAIL_CLAIM_SECONDS)
+            )
+    return batch
+
+
+def send_due_invitation_emails(ids=None, batch_size=None):
+    """발송할 때가 된 초대 이메일을 배치 단위로 모두 보낸다. 반환값: 처리한 초대 수"""
+    count = 0
+    while True:
+        batch = claim_due_invitations(batch_size, ids)
+        if not batch:
+            return count
+        send_invitation_emails(batch)
+        count += len(batch)
+
+
+def _send_in_background(ids):
+    close_old_connections()
+    try:
+        send_due_invitation_emails(ids)
+    finally:
+        close_old_connections()
+
+
+def queue_invitation_emails(invitations):
+    """트랜잭션 커밋 후 초대 이메일 발송을 시작한다 (요청은 바로 응답)"""
+    ids = [invitation.pk for invitation in invitations]
+    if not ids:
+        return
+
+    def start():
+        if INVITATION_EMAIL_IN_THREAD:
+            threading.Thread(target=_send_in_background, args=(ids,), daemon=True).start()
+        else:
+            send_due_invitation_emails(ids)
+
+    transaction.on_commit(start)
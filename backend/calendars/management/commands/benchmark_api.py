@@ -0,0 +1,237 @@
+"""
+주요 API 벤치마크 (seed 명령으로 만든 데이터 기준)
+
+캘린더 목록, 캘린더별 일정, 일정 목록(구간/페이지), 공유 링크 조회, 로그인을
+프로세스 안의 테스트 클라이언트로 반복 호출해 지연 시간 백분위수와 쿼리 수를 잰다.
+인증은 실제와 같이 JWT Bearer 헤더를 사용한다.
+결과를 JSON으로 저장해 두면 다른 커밋의 결과와 비교할 수 있다.
+
+    python manage.py seed --users 1000 --calendars 3000 --events 1000000
+    python manage.py benchmark_api --runs 100 --output bench/$(git rev-parse --short HEAD).json
+    python manage.py benchmark_api --compare bench/base.json
+
+- 첫 요청(first)은 따로 기록하고, --warmup 만큼 더 호출한 뒤 --runs 번 측정한다.
+- --clear-cache는 엔드포인트마다 측정 전에 캐시 전체를 비운다. (공용 Redis에서는 쓰지 말 것)
+"""
+import contextlib
+import io
+import json
+import statistics
+import subprocess
+import time
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.tokens import RefreshToken
+from calendars.models import Calendar, CalendarMember, Event
+from calendars.seed import SEED_PASSWORD, seed_users
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values, percent):
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    index = max(0, min(len(values) - 1, -(-len(values) * percent // 100) - 1))
+    return values[index]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = '주요 API의 지연 시간 백분위수와 쿼리 수를 측정하고 JSON으로 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=50, help='엔드포인트별 측정 횟수')
+        parser.add_argument('--warmup', type=int, default=5, help='측정 전 예열 호출 횟수')
+        parser.add_argument('--user', help='요청할 사용자 이메일 (기본: 캘린더가 가장 많은 시드 사용자)')
+        parser.add_argument('--password', default=SEED_PASSWORD, help='로그인 벤치마크에 쓸 비밀번호')
+        parser.add_argument('--window-days', type=int, default=35, help='일정 조회 구간 (일)')
+        parser.add_argument('--only', nargs='+', help='측정할 엔드포인트 이름만')
+        parser.add_argument('--clear-cache', action='store_true', help='엔드포인트마다 측정 전에 캐시를 비움')
+        parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+        parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일 경로')
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs는 1 이상이어야 합니다.')
+
+        user = self._target_user(options['user'])
+        endpoints = self._endpoints(user, options)
+        if options['only']:
+            unknown = set(options['only']) - set(endpoints)
+            if unknown:
+                raise CommandError(f"알 수 없는 엔드포인트: {', '.join(sorted(unknown))} (가능: {', '.join(endpoints)})")
+            endpoints = {name: endpoints[name] for name in options['only']}
+
+        self.stdout.write(f'대상 사용자: {user.email}')
+        results = {
+            'commit': git_commit(),
+            'created_at': timezone.now().isoformat(),
+            'vendor': connection.vendor,
+            'dataset': {
+                'users': seed_users().count(),
+                'calendars': Calendar.objects.count(),
+                'members': CalendarMember.objects.count(),
+                'events': Event.objects.count(),
+                'user_calendars': len(self._calendar_ids(user)),
+            },
+            'options': {name: options[name] for name in ('runs', 'warmup', 'window_days', 'clear_cache')},
+            'endpoints': {},
+        }
+        for name, request in endpoints.items():
+            if options['clear_cache']:
+                cache.clear()
+            results['endpoints'][name] = self._measure(request, options)
+            self._print(name, results['endpoints'][name])
+
+        if options['compare']:
+            self._compare(results, options['compare'])
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+    def _target_user(self, email):
+        if email:
+            user = User.objects.filter(email=email).first()
+            if user is None:
+                raise CommandError(f'사용자를 찾을 수 없습니다: {email}')
+            return user
+
+        busiest = (
+            CalendarMember.objects.filter(user__in=seed_users()).values('user_id')
+            .annotate(count=Count('pk')).order_by('-count').first()
+        )
+        user = seed_users().filter(pk=busiest['user_id']).first() if busiest else seed_users().first()
+        if user is None:
+            raise CommandError('시드 데이터가 없습니다. 먼저 `python manage.py seed`를 실행하세요.')
+        return user
+
+    def _calendar_ids(self, user):
+        owned = Calendar.objects.filter(owner=user).values_list('id', flat=True)
+        joined = CalendarMember.objects.filter(user=user).values_list('calendar_id', flat=True)
+        return set(owned) | set(joined)
+
+    def _endpoints(self, user, options):
+        """{이름: (method, path, data, 인증 여부)}"""
+        calendar_ids = self._calendar_ids(user)
+        busiest = (
+            Event.objects.filter(calendar_id__in=calendar_ids).order_by().values('calendar_id')
+            .annotate(count=Count('pk')).order_by('-count').first()
+        )
+        calendar_id = busiest['calendar_id'] if busiest else next(iter(calendar_ids))
+        shared = (
+            Calendar.objects.filter(share_token__isnull=False)
+            .annotate(event_total=Count('events')).order_by('-event_total').first()
+        )
+
+        start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=7)
+        window = urlencode({
+            'start_date': start.isoformat(),
+            'end_date': (start + timedelta(days=options['window_days'])).isoformat(),
+        })
+        endpoints = {
+            'calendars_list': ('get', '/api/calendars/', None, True),
+            'calendar_events': ('get', f'/api/calendars/{calendar_id}/events/?{window}', None, True),
+            'events_list_window': ('get', f'/api/events/?{window}', None, True),
+            'events_list_page': ('get', '/api/events/?limit=100', None, True),
+            'login': ('post', '/api/accounts/login/', {'email': user.email, 'password': options['password']}, False),
+        }
+        if shared:
+            endpoints['share_token'] = (
+                'get', f"/api/calendars/share/?{urlencode({'share_token': shared.share_token})}", None, False,
+            )
+        self.access_token = str(RefreshToken.for_user(user).access_token)
+        return endpoints
+
+    def _call(self, request):
+        method, path, data, authenticated = request
+        client = APIClient()
+        if authenticated:
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+        # 뷰의 print 출력이 결과를 가리지 않도록 버림
+        with CaptureQueriesContext(connection) as queries, contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            if method == 'get':
+                response = client.get(path)
+            else:
+                response = client.post(path, data, format='json')
+            elapsed = (time.perf_counter() - started) * 1000
+        return response.status_code, elapsed, len(queries)
+
+    def _measure(self, request, options):
+        _, first_ms, first_queries = self._call(request)
+        for _ in range(options['warmup']):
+            self._call(request)
+
+        timings, query_counts, statuses = [], [], set()
+        for _ in range(options['runs']):
+            status_code, elapsed, count = self._call(request)
+            timings.append(elapsed)
+            query_counts.append(count)
+            statuses.add(status_code)
+        timings.sort()
+
+        result = {
+            'method': request[0].upper(),
+            'path': request[1],
+            'status': sorted(statuses),
+            'first_ms': round(first_ms, 3),
+            'first_queries': first_queries,
+            'queries': statistics.median(query_counts),
+            'max_queries': max(query_counts),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'min_ms': round(timings[0], 3),
+            'max_ms': round(timings[-1], 3),
+        }
+        for percent in PERCENTILES:
+            result[f'p{percent}_ms'] = round(percentile(timings, percent), 3)
+        return result
+
+    def _print(self, name, result):
+        line = (
+            f"{name:<20} status={','.join(map(str, result['status']))} "
+            f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+            f"queries={result['queries']:g} (first {result['first_queries']}, {result['first_ms']:.2f}ms)"
+        )
+        if any(code >= 400 for code in result['status']):
+            self.stdout.write(self.style.WARNING(line))
+        else:
+            self.stdout.write(line)
+
+    def _compare(self, results, path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'비교할 결과를 읽을 수 없습니다: {e}')
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== 비교: {baseline.get('commit') or path} =="))
+        for name, result in results['endpoints'].items():
+            before = baseline.get('endpoints', {}).get(name)
+            if not before:
+                self.stdout.write(f'{name:<20} (이전 결과 없음)')
+                continue
+            changes = []
+            for key in ('p50_ms', 'p95_ms'):
+                delta = (result[key] - before[key]) / before[key] * 100 if before[key] else 0
+                changes.append(f"{key[:-3]} {before[key]:.2f} -> {result[key]:.2f}ms ({delta:+.1f}%)")
+            changes.append(f"queries {before['queries']:g} -> {result['queries']:g}")
+            self.stdout.write(f"{name:<20} {', '.join(changes)}")
@@ -0,0 +1,153 @@
+"""
+일정 가시성 쿼리 벤치마크
+
+기존 조인 + DISTINCT 쿼리, semi-join(IN 서브쿼리) 쿼리,
+API가 실제로 쓰는 캐시된 캘린더 ID 목록(IN 리스트) 쿼리의
+실행 계획과 지연 시간을 비교한다. 시드 데이터는 트랜잭션 안에서 만들고
+측정이 끝나면 롤백하므로 DB에 남지 않는다.
+
+    python manage.py benchmark_event_visibility --events 100000
+"""
+import json
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from accounts.models import User
+from calendars.models import Calendar, CalendarMember, Event
+from calendars.permissions import CalendarPermissions, load_roles_from_db
+
+
+class Rollback(Exception):
+    """시드 데이터를 되돌리기 위한 예외"""
+
+
+class Command(BaseCommand):
+    help = '일정 가시성 쿼리(DISTINCT 조인 vs semi-join vs ID 목록)의 실행 계획과 지연 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=100000, help='시드할 일정 수')
+        parser.add_argument('--calendars', type=int, default=200, help='시드할 캘린더 수')
+        parser.add_argument('--members', type=int, default=20, help='공유 캘린더당 멤버 수')
+        parser.add_argument('--runs', type=int, default=20, help='쿼리별 반복 측정 횟수')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+
+    def handle(self, *args, **options):
+        random.seed(options['seed'])
+        try:
+            with transaction.atomic():
+                user = self._seed(options)
+                results = {
+                    'vendor': connection.vendor,
+                    'events': options['events'],
+                    'calendars': options['calendars'],
+                    'queries': {
+                        name: self._measure(queryset, options['runs'])
+                        for name, queryset in self._querysets(user).items()
+                    },
+                }
+                raise Rollback
+        except Rollback:
+            pass
+
+        for name, result in results['queries'].items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f'== {name} =='))
+            self.stdout.write(result['plan'])
+            self.stdout.write(
+                f"rows={result['rows']} "
+                f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms "
+                f"min={result['min_ms']:.2f}ms"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+    def _querysets(self, user):
+        # 요청 처리와 같은 경로로 ID 목록을 만들되, 롤백될 시드 데이터가
+        # 역할 캐시에 남지 않도록 캐시를 거치지 않고 DB에서 읽는다
+        permissions = CalendarPermissions(user)
+        permissions._roles = load_roles_from_db(user)
+        return {
+            'legacy_join_distinct': Event.objects.filter(
+                calendar__in=Calendar.objects.filter(
+                    models.Q(owner=user) |
+                    models.Q(members__user=user)
+                )
+            ).distinct(),
+            'semi_join': Event.objects.visible_to(user),
+            'cached_id_list': permissions.filter_visible(Event.objects.all(), 'calendar_id'),
+        }
+
+    def _measure(self, queryset, runs):
+        queryset = queryset.values_list('id', flat=True)
+        if connection.vendor == 'postgresql':
+            plan = queryset.explain(analyze=True, buffers=True)
+        else:
+            plan = queryset.explain()
+
+        timings = []
+        rows = 0
+        for _ in range(runs):
+            started = time.perf_counter()
+            rows = len(list(queryset.all()))  # 결과 캐시를 쓰지 않도록 매번 새 queryset
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+
+        return {
+            'plan': plan,
+            'rows': rows,
+            'min_ms': timings[0],
+            'p50_ms': statistics.median(timings),
+            'p95_ms': timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        }
+
+    def _seed(self, options):
+        """대상 사용자 1명이 일부 캘린더를 소유하고 여러 공유 캘린더에 참여하는 데이터"""
+        self.stdout.write('시드 데이터 생성 중...')
+        users = User.objects.bulk_create([
+            User(email=f'bench{index}@planpie.bench', username=f'bench_{index}')
+            for index in range(options['members'] + 1)
+        ])
+        user, others = users[0], users[1:]
+
+        calendars = Calendar.objects.bulk_create([
+            Calendar(
+                name=f'벤치 캘린더 {index}',
+                owner=user if index % 10 == 0 else random.choice(others),
+                calendar_type='shared',
+                share_token=f'bench-{index}',
+            )
+            for index in range(options['calendars'])
+        ])
+
+        # 대상 사용자는 절반의 캘린더에 참여, 나머지 사용자는 모든 공유 캘린더에 참여
+        memberships = []
+        for index, calendar in enumerate(calendars):
+            for member in users:
+                if member.pk == calendar.owner_id:
+                    continue
+                if member is user and index % 2:
+                    continue
+                memberships.append(CalendarMember(calendar=calendar, user=member))
+        CalendarMember.objects.bulk_create(memberships, batch_size=5000)
+
+        now = timezone.now()
+        events = []
+        for index in range(options['events']):
+            start = now + timedelta(hours=random.randint(-24 * 365 * 3, 24 * 365))
+            events.append(Event(
+                calendar=random.choice(calendars),
+                title=f'일정 {index}',
+                start_date=start,
+                end_date=start + timedelta(hours=1),
+            ))
+        Event.objects.bulk_create(events, batch_size=5000)
+        return user
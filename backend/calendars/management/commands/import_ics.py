@@ -0,0 +1,76 @@
+"""
+iCalendar(.ics) 파일을 캘린더로 가져오기
+
+    python manage.py import_ics <calendar_id> <path> [--user owner@example.com]
+    python manage.py import_ics --pending     # 업로드 후 처리되지 않은 작업 실행
+    python manage.py import_ics --fail-stale  # 프로세스가 죽어 멈춘 running 작업을 실패로 표시
+
+같은 파일을 다시 가져오면 UID가 같은 일정은 새로 만들지 않고 갱신한다.
+"""
+import os
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import User
+from calendars.imports import fail_stale_imports, run_import
+from calendars.models import Calendar, EventImport
+
+
+class Command(BaseCommand):
+    help = 'iCalendar(.ics) 파일의 일정을 캘린더로 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('calendar_id', nargs='?', help='가져올 캘린더 ID')
+        parser.add_argument('path', nargs='?', help='.ics 파일 경로')
+        parser.add_argument('--user', help='일정 생성자 이메일 (기본: 캘린더 소유자)')
+        parser.add_argument('--pending', action='store_true', help='대기 중인 업로드 작업을 처리합니다.')
+        parser.add_argument('--fail-stale', action='store_true', help='진행이 멈춘 작업을 실패로 표시합니다.')
+
+    def handle(self, *args, **options):
+        if options['fail_stale']:
+            count = fail_stale_imports()
+            self.stdout.write(self.style.SUCCESS(f'멈춘 작업 {count}건을 실패로 표시했습니다.'))
+            return
+
+        if options['pending']:
+            jobs = EventImport.objects.filter(status='pending').select_related('calendar', 'created_by')
+            for job in jobs.order_by('created_at'):
+                run_import(job)
+                self.report(job)
+            return
+
+        if not options['calendar_id'] or not options['path']:
+            raise CommandError('calendar_id와 path가 필요합니다. (또는 --pending)')
+        try:
+            calendar = Calendar.objects.get(pk=options['calendar_id'])
+        except (Calendar.DoesNotExist, ValidationError) as e:
+            raise CommandError(f'캘린더를 찾을 수 없습니다: {options["calendar_id"]}') from e
+        user = calendar.owner
+        if options['user']:
+            user = User.objects.filter(email=options['user']).first()
+            if user is None:
+                raise CommandError(f'사용자를 찾을 수 없습니다: {options["user"]}')
+
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'파일이 없습니다: {path}')
+        job = EventImport.objects.create(
+            calendar=calendar,
+            created_by=user,
+            file_name=os.path.basename(path)[:255],
+            size=os.path.getsize(path),
+        )
+        with open(path, 'rb') as file:
+            run_import(job, file)
+        self.report(job)
+
+    def report(self, job):
+        message = (
+            f'{job.file_name}: 생성 {job.created_count}건, 갱신 {job.updated_count}건, '
+            f'건너뜀 {job.skipped_count}건'
+        )
+        if job.status == 'failed':
+            self.stderr.write(self.style.ERROR(f'{message} (실패: {job.error})'))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
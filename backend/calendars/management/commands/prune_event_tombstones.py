@@ -0,0 +1,21 @@
+"""
+보관 기간이 지난 일정 삭제 기록 정리
+
+    python manage.py prune_event_tombstones
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from calendars.models import EventTombstone
+from calendars.sync import TOMBSTONE_RETENTION_DAYS
+
+
+class Command(BaseCommand):
+    help = f'{TOMBSTONE_RETENTION_DAYS}일이 지난 일정 삭제 기록(EventTombstone)을 삭제합니다.'
+
+    def handle(self, *args, **options):
+        threshold = timezone.now() - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        deleted, _ = EventTombstone.objects.filter(deleted_at__lt=threshold).delete()
+        self.stdout.write(self.style.SUCCESS(f'삭제 기록 {deleted}건을 정리했습니다.'))
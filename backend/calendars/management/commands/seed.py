@@ -0,0 +1,58 @@
+"""
+벤치마크/부하 테스트용 시드 데이터 생성 (calendars/seed.py)
+
+    python manage.py seed --users 1000 --calendars 3000 --events 1000000
+    python manage.py seed --clear   # 시드 데이터만 삭제
+
+사용자마다 개인 캘린더 1개가 생기고 나머지(--calendars - --users)는 공유 캘린더가 된다.
+이미 시드 데이터가 있으면 이어서 추가한다.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from calendars.seed import SEED_EMAIL_DOMAIN, SEED_PASSWORD, clear_seed_data, seed_dataset
+
+
+class Command(BaseCommand):
+    help = '사용자/캘린더/멤버/태그/일정 시드 데이터를 생성합니다. (일정 수는 캘린더별로 치우치게 분배)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100, help='사용자 수')
+        parser.add_argument('--calendars', type=int, default=200, help='캘린더 수 (개인 캘린더 포함)')
+        parser.add_argument('--events', type=int, default=10000, help='일정 수')
+        parser.add_argument('--members', type=int, default=5, help='공유 캘린더당 멤버 수')
+        parser.add_argument('--tags', type=int, default=5, help='캘린더당 태그 수')
+        parser.add_argument('--recurring', type=float, default=0.05, help='반복 일정 비율 (0~1)')
+        parser.add_argument('--skew', type=float, default=1.1, help='캘린더별 일정 분포 치우침 (Zipf 지수, 0이면 균등)')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create 배치 크기')
+        parser.add_argument('--password', default=SEED_PASSWORD, help='시드 사용자 비밀번호')
+        parser.add_argument('--clear', action='store_true', help='시드 데이터(사용자와 그 캘린더/일정)만 삭제')
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 or options['events'] < 0 or options['batch_size'] < 1:
+            raise CommandError('--users, --batch-size는 1 이상, --events는 0 이상이어야 합니다.')
+        if not 0 <= options['recurring'] <= 1:
+            raise CommandError('--recurring은 0~1 사이여야 합니다.')
+
+        if options['clear']:
+            count = clear_seed_data()
+            self.stdout.write(self.style.SUCCESS(f'시드 사용자 {count}명과 관련 데이터를 삭제했습니다.'))
+            return
+
+        counts = seed_dataset(
+            users=options['users'],
+            calendars=options['calendars'],
+            events=options['events'],
+            members=options['members'],
+            tags=options['tags'],
+            recurring=options['recurring'],
+            skew=options['skew'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            password=options['password'],
+            log=lambda message: self.stdout.write(message) if options['verbosity'] > 1 else None,
+        )
+        summary = ', '.join(f'{name} {count}' for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(
+            f"시드 데이터 생성 완료: {summary} (로그인: seed<번호>@{SEED_EMAIL_DOMAIN} / {options['password']})"
+        ))
@@ -0,0 +1,25 @@
+"""
+발송 대기 중인 초대 이메일 발송 (재시도 예약 포함)
+
+    python manage.py send_invitation_emails [--batch-size 100]
+
+초대 요청 직후의 발송은 백그라운드 스레드가 처리하고, 실패 후 다시 예약된
+이메일은 이 명령을 주기적으로(cron 등) 실행해 보낸다.
+"""
+from django.core.management.base import BaseCommand
+
+from calendars.invitations import INVITATION_EMAIL_BATCH_SIZE, send_due_invitation_emails
+
+
+class Command(BaseCommand):
+    help = '발송할 때가 된 캘린더 초대 이메일을 보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=INVITATION_EMAIL_BATCH_SIZE,
+            help='SMTP 연결 하나로 보낼 이메일 수',
+        )
+
+    def handle(self, *args, **options):
+        count = send_due_invitation_emails(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'초대 이메일 {count}건을 처리했습니다.'))
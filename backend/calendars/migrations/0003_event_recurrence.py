@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0002_remove_event_color_calendartag_event_tag_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_end',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='반복 종료 시간'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_exdates',
+            field=models.JSONField(blank=True, default=list, verbose_name='반복 제외 일시'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_id',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='원래 발생 시간'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='overrides', to='calendars.event', verbose_name='반복 원본 일정'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_rule',
+            field=models.CharField(blank=True, help_text='RRULE 형식 (예: FREQ=WEEKLY;BYDAY=MO;COUNT=10)', max_length=500, verbose_name='반복 규칙'),
+        ),
+        migrations.AddConstraint(
+            model_name='event',
+            constraint=models.UniqueConstraint(condition=models.Q(('recurrence_parent__isnull', False)), fields=('recurrence_parent', 'recurrence_id'), name='unique_event_override'),
+        ),
+    ]
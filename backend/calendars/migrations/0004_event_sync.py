@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0003_event_recurrence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventTombstone',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('event_id', models.UUIDField(verbose_name='일정 ID')),
+                ('calendar_id', models.UUIDField(verbose_name='캘린더 ID')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='삭제일')),
+            ],
+            options={
+                'verbose_name': '삭제된 일정',
+                'verbose_name_plural': '삭제된 일정',
+                'db_table': 'event_tombstones',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['calendar', 'updated_at'], name='events_calenda_e6ad49_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventtombstone',
+            index=models.Index(fields=['calendar_id', 'deleted_at'], name='event_tombs_calenda_ce4f55_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0004_event_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarmember',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+    ]
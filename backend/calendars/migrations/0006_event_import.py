@@ -0,0 +1,59 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:54
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0005_calendarmember_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventImport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file', models.FileField(blank=True, upload_to='imports/', verbose_name='파일')),
+                ('file_name', models.CharField(blank=True, max_length=255, verbose_name='파일 이름')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '진행 중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('size', models.PositiveBigIntegerField(default=0, verbose_name='파일 크기')),
+                ('bytes_read', models.PositiveBigIntegerField(default=0, verbose_name='처리한 크기')),
+                ('created_count', models.PositiveIntegerField(default=0, verbose_name='생성된 일정 수')),
+                ('updated_count', models.PositiveIntegerField(default=0, verbose_name='갱신된 일정 수')),
+                ('skipped_count', models.PositiveIntegerField(default=0, verbose_name='건너뛴 일정 수')),
+                ('error', models.TextField(blank=True, verbose_name='오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='요청일')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='완료일')),
+            ],
+            options={
+                'verbose_name': '일정 가져오기',
+                'verbose_name_plural': '일정 가져오기',
+                'db_table': 'event_imports',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='ical_uid',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='iCalendar UID'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['calendar', 'ical_uid'], name='events_calenda_0eaa98_idx'),
+        ),
+        migrations.AddField(
+            model_name='eventimport',
+            name='calendar',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='imports', to='calendars.calendar', verbose_name='캘린더'),
+        ),
+        migrations.AddField(
+            model_name='eventimport',
+            name='created_by',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='event_imports', to=settings.AUTH_USER_MODEL, verbose_name='요청자'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+"""
+일정 전문 검색용 tsvector 컬럼 / 트리거 / GIN 인덱스 (PostgreSQL 전용)
+컬럼은 모델 필드가 아니므로 다른 DB에서는 아무것도 하지 않는다. (calendars/search.py 참고)
+"""
+from django.db import migrations
+
+# 제목 A, 장소 B, 메모 C 가중치 / 한국어용 simple + 영어용 english 설정 ({row}: NEW 또는 events)
+SEARCH_VECTOR_SQL = ' || '.join(
+    f"setweight(to_tsvector('{config}', coalesce({{row}}.{field}, '')), '{weight}')"
+    for field, weight in (('title', 'A'), ('location', 'B'), ('description', 'C'))
+    for config in ('simple', 'english')
+)
+
+CREATE_SQL = f"""
+ALTER TABLE events ADD COLUMN search_vector tsvector;
+
+CREATE FUNCTION events_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER events_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, location, description ON events
+    FOR EACH ROW EXECUTE FUNCTION events_search_vector_update();
+
+UPDATE events SET search_vector = {SEARCH_VECTOR_SQL.format(row='events')};
+
+CREATE INDEX events_search_vector_gin ON events USING gin (search_vector);
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS events_search_vector_trigger ON events;
+DROP FUNCTION IF EXISTS events_search_vector_update();
+ALTER TABLE events DROP COLUMN IF EXISTS search_vector;
+"""
+
+
+def create_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_SQL)
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0006_event_import'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
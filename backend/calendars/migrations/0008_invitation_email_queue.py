@@ -0,0 +1,51 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_existing_sent(apps, schema_editor):
+    CalendarInvitation = apps.get_model('calendars', 'CalendarInvitation')
+    CalendarInvitation.objects.update(email_status='sent')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0007_event_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarinvitation',
+            name='email_attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='이메일 발송 시도 횟수'),
+        ),
+        migrations.AddField(
+            model_name='calendarinvitation',
+            name='email_error',
+            field=models.TextField(blank=True, verbose_name='이메일 발송 오류'),
+        ),
+        migrations.AddField(
+            model_name='calendarinvitation',
+            name='email_next_attempt_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='다음 발송 시도'),
+        ),
+        migrations.AddField(
+            model_name='calendarinvitation',
+            name='email_sent_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='이메일 발송일'),
+        ),
+        migrations.AddField(
+            model_name='calendarinvitation',
+            name='email_status',
+            field=models.CharField(choices=[('pending', '발송 대기'), ('sent', '발송 완료'), ('failed', '발송 실패')], default='pending', max_length=10, verbose_name='이메일 발송 상태'),
+        ),
+        # 기존 초대는 요청 중에 이미 발송되었으므로 sent로 표시
+        migrations.RunPython(mark_existing_sent, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='calendarinvitation',
+            index=models.Index(fields=['email_status', 'email_next_attempt_at'], name='calendar_in_email_s_de2906_idx'),
+        ),
+    ]
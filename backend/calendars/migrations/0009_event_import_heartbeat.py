@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0008_invitation_email_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventimport',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='마지막 진행 시각'),
+        ),
+    ]
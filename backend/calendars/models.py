@@ -1,11 +1,16 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from datetime import timedelta
 import uuid
 import secrets
 
+from .recurrence import get_recurrence_end
+
+# 일정 하나(반복 일정은 발생 하나)의 최대 길이
+# 구간 조회가 start_date 하한으로 사용하므로 저장 시 검사한다
+MAX_EVENT_DURATION = timedelta(days=getattr(settings, 'EVENT_MAX_DURATION_DAYS', 366))
+
 # 기본 태그 색상 (10개)
 DEFAULT_TAG_COLORS = [
     '#2D4059',  # 차콜 블랙
@@ -34,6 +39,55 @@ DEFAULT_TAG_NAMES = [
     'Cool Gray',
 ]
 
+def visible_calendar_ids(user):
+    """사용자가 소유하거나 참여 중인 캘린더 ID 서브쿼리 (소유 UNION 참여)
+
+    IN 서브쿼리 하나로 쓰면 OR로 묶인 두 IN 조건과 달리
+    플래너가 한 번의 semi-join(해시/인덱스)으로 처리할 수 있다.
+    """
+    owned = Calendar.objects.filter(owner=user).order_by().values('id')
+    joined = CalendarMember.objects.filter(user=user).order_by().values('calendar_id')
+    return owned.union(joined)
+
+
+class CalendarQuerySet(models.QuerySet):
+    """캘린더 QuerySet"""
+
+    def visible_to(self, user):
+        """소유하거나 참여 중인 캘린더
+
+        소유/참여 캘린더 ID를 하나의 IN 서브쿼리(semi-join)로 확인하므로
+        members 조인으로 행이 중복되지 않고 DISTINCT가 필요 없다.
+        """
+        return self.filter(id__in=visible_calendar_ids(user))
+
+    def with_details(self):
+        """CalendarSerializer가 추가 쿼리 없이 직렬화할 수 있도록 미리 로드한다.
+
+        멤버/일정 수는 서브쿼리로 annotate하고(조인으로 행이 늘어나지 않도록),
+        소유자는 select_related, 멤버(+사용자)와 태그는 prefetch한다.
+        """
+        def count_subquery(model):
+            return Coalesce(
+                models.Subquery(
+                    model.objects.filter(calendar=models.OuterRef('pk'))
+                    .order_by()
+                    .values('calendar')
+                    .annotate(count=models.Count('pk'))
+                    .values('count')[:1]
+                ),
+                0,
+            )
+
+        return self.select_related('owner').annotate(
+            member_count_value=count_subquery(CalendarMember),
+            event_count_value=count_subquery(Event),
+        ).prefetch_related(
+            models.Prefetch('members', queryset=CalendarMember.objects.select_related('user')),
+            'tags',
+        )
+
+
 # 기본 캘린더 캘린더를 생성한다
 class Calendar(models.Model):
     """캘린더 (공유 가능)"""
@@ -79,6 +133,8 @@ class Calendar(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
 
+    objects = CalendarQuerySet.as_manager()
+
     class Meta:
         verbose_name = '캘린더'
         verbose_name_plural = '캘린더'
@@ -97,47 +153,39 @@ class Calendar(models.Model):
         from django.urls import reverse
         return f"{settings.FRONTEND_URL}/calendar/join/{self.share_token}"
 
-    def is_admin(self, user):
+    def get_role(self, user, permissions=None):
+        """사용자의 역할 ('owner' / 'admin' / 'member' / None)
 
-        # ✅ 익명 사용자는 항상 False
+        permissions(CalendarPermissions)가 주어지면 요청 단위로 로드된
+        역할 맵에서 찾고, 없으면 calendar_members를 조회한다.
+        """
+        # ✅ 익명 사용자는 역할 없음
         if not getattr(user, 'is_authenticated', False):
-            return False
+            return None
+
+        if permissions is not None and permissions.user is user:
+            return permissions.get_role(self.pk)
 
-        """사용자가 관리자인지 확인"""
         # 소유자는 항상 관리자
-        if self.owner == user:
-            return True
-        
-        # 공유된 사용자 중 관리자 권한 확인
-        member = self.members.filter(user=user).first()
-        return member and member.role == 'admin'
-    
-    def can_delete(self, user):
-        if not getattr(user, 'is_authenticated', False):
-            return False
+        if self.owner_id == user.pk:
+            return 'owner'
+        return self.members.filter(user=user).values_list('role', flat=True).first()
 
+    def is_admin(self, user, permissions=None):
+        """사용자가 관리자인지 확인 (소유자 포함)"""
+        return self.get_role(user, permissions) in ('owner', 'admin')
+    
+    def can_delete(self, user, permissions=None):
         """캘린더 삭제 권한 확인 (관리자만)"""
-        return self.is_admin(user)
+        return self.is_admin(user, permissions)
     
-    def can_edit_event(self, user):
+    def can_edit_event(self, user, permissions=None):
         """일정 수정 권한 확인 (모든 멤버)"""
-
-        if not getattr(user, 'is_authenticated', False):
-            return False
-
-        # 소유자
-        if self.owner == user:
-            return True
-        
-        # 캘린더 멤버인지 확인
-        return self.members.filter(user=user).exists()
+        return self.get_role(user, permissions) is not None
     
-    def can_leave(self, user):
-        if not getattr(user, 'is_authenticated', False):
-            return False
-            
+    def can_leave(self, user, permissions=None):
         """캘린더 나가기 가능 여부 (소유자는 불가)"""
-        return self.owner != user and self.members.filter(user=user).exists()
+        return self.get_role(user, permissions) in ('admin', 'member')
 
 class CalendarTag(models.Model):
     """캘린더별 태그 (참여자 및 이벤트 구분용)"""
@@ -192,6 +240,7 @@ class CalendarMember(models.Model):
         verbose_name='역할'
     )
     joined_at = models.DateTimeField(auto_now_add=True, verbose_name='참여일')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
 
     class Meta:
         verbose_name = '캘린더 멤버'
@@ -250,6 +299,20 @@ class CalendarInvitation(models.Model):
         verbose_name='초대 토큰'
     )
     message = models.TextField(blank=True, verbose_name='초대 메시지')
+
+    # 초대 이메일 발송 상태 (calendars/invitations.py에서 백그라운드로 발송)
+    EMAIL_STATUS_CHOICES = [
+        ('pending', '발송 대기'),
+        ('sent', '발송 완료'),
+        ('failed', '발송 실패'),
+    ]
+    email_status = models.CharField(
+        max_length=10, choices=EMAIL_STATUS_CHOICES, default='pending', verbose_name='이메일 발송 상태'
+    )
+    email_attempts = models.PositiveSmallIntegerField(default=0, verbose_name='이메일 발송 시도 횟수')
+    email_next_attempt_at = models.DateTimeField(null=True, blank=True, verbose_name='다음 발송 시도')
+    email_sent_at = models.DateTimeField(null=True, blank=True, verbose_name='이메일 발송일')
+    email_error = models.TextField(blank=True, verbose_name='이메일 발송 오류')
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='초대일')
     responded_at = models.DateTimeField(null=True, blank=True, verbose_name='응답일')
@@ -260,39 +323,37 @@ class CalendarInvitation(models.Model):
         verbose_name_plural = '캘린더 초대'
         db_table = 'calendar_invitations'
         unique_together = ('calendar', 'invitee_email')
+        indexes = [
+            # 발송 대기열 조회
+            models.Index(fields=['email_status', 'email_next_attempt_at']),
+        ]
 
-    def save(self, *args, **kwargs):
+    def prepare(self):
+        """토큰/만료일 설정 (bulk_create는 save()를 거치지 않으므로 직접 호출)"""
         if not self.invitation_token:
             self.invitation_token = secrets.token_urlsafe(32)
         if not self.expires_at:
             from django.utils import timezone
             from datetime import timedelta
             self.expires_at = timezone.now() + timedelta(days=7)
+        return self
+
+    def save(self, *args, **kwargs):
+        self.prepare()
         super().save(*args, **kwargs)
 
     def send_invitation_email(self):
-        """초대 이메일 발송"""
-        subject = f"{self.inviter.get_full_name() or self.inviter.email}님이 '{self.calendar.name}' 캘린더에 초대했습니다"
-        
-        context = {
-            'invitation': self,
-            'accept_url': f"{settings.FRONTEND_URL}/calendar/invitation/{self.invitation_token}",
-            'calendar': self.calendar,
-            'inviter': self.inviter,
-            'role': self.get_role_display(),
-        }
-        
-        html_message = render_to_string('calendars/invitation_email.html', context)
-        plain_message = strip_tags(html_message)
-        
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[self.invitee_email],
-            html_message=html_message,
-            fail_silently=False,
-        )
+        """초대 이메일 즉시 발송 (여러 명은 invitations.send_invitation_emails 사용)"""
+        from .invitations import send_invitation_emails
+        send_invitation_emails([self])
+
+class EventQuerySet(models.QuerySet):
+    """일정 QuerySet"""
+
+    def visible_to(self, user):
+        """접근 가능한 캘린더의 일정 (중복 없음, DISTINCT 불필요)"""
+        return self.filter(calendar_id__in=visible_calendar_ids(user))
+
 
 class Event(models.Model):
     """일정/이벤트"""
@@ -323,6 +384,34 @@ class Event(models.Model):
     start_date = models.DateTimeField(verbose_name='시작 시간')
     end_date = models.DateTimeField(verbose_name='종료 시간')
     all_day = models.BooleanField(default=False, verbose_name='종일 일정')
+
+    # 반복 정보 (RFC 5545) - 시리즈 원본 한 건만 저장하고 발생은 조회 시 계산
+    recurrence_rule = models.CharField(
+        max_length=500,
+        blank=True,
+        verbose_name='반복 규칙',
+        help_text='RRULE 형식 (예: FREQ=WEEKLY;BYDAY=MO;COUNT=10)'
+    )
+    recurrence_exdates = models.JSONField(default=list, blank=True, verbose_name='반복 제외 일시')
+    recurrence_end = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='반복 종료 시간'
+    )
+    # 개별 수정된 발생: 원본 시리즈와 원래 발생 시작 시간
+    recurrence_parent = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='overrides',
+        verbose_name='반복 원본 일정'
+    )
+    recurrence_id = models.DateTimeField(null=True, blank=True, verbose_name='원래 발생 시간')
+
+    # iCalendar 가져오기로 생성된 일정의 UID (다시 가져올 때 중복 방지)
+    ical_uid = models.CharField(max_length=255, blank=True, default='', verbose_name='iCalendar UID')
     
     # 메타 정보
     created_by = models.ForeignKey(
@@ -335,6 +424,8 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         verbose_name = '일정'
         verbose_name_plural = '일정'
@@ -343,25 +434,159 @@ class Event(models.Model):
         indexes = [
             models.Index(fields=['calendar', 'start_date']),
             models.Index(fields=['calendar', 'tag']),
+            models.Index(fields=['calendar', 'updated_at']),
+            models.Index(fields=['calendar', 'ical_uid']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['recurrence_parent', 'recurrence_id'],
+                condition=models.Q(recurrence_parent__isnull=False),
+                name='unique_event_override',
+            ),
         ]
 
     def __str__(self):
         tag_info = f" [{self.tag.name}]" if self.tag else ""
         return f"{self.title}{tag_info} ({self.start_date.strftime('%Y-%m-%d')})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 다른 캘린더로 옮겨졌는지 저장 시그널에서 알 수 있도록 불러온 시점의 캘린더를 기억
+        instance._loaded_calendar_id = instance.__dict__.get('calendar_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        self.check_duration()
+        self.update_recurrence_end()
+        super().save(*args, **kwargs)
+        self._loaded_calendar_id = self.calendar_id
+
+    @property
+    def previous_calendar_id(self):
+        """이번 저장으로 다른 캘린더에서 옮겨졌다면 원래 캘린더 ID (아니면 None)"""
+        loaded = getattr(self, '_loaded_calendar_id', None)
+        return loaded if loaded is not None and loaded != self.calendar_id else None
+
+    def check_duration(self):
+        """일정 길이가 MAX_EVENT_DURATION을 넘으면 ValueError
+        (save()를 거치지 않는 가져오기 저장 전에도 호출한다)
+        """
+        if self.end_date - self.start_date > MAX_EVENT_DURATION:
+            raise ValueError(f'일정 길이는 최대 {MAX_EVENT_DURATION.days}일까지 가능합니다.')
+
+    def update_recurrence_end(self):
+        """반복 일정은 마지막 발생 종료 시간을 저장해 구간 조회에 사용
+        (save()를 거치지 않는 bulk_create/bulk_update 전에도 호출한다)
+        """
+        if self.recurrence_rule:
+            self.recurrence_end = get_recurrence_end(
+                self.recurrence_rule, self.start_date, self.end_date
+            )
+        else:
+            self.recurrence_end = None
+
+    @property
+    def is_recurring(self):
+        return bool(self.recurrence_rule)
+
     @property
     def color(self):
         """이벤트 색상 (태그 색상 사용)"""
         return self.tag.color if self.tag else '#95A5A6'
     
-    def can_edit(self, user):
+    def can_edit(self, user, permissions=None):
         """사용자가 이 일정을 수정할 수 있는지 확인"""
         # 캘린더의 모든 멤버는 일정 수정 가능
-        return self.calendar.can_edit_event(user)
+        return self.calendar.can_edit_event(user, permissions)
 
-    def can_delete(self, user):
+    def can_delete(self, user, permissions=None):
         """사용자가 이 일정을 삭제할 수 있는지 확인"""
+        if not getattr(user, 'is_authenticated', False):
+            return False
         # 일정 생성자 또는 캘린더 관리자만 삭제 가능
-        if self.created_by == user:
+        if self.created_by_id == user.pk:
             return True
-        return self.calendar.is_admin(user)
\ No newline at end of file
+        return self.calendar.is_admin(user, permissions)
+
+
+class EventTombstone(models.Model):
+    """삭제된 일정 기록 (증분 동기화용)
+
+    캘린더가 삭제되어도 기록이 남을 수 있도록 FK 대신 ID만 저장한다.
+    """
+    id = models.BigAutoField(primary_key=True)
+    event_id = models.UUIDField(verbose_name='일정 ID')
+    calendar_id = models.UUIDField(verbose_name='캘린더 ID')
+    deleted_at = models.DateTimeField(auto_now_add=True, verbose_name='삭제일')
+
+    class Meta:
+        verbose_name = '삭제된 일정'
+        verbose_name_plural = '삭제된 일정'
+        db_table = 'event_tombstones'
+        indexes = [
+            models.Index(fields=['calendar_id', 'deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} ({self.deleted_at.strftime('%Y-%m-%d %H:%M')})"
+
+
+class EventImport(models.Model):
+    """iCalendar 가져오기 작업
+
+    업로드한 파일을 백그라운드에서 청크 단위로 처리하며,
+    클라이언트는 이 레코드로 진행 상황을 조회한다.
+    """
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('running', '진행 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    calendar = models.ForeignKey(
+        Calendar,
+        on_delete=models.CASCADE,
+        related_name='imports',
+        verbose_name='캘린더'
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='event_imports',
+        verbose_name='요청자'
+    )
+    file = models.FileField(upload_to='imports/', blank=True, verbose_name='파일')
+    file_name = models.CharField(max_length=255, blank=True, verbose_name='파일 이름')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending', verbose_name='상태')
+    size = models.PositiveBigIntegerField(default=0, verbose_name='파일 크기')
+    bytes_read = models.PositiveBigIntegerField(default=0, verbose_name='처리한 크기')
+    created_count = models.PositiveIntegerField(default=0, verbose_name='생성된 일정 수')
+    updated_count = models.PositiveIntegerField(default=0, verbose_name='갱신된 일정 수')
+    skipped_count = models.PositiveIntegerField(default=0, verbose_name='건너뛴 일정 수')
+    error = models.TextField(blank=True, verbose_name='오류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='요청일')
+    # 처리 중에는 청크마다 갱신 (오래 갱신되지 않은 running 작업은 중단된 것으로 보고 실패 처리)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='마지막 진행 시각')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='완료일')
+
+    class Meta:
+        verbose_name = '일정 가져오기'
+        verbose_name_plural = '일정 가져오기'
+        db_table = 'event_imports'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.calendar.name} - {self.file_name} ({self.get_status_display()})"
+
+    @property
+    def progress(self):
+        """진행률 (0~100)"""
+        if self.status == 'completed':
+            return 100
+        if not self.size:
+            return 0
+        return min(99, int(self.bytes_read * 100 / self.size))
@@ -0,0 +1,141 @@
+"""
+키셋(커서) 페이지네이션
+OFFSET 대신 마지막 행의 정렬 키 (예: start_date, id) 이후를 조회하므로
+페이지 깊이와 관계없이 비용이 일정하고, 조회 중 행이 추가되어도 중복/누락이 없다.
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from functools import reduce
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """정렬 키 튜플 기준 키셋 페이지네이션
+
+    ordering의 필드는 모두 같은 방향이어야 하며, 마지막 필드는 유일한 값(id)이어야 한다.
+    """
+    ordering = ('id',)
+    page_size = 100
+    max_page_size = 500
+    page_size_query_param = 'limit'
+    cursor_query_param = 'cursor'
+    # True면 cursor/limit 파라미터가 있을 때만 페이지네이션 (기존 배열 응답 호환)
+    require_query_param = False
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def is_requested(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.require_query_param and not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = [field.lstrip('-') for field in self.ordering]
+        self.descending = self.ordering[0].startswith('-')
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        queryset = queryset.order_by(*self.ordering)
+        if cursor:
+            queryset = queryset.filter(self.after(self.decode_cursor(cursor, queryset.model)))
+
+        page = list(queryset[:self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[:self.page_size]
+        self.last_position = [getattr(page[-1], field) for field in self.fields] if page else None
+        return page
+
+    def after(self, position):
+        """(f1, f2, ...) > (v1, v2, ...) (내림차순이면 <) 조건"""
+        lookup = 'lt' if self.descending else 'gt'
+        conditions = []
+        for index, field in enumerate(self.fields):
+            equal = {name: value for name, value in zip(self.fields[:index], position)}
+            conditions.append(Q(**equal, **{f'{field}__{lookup}': position[index]}))
+        return reduce(lambda left, right: left | right, conditions)
+
+    def encode_cursor(self, position):
+        raw = json.dumps([str(value) for value in position], separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor, model):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError
+            return [self.to_python(model, field, value) for field, value in zip(self.fields, values)]
+        except (binascii.Error, ValueError, TypeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def to_python(self, model, field, value):
+        """커서 문자열 -> 정렬 키 값 (어노테이션 키는 하위 클래스에서 변환)"""
+        return model._meta.get_field(field).to_python(value)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.last_position))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class EventPagination(KeysetPagination):
+    """일정 목록: Event.Meta.ordering(start_date) + id"""
+    ordering = ('start_date', 'id')
+
+
+class CalendarPagination(KeysetPagination):
+    """캘린더 목록: Calendar.Meta.ordering(-created_at) + id
+
+    기존 클라이언트는 배열 응답을 기대하므로 cursor/limit을 보낼 때만 페이지네이션한다.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    require_query_param = True
+
+
+class EventSearchPagination(KeysetPagination):
+    """일정 검색 결과: 검색 순위(rank 어노테이션) + id 내림차순"""
+    ordering = ('-rank', '-id')
+    page_size = 20
+    max_page_size = 100
+
+    def to_python(self, model, field, value):
+        if field == 'rank':
+            return float(value)
+        return super().to_python(model, field, value)
@@ -0,0 +1,123 @@
+"""
+캘린더 권한 확인
+요청마다 사용자의 (calendar_id -> 역할) 맵을 한 번만 로드하고,
+이후 권한 확인은 메모리에서 처리한다.
+역할 맵은 캐시(Redis)에 저장되고 signals.py에서 멤버십 변경 시 무효화된다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+
+from .models import Calendar, CalendarMember
+
+# 사용자별 역할 맵 캐시 (시그널로 무효화, TTL은 안전장치)
+ROLES_CACHE_TIMEOUT = getattr(settings, 'CALENDAR_ROLES_CACHE_TIMEOUT', 60 * 60)
+
+ROLE_OWNER = 'owner'
+
+# 이보다 많은 캘린더에 접근 가능하면 ID 목록 대신 서브쿼리로 필터링
+MAX_INLINE_CALENDAR_IDS = 500
+
+
+class CalendarPermissions:
+    """사용자 한 명의 캘린더 역할 맵"""
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = None
+
+    @property
+    def is_authenticated(self):
+        return bool(getattr(self.user, 'is_authenticated', False))
+
+    @property
+    def roles(self):
+        """{calendar_id: 'owner' | 'admin' | 'member'} (최초 접근 시 캐시 또는 1회 쿼리)"""
+        if self._roles is None:
+            self._roles = self._load_roles()
+        return self._roles
+
+    def _load_roles(self):
+        if not self.is_authenticated:
+            return {}
+
+        key = roles_cache_key(self.user.pk)
+        roles = cache.get(key)
+        if roles is None:
+            roles = load_roles_from_db(self.user)
+            cache.set(key, roles, ROLES_CACHE_TIMEOUT)
+        return roles
+
+    def reset(self):
+        """멤버십이 바뀐 뒤 다음 조회 때 다시 로드하도록 비운다."""
+        self._roles = None
+
+    def get_role(self, calendar_id):
+        return self.roles.get(calendar_id)
+
+    def calendar_ids(self):
+        """접근 가능한 캘린더 ID 목록 (소유 + 참여)"""
+        return list(self.roles)
+
+    def filter_visible(self, queryset, field):
+        """Calendar/Event queryset을 접근 가능한 캘린더로 제한한다.
+
+        보통은 캐시된 ID 목록으로 `field IN (...)` 필터를 걸고,
+        목록이 너무 길면 queryset.visible_to()의 semi-join 서브쿼리를 쓴다.
+        어느 쪽도 조인/DISTINCT를 쓰지 않는다.
+        """
+        calendar_ids = self.calendar_ids()
+        if len(calendar_ids) > MAX_INLINE_CALENDAR_IDS:
+            return queryset.visible_to(self.user)
+        return queryset.filter(**{f'{field}__in': calendar_ids})
+
+
+def roles_cache_key(user_id):
+    return f'calendars:roles:{user_id}'
+
+
+def load_roles_from_db(user):
+    """DB에서 사용자의 {calendar_id: 역할} 맵을 한 번의 쿼리로 만든다."""
+    owned = Calendar.objects.filter(owner=user).annotate(
+        role=models.Value(ROLE_OWNER, output_field=models.CharField())
+    ).values_list('id', 'role').order_by()
+    joined = CalendarMember.objects.filter(user=user).values_list(
+        'calendar_id', 'role'
+    ).order_by()
+
+    roles = {}
+    for calendar_id, role in owned.union(joined, all=True):
+        # 소유자 역할이 멤버 역할보다 우선
+        if roles.get(calendar_id) != ROLE_OWNER:
+            roles[calendar_id] = role
+    return roles
+
+
+def invalidate_user_roles(*user_ids):
+    """사용자들의 역할 맵 캐시를 지운다.
+
+    즉시 지우고, 트랜잭션 커밋 후 한 번 더 지워서 커밋 전에
+    다른 요청이 옛 데이터로 다시 채운 캐시도 제거한다.
+    """
+    keys = [roles_cache_key(user_id) for user_id in user_ids if user_id]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def get_calendar_permissions(request):
+    """요청에 묶인 CalendarPermissions를 반환한다 (요청당 하나)."""
+    permissions = getattr(request, '_calendar_permissions', None)
+    if permissions is None or permissions.user is not request.user:
+        permissions = CalendarPermissions(request.user)
+        request._calendar_permissions = permissions
+    return permissions
+
+
+def get_permissions_from_context(context):
+    """serializer context의 request에서 CalendarPermissions를 꺼낸다."""
+    request = context.get('request') if context else None
+    if request is None or getattr(request, 'user', None) is None:
+        return None
+    return get_calendar_permissions(request)
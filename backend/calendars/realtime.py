@@ -0,0 +1,198 @@
+"""
+캘린더 실시간 변경 알림 (WebSocket)
+
+    ws://<host>/ws/calendars/<calendar_id>/?token=<access token>
+
+일정/태그/멤버가 저장·삭제되면 signals.py에서 캘린더 채널로 변경 알림을 발행하고,
+구독 중인 클라이언트는 알림을 받아 /api/events/sync/로 변경분만 가져온다.
+멤버에서 빠지거나(member.deleted) 캘린더가 삭제되면(calendar.deleted) 해당 알림을
+보낸 뒤 연결을 닫아, 권한이 없어진 사용자가 계속 알림을 받지 않게 한다.
+
+브로커
+- InMemoryBroker: 단일 프로세스(테스트/로컬 개발)용
+- RedisBroker: REALTIME_REDIS_URL이 설정되면 Redis pub/sub으로 여러 워커에 전달
+"""
+import asyncio
+import json
+import logging
+import re
+import threading
+import uuid
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qs
+
+import redis
+import redis.asyncio as redis_asyncio
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed, TokenError
+
+from accounts.authentication import CachedJWTAuthentication
+from .permissions import CalendarPermissions
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'planpie:calendar:'
+
+WEBSOCKET_PATH = re.compile(r'^/ws/calendars/(?P<calendar_id>[0-9a-fA-F-]{36})/?$')
+
+# 접속 거부 시 close code
+CLOSE_NOT_FOUND = 4404
+CLOSE_FORBIDDEN = 4403
+
+
+class InMemoryBroker:
+    """프로세스 내부 pub/sub"""
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, calendar_id, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(calendar_id), ()))
+        # 시그널은 동기 코드(다른 스레드)에서 호출되므로 이벤트 루프에 안전하게 전달
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+    @asynccontextmanager
+    async def subscribe(self, calendar_id):
+        key = str(calendar_id)
+        entry = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._subscribers.setdefault(key, set()).add(entry)
+        try:
+            yield entry[1].get
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(key, set())
+                subscribers.discard(entry)
+                if not subscribers:
+                    self._subscribers.pop(key, None)
+
+
+class RedisBroker:
+    """Redis pub/sub (여러 워커 프로세스 간 전달)"""
+
+    def __init__(self, url):
+        self.url = url
+        self._client = redis.Redis.from_url(url)
+
+    def publish(self, calendar_id, message):
+        try:
+            self._client.publish(CHANNEL_PREFIX + str(calendar_id), json.dumps(message))
+        except redis.RedisError:
+            # 알림 실패가 저장을 막지 않도록 한다 (클라이언트는 다음 동기화에서 따라잡음)
+            logger.warning('실시간 알림 발행 실패: calendar=%s', calendar_id, exc_info=True)
+
+    @asynccontextmanager
+    async def subscribe(self, calendar_id):
+        client = redis_asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(CHANNEL_PREFIX + str(calendar_id))
+
+        async def get():
+            while True:
+                message = await pubsub.get_message(timeout=None)
+                if message and message['type'] == 'message':
+                    return json.loads(message['data'])
+
+        try:
+            yield get
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                url = getattr(settings, 'REALTIME_REDIS_URL', None)
+                _broker = RedisBroker(url) if url else InMemoryBroker()
+    return _broker
+
+
+def publish_change(calendar_id, kind, action, object_id, **extra):
+    """변경 알림 발행 (예: kind='event', action='updated')"""
+    message = {
+        'type': f'{kind}.{action}',
+        'calendar_id': str(calendar_id),
+        'id': str(object_id),
+        **extra,
+    }
+    get_broker().publish(calendar_id, message)
+
+
+@sync_to_async
+def authorize(token, calendar_id):
+    """access token의 사용자가 캘린더 멤버이면 사용자 ID, 아니면 None"""
+    if not token:
+        return None
+    authentication = CachedJWTAuthentication()
+    try:
+        user = authentication.get_user(authentication.get_validated_token(token))
+    except (InvalidToken, AuthenticationFailed, TokenError):
+        return None
+    if CalendarPermissions(user).get_role(calendar_id) is None:
+        return None
+    return user.pk
+
+
+def revokes_access(message, user_id):
+    """이 알림으로 사용자가 캘린더에 접근할 수 없게 되는지"""
+    return message['type'] == 'calendar.deleted' or (
+        message['type'] == 'member.deleted' and message['id'] == str(user_id)
+    )
+
+
+async def websocket_application(scope, receive, send):
+    """캘린더 변경 알림 WebSocket (config/asgi.py에서 연결)"""
+    match = WEBSOCKET_PATH.match(scope['path'])
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    try:
+        calendar_id = uuid.UUID(match['calendar_id']) if match else None
+    except ValueError:
+        calendar_id = None
+    if calendar_id is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_NOT_FOUND})
+        return
+
+    query = parse_qs(scope.get('query_string', b'').decode())
+    token = query.get('token', [None])[0]
+    user_id = await authorize(token, calendar_id)
+    if user_id is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_FORBIDDEN})
+        return
+
+    await send({'type': 'websocket.accept'})
+    async with get_broker().subscribe(calendar_id) as next_message:
+        receive_task = asyncio.ensure_future(receive())
+        message_task = asyncio.ensure_future(next_message())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {receive_task, message_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if receive_task in done:
+                    if receive_task.result()['type'] == 'websocket.disconnect':
+                        break
+                    # 클라이언트 메시지(ping 등)는 무시
+                    receive_task = asyncio.ensure_future(receive())
+                if message_task in done:
+                    message = message_task.result()
+                    await send({'type': 'websocket.send', 'text': json.dumps(message)})
+                    if revokes_access(message, user_id):
+                        await send({'type': 'websocket.close', 'code': CLOSE_FORBIDDEN})
+                        break
+                    message_task = asyncio.ensure_future(next_message())
+        finally:
+            receive_task.cancel()
+            message_task.cancel()
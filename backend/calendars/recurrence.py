@@ -0,0 +1,143 @@
+"""
+반복 일정 (RFC 5545 RRULE / EXDATE)
+시리즈 원본 일정 한 건만 저장하고, 조회 구간 안의 발생(occurrence)만 계산한다.
+"""
+import re
+from datetime import datetime, time, timezone as dt_timezone
+
+from dateutil.relativedelta import relativedelta
+from dateutil.rrule import rrulestr
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# 허용하는 반복 주기 (HOURLY 이하 주기는 한 구간에 발생이 너무 많아 제외)
+ALLOWED_FREQUENCIES = ('DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY')
+
+# COUNT 최대값 (주간 반복 약 20년)
+MAX_RECURRENCE_COUNT = 1040
+
+# UNTIL은 시작일로부터 최대 20년
+MAX_RECURRENCE_YEARS = 20
+
+# 하루 안에서 여러 번 발생하게 만드는 규칙 (HOURLY 이하 주기 제한을 우회하므로 제외)
+DISALLOWED_PARTS = ('BYHOUR', 'BYMINUTE', 'BYSECOND')
+
+# 시리즈 하나의 최대 발생 수 (위 제한 안에서는 하루 1회 x 20년을 넘지 않음, 계산 상한)
+MAX_SERIES_OCCURRENCES = 366 * MAX_RECURRENCE_YEARS + 1
+
+UNTIL_PATTERN = re.compile(r'^(\d{8})(T\d{6}Z?)?$')
+
+
+def parse_rule_parts(rule):
+    """'FREQ=WEEKLY;BYDAY=MO' -> {'FREQ': 'WEEKLY', 'BYDAY': 'MO'}"""
+    if rule.upper().startswith('RRULE:'):
+        rule = rule[len('RRULE:'):]
+    parts = {}
+    for part in rule.strip().split(';'):
+        if not part:
+            continue
+        name, sep, value = part.partition('=')
+        if not sep:
+            raise ValueError(f'잘못된 반복 규칙입니다: {part}')
+        parts[name.strip().upper()] = value.strip()
+    return parts
+
+
+def normalize_until(value):
+    """UNTIL을 dateutil이 aware DTSTART와 함께 받는 UTC 형식(YYYYMMDDTHHMMSSZ)으로 바꾼다.
+
+    날짜만 있으면 그날 끝(로컬 23:59:59), 시간대 없는(floating) 값은 로컬 시간으로 본다.
+    """
+    match = UNTIL_PATTERN.match(value)
+    if match.group(2) and match.group(2).endswith('Z'):
+        return value
+    if match.group(2):
+        local = datetime.strptime(value, '%Y%m%dT%H%M%S')
+    else:
+        local = datetime.combine(datetime.strptime(value, '%Y%m%d'), time(23, 59, 59))
+    return timezone.make_aware(local).astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def build_rule(rule, dtstart):
+    """RRULE 문자열을 dateutil rrule로 변환한다.
+
+    BYDAY 등이 사용자가 보는 요일 기준으로 계산되도록 로컬 시간대로 전개한다.
+    """
+    parts = parse_rule_parts(rule)
+    frequency = parts.get('FREQ')
+    if frequency not in ALLOWED_FREQUENCIES:
+        raise ValueError('반복 주기(FREQ)는 DAILY, WEEKLY, MONTHLY, YEARLY 중 하나여야 합니다.')
+    if 'COUNT' in parts:
+        if not parts['COUNT'].isdigit() or not 0 < int(parts['COUNT']) <= MAX_RECURRENCE_COUNT:
+            raise ValueError(f'반복 횟수(COUNT)는 1~{MAX_RECURRENCE_COUNT} 사이여야 합니다.')
+    if 'COUNT' in parts and 'UNTIL' in parts:
+        raise ValueError('COUNT와 UNTIL은 함께 사용할 수 없습니다.')
+    if any(name in parts for name in DISALLOWED_PARTS):
+        raise ValueError('BYHOUR, BYMINUTE, BYSECOND는 사용할 수 없습니다.')
+    if 'UNTIL' in parts:
+        match = UNTIL_PATTERN.match(parts['UNTIL'])
+        if not match:
+            raise ValueError('반복 종료(UNTIL)는 YYYYMMDD, YYYYMMDDTHHMMSS 또는 YYYYMMDDTHHMMSSZ 형식이어야 합니다.')
+        latest = timezone.localtime(dtstart).date() + relativedelta(years=MAX_RECURRENCE_YEARS)
+        if match.group(1) > latest.strftime('%Y%m%d'):
+            raise ValueError(f'반복 종료(UNTIL)는 시작일로부터 {MAX_RECURRENCE_YEARS}년 이내여야 합니다.')
+        try:
+            parts['UNTIL'] = normalize_until(parts['UNTIL'])
+        except ValueError as e:
+            raise ValueError(f'잘못된 반복 종료(UNTIL)입니다: {e}')
+
+    normalized = ';'.join(f'{name}={value}' for name, value in parts.items())
+    try:
+        return rrulestr(normalized, dtstart=timezone.localtime(dtstart))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'잘못된 반복 규칙입니다: {e}')
+
+
+def parse_exdates(values):
+    """EXDATE 목록(ISO 8601 문자열)을 aware datetime 집합으로 변환한다."""
+    exdates = set()
+    for value in values or []:
+        parsed = parse_datetime(value) if isinstance(value, str) else value
+        if parsed is None:
+            raise ValueError(f'잘못된 제외 일시입니다: {value}')
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        exdates.add(parsed)
+    return exdates
+
+
+def get_recurrence_end(rule, start, end):
+    """시리즈의 마지막 발생이 끝나는 시간 (무한 반복이면 None)
+
+    구간 조회 시 이미 끝난 시리즈를 DB에서 걸러내는 데 사용한다.
+    """
+    parts = parse_rule_parts(rule)
+    if 'COUNT' not in parts and 'UNTIL' not in parts:
+        return None
+
+    last = None
+    for index, occurrence in enumerate(build_rule(rule, start)):
+        if index >= MAX_SERIES_OCCURRENCES:
+            raise ValueError('반복 일정의 발생 횟수가 너무 많습니다.')
+        last = occurrence
+    if last is None:
+        return end
+    return last + (end - start)
+
+
+def iter_occurrences(rule, start, end, window_start, window_end, excluded=()):
+    """구간 [window_start, window_end)과 겹치는 발생의 (시작, 종료)를 순서대로 반환한다.
+
+    excluded에 포함된 원래 시작 시간(EXDATE, 개별 수정된 발생)은 건너뛴다.
+    """
+    duration = end - start
+    series = build_rule(rule, start)
+    for occurrence_start in series.between(window_start - duration, window_end, inc=True):
+        occurrence_end = occurrence_start + duration
+        if occurrence_start >= window_end:
+            continue
+        if occurrence_end <= window_start and occurrence_start < window_start:
+            continue
+        if occurrence_start in excluded:
+            continue
+        yield occurrence_start, occurrence_end
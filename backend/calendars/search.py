@@ -0,0 +1,126 @@
+"""
+일정 전문 검색 (제목/장소/메모)
+
+PostgreSQL
+    events.search_vector(tsvector) 컬럼을 트리거가 유지하고 GIN 인덱스로 검색한다.
+    (마이그레이션 0007_event_search, 모델 필드가 아니므로 일반 조회에서는 읽지 않음)
+    한국어는 형태소 분석기가 없으므로 'simple' 설정 + 접두어 검색(회의 -> 회의는, 회의록),
+    영어는 'english' 설정(어간 추출)으로 색인하고 두 질의 중 하나라도 맞으면 결과에 포함한다.
+    가중치: 제목 A, 장소 B, 메모 C
+
+그 외 DB (테스트용 SQLite 등)
+    icontains로 같은 조건을 흉내 내고 필드별 가중치 합을 순위로 사용한다.
+"""
+import re
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchHeadline, SearchQuery, SearchRank, SearchVectorField,
+)
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+
+# 검색어 최대 단어 수
+EVENT_SEARCH_MAX_TERMS = getattr(settings, 'EVENT_SEARCH_MAX_TERMS', 10)
+
+SEARCH_FIELDS = ('title', 'location', 'description')
+
+# ts_headline 강조 구분자 (응답에서는 위치 목록으로 바꿔 HTML을 만들지 않음)
+START_SEL, STOP_SEL = '\x02', '\x03'
+
+# 폴백 순위 가중치
+FALLBACK_WEIGHTS = {'title': 1.0, 'location': 0.4, 'description': 0.2}
+
+
+def search_terms(text):
+    """검색어 -> 단어 목록 (tsquery 연산자/특수문자는 제거)"""
+    return re.findall(r'\w+', (text or '').lower())[:EVENT_SEARCH_MAX_TERMS]
+
+
+def is_postgres(queryset):
+    return connections[queryset.db].vendor == 'postgresql'
+
+
+def search_events(queryset, terms):
+    """queryset을 검색어와 일치하는 일정으로 제한하고 rank, 강조용 필드를 붙인다."""
+    if is_postgres(queryset):
+        return _search_postgres(queryset, terms)
+    return _search_fallback(queryset, terms)
+
+
+def _search_postgres(queryset, terms):
+    raw = ' & '.join(f'{term}:*' for term in terms)
+    query = SearchQuery(raw, config='simple', search_type='raw') | SearchQuery(
+        raw, config='english', search_type='raw'
+    )
+    document = RawSQL(f'{queryset.model._meta.db_table}.search_vector', [], output_field=SearchVectorField())
+    headlines = {
+        f'{field}_headline': SearchHeadline(
+            field, query, config='simple', start_sel=START_SEL, stop_sel=STOP_SEL,
+            # 메모는 일치한 부분 주변만, 제목/장소는 전체
+            highlight_all=field != 'description',
+        )
+        for field in SEARCH_FIELDS
+    }
+    return queryset.alias(document=document).filter(document=query).annotate(
+        # float4 -> float8 로 바꿔 커서 값이 그대로 비교되도록 함
+        rank=Cast(SearchRank(F('document'), query), FloatField()),
+        **headlines,
+    )
+
+
+def _search_fallback(queryset, terms):
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term) | Q(location__icontains=term) | Q(description__icontains=term)
+        )
+    rank = Value(0.0)
+    for term in terms:
+        for field, weight in FALLBACK_WEIGHTS.items():
+            rank = rank + Case(
+                When(**{f'{field}__icontains': term}, then=Value(weight)),
+                default=Value(0.0),
+            )
+    return queryset.annotate(rank=Cast(rank, FloatField()))
+
+
+def _mark(text, terms):
+    """폴백: 텍스트에서 검색어 위치를 구분자로 감싼다."""
+    if not text or not terms:
+        return text
+    pattern = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.sub(pattern, lambda match: f'{START_SEL}{match.group(0)}{STOP_SEL}', text, flags=re.I)
+
+
+def parse_headline(value):
+    """구분자가 들어간 문자열 -> {'text', 'matches': [[시작, 끝], ...]} (일치가 없으면 None)"""
+    if not value or START_SEL not in value:
+        return None
+    text, matches, start = [], [], None
+    length = 0
+    for part in re.split(f'([{START_SEL}{STOP_SEL}])', value):
+        if part == START_SEL:
+            start = length
+        elif part == STOP_SEL:
+            if start is not None:
+                matches.append([start, length])
+            start = None
+        else:
+            text.append(part)
+            length += len(part)
+    return {'text': ''.join(text), 'matches': matches}
+
+
+def event_highlights(event, terms):
+    """{필드: {'text', 'matches'}} 검색어와 일치한 필드만"""
+    highlights = {}
+    for field in SEARCH_FIELDS:
+        headline = getattr(event, f'{field}_headline', None)
+        if headline is None:
+            headline = _mark(getattr(event, field), terms)
+        parsed = parse_headline(headline)
+        if parsed:
+            highlights[field] = parsed
+    return highlights
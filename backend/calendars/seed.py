@@ -0,0 +1,185 @@
+"""
+벤치마크/부하 테스트용 시드 데이터 (python manage.py seed)
+
+같은 옵션과 난수 시드로 실행하면 같은 모양의 데이터가 만들어진다.
+- 사용자마다 개인 캘린더 1개, 나머지는 공유 캘린더(멤버/공유 토큰 포함)
+- 공유 캘린더 소유와 일정 수는 순위의 거듭제곱에 반비례(Zipf)하도록 치우치게 분배
+  (소수의 캘린더에 일정이 몰리고 대부분은 적음)
+- 일정 시간은 대부분 현재 전후 한 달에 몰리고 나머지는 3년 전 ~ 1년 후에 흩어짐
+- 일정은 batch_size 단위로 bulk_create 하므로 수백만 건도 메모리를 적게 쓴다
+  (bulk_create는 시그널을 보내지 않으므로 캐시 무효화/실시간 알림 없음)
+
+시드 사용자는 이메일 도메인(SEED_EMAIL_DOMAIN)으로 구분하며 모두 같은 비밀번호를 쓴다.
+"""
+import itertools
+import random
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import User
+from .models import Calendar, CalendarMember, CalendarTag, Event
+from .recurrence import get_recurrence_end
+
+SEED_EMAIL_DOMAIN = 'planpie.seed'
+SEED_PASSWORD = 'planpie-seed-1234'
+
+TAG_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#98D8C8', '#F7DC6F']
+TITLES = ['회의', '점심', '운동', '스터디', '병원', '출장', '가족 모임', '마감', '면접', '여행', 'Weekly sync', 'Review']
+LOCATIONS = ['', '', '회의실 A', '강남역', '온라인', '본사 3층', 'Cafe']
+RECURRENCE_RULES = ['FREQ=DAILY;COUNT=10', 'FREQ=WEEKLY;COUNT=12', 'FREQ=WEEKLY;BYDAY=MO,WE;COUNT=20', 'FREQ=MONTHLY;COUNT=6']
+
+
+def seed_email(index):
+    return f'seed{index}@{SEED_EMAIL_DOMAIN}'
+
+
+def seed_users():
+    return User.objects.filter(email__endswith=f'@{SEED_EMAIL_DOMAIN}')
+
+
+def zipf_cum_weights(count, skew):
+    """순위 1..count의 가중치 1/rank^skew 누적합 (random.choices의 cum_weights)"""
+    return list(itertools.accumulate(1 / (rank ** skew) for rank in range(1, count + 1)))
+
+
+def clear_seed_data(batch_size=100):
+    """시드 사용자와 그 캘린더/일정을 지운다. 반환값: 삭제한 사용자 수
+
+    일정은 삭제 collector(행을 모두 읽어 시그널/연쇄 삭제 처리)를 거치지 않고
+    캘린더 batch_size개마다 DELETE 한 번으로 지운다. (삭제 기록/알림/캐시 무효화 시그널 없음)
+    남은 캘린더/멤버/태그와 사용자는 일반 삭제로 지운다.
+    """
+    calendar_ids = list(Calendar.objects.filter(owner__in=seed_users()).values_list('pk', flat=True))
+    for start in range(0, len(calendar_ids), batch_size):
+        events = Event.objects.filter(calendar_id__in=calendar_ids[start:start + batch_size])
+        with transaction.atomic():
+            # 개별 수정된 발생을 먼저 지워 원본(recurrence_parent) FK가 남지 않게 함
+            events.filter(recurrence_parent__isnull=False)._raw_delete(events.db)
+            events._raw_delete(events.db)
+
+    count = seed_users().count()
+    seed_users().delete()
+    return count
+
+
+def _random_start(rng, now):
+    if rng.random() < 0.7:
+        minutes = rng.randint(-30 * 24 * 60, 30 * 24 * 60)
+    else:
+        minutes = rng.randint(-3 * 365 * 24 * 60, 365 * 24 * 60)
+    start = now + timedelta(minutes=minutes)
+    # 15분 단위로 맞춤
+    return start.replace(minute=start.minute // 15 * 15)
+
+
+def _build_event(rng, calendar, tag_ids, now, recurring):
+    start = _random_start(rng, now)
+    all_day = rng.random() < 0.1
+    if all_day:
+        start = start.replace(hour=0, minute=0)
+        end = start + timedelta(days=rng.choice([1, 1, 1, 2, 3]))
+    else:
+        end = start + timedelta(minutes=rng.choice([30, 60, 60, 90, 120, 180]))
+
+    event = Event(
+        calendar_id=calendar.pk,
+        created_by_id=calendar.owner_id,
+        tag_id=rng.choice(tag_ids) if tag_ids and rng.random() < 0.8 else None,
+        title=rng.choice(TITLES),
+        location=rng.choice(LOCATIONS),
+        start_date=start,
+        end_date=end,
+        all_day=all_day,
+    )
+    if rng.random() < recurring:
+        event.recurrence_rule = rng.choice(RECURRENCE_RULES)
+        event.recurrence_end = get_recurrence_end(event.recurrence_rule, start, end)
+    return event
+
+
+def seed_dataset(users=100, calendars=200, events=10000, members=5, tags=5, recurring=0.05,
+                 skew=1.1, seed=42, batch_size=5000, password=SEED_PASSWORD, log=None):
+    """시드 데이터를 만든다. 반환값: 만든 행 수 {'users', 'calendars', 'members', 'tags', 'events'}"""
+    rng = random.Random(seed)
+    log = log or (lambda message: None)
+    now = timezone.now().replace(second=0, microsecond=0)
+    calendars = max(calendars, users)
+    start_index = seed_users().count()
+
+    # 해시는 한 번만 계산해 모든 사용자가 공유 (로그인 벤치마크용)
+    password_hash = make_password(password)
+    with transaction.atomic():
+        log(f'사용자 {users}명 생성')
+        user_rows = User.objects.bulk_create([
+            User(
+                email=seed_email(start_index + index),
+                username=f'seed_{start_index + index}',
+                first_name=f'시드{start_index + index}',
+                password=password_hash,
+            )
+            for index in range(users)
+        ], batch_size=batch_size)
+
+        log(f'캘린더 {calendars}개 생성')
+        owner_weights = zipf_cum_weights(users, skew)
+        calendar_rows = []
+        for index in range(calendars):
+            personal = index < users
+            calendar_rows.append(Calendar(
+                name=f'{user_rows[index].first_name}의 캘린더' if personal else f'공유 캘린더 {index}',
+                calendar_type='personal' if personal else 'shared',
+                color=TAG_COLORS[index % len(TAG_COLORS)],
+                owner=user_rows[index] if personal else rng.choices(user_rows, cum_weights=owner_weights)[0],
+                share_token=None if personal else f'seed-{uuid.UUID(int=rng.getrandbits(128)).hex}',
+            ))
+        Calendar.objects.bulk_create(calendar_rows, batch_size=batch_size)
+
+        member_rows = []
+        for calendar in calendar_rows:
+            if calendar.calendar_type != 'shared':
+                continue
+            picked = rng.sample(user_rows, min(members + 1, len(user_rows)))
+            picked = [user for user in picked if user.pk != calendar.owner_id][:members]
+            for position, user in enumerate(picked):
+                member_rows.append(CalendarMember(
+                    calendar=calendar, user=user, role='admin' if position == 0 else 'member',
+                ))
+        CalendarMember.objects.bulk_create(member_rows, batch_size=batch_size)
+        log(f'멤버 {len(member_rows)}명 추가')
+
+        tag_rows = [
+            CalendarTag(calendar=calendar, name=f'태그 {order + 1}', color=TAG_COLORS[order % len(TAG_COLORS)], order=order)
+            for calendar in calendar_rows
+            for order in range(tags)
+        ]
+        CalendarTag.objects.bulk_create(tag_rows, batch_size=batch_size)
+        tag_ids = {}
+        for tag in tag_rows:
+            tag_ids.setdefault(tag.calendar_id, []).append(tag.pk)
+
+    # 일정은 배치마다 커밋 (수백만 건을 한 트랜잭션에 묶지 않음)
+    calendar_order = calendar_rows[:]
+    rng.shuffle(calendar_order)
+    calendar_weights = zipf_cum_weights(len(calendar_order), skew)
+    created = 0
+    while created < events:
+        size = min(batch_size, events - created)
+        batch = [
+            _build_event(rng, calendar, tag_ids.get(calendar.pk), now, recurring)
+            for calendar in rng.choices(calendar_order, cum_weights=calendar_weights, k=size)
+        ]
+        Event.objects.bulk_create(batch)
+        created += size
+        log(f'일정 {created}/{events}')
+
+    return {
+        'users': len(user_rows),
+        'calendars': len(calendar_rows),
+        'members': len(member_rows),
+        'tags': len(tag_rows),
+        'events': created,
+    }
@@ -1,6 +1,34 @@
+import uuid
+
 from rest_framework import serializers
-from .models import Calendar, CalendarMember, Event, CalendarInvitation, CalendarTag
+from .models import (
+    Calendar, CalendarMember, Event, EventImport, CalendarInvitation, CalendarTag,
+    MAX_EVENT_DURATION,
+)
 from accounts.serializers import UserSerializer
+from .permissions import get_permissions_from_context
+from .recurrence import build_rule, parse_exdates
+from .search import event_highlights
+from .invitations import INVITATION_MAX_EMAILS
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """context[preload_key]({pk: 객체})가 있으면 DB 조회 없이 객체를 찾는다.
+    (일정 일괄 처리에서 항목마다 조회하지 않도록 미리 로드한 객체를 넘긴다)
+    """
+
+    def __init__(self, preload_key, **kwargs):
+        self.preload_key = preload_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        preloaded = self.context.get(self.preload_key)
+        if preloaded is None:
+            return super().to_internal_value(data)
+        try:
+            return preloaded[uuid.UUID(str(data))]
+        except (KeyError, ValueError):
+            self.fail('does_not_exist', pk_value=data)
+
 
 class CalendarTagSerializer(serializers.ModelSerializer):
     """캘린더 태그 시리얼라이저"""
@@ -48,11 +76,17 @@ class CalendarSerializer(serializers.ModelSerializer):
 
     def get_member_count(self, obj):
         """멤버 수 (소유자 포함)"""
-        return 1 + obj.members.count()
+        count = getattr(obj, 'member_count_value', None)
+        if count is None:
+            count = obj.members.count()
+        return 1 + count
 
     def get_event_count(self, obj):
         """일정 수"""
-        return obj.events.count()
+        count = getattr(obj, 'event_count_value', None)
+        if count is None:
+            count = obj.events.count()
+        return count
 
     def get_share_url(self, obj):
         """공유 URL"""
@@ -64,27 +98,25 @@ class CalendarSerializer(serializers.ModelSerializer):
         if request and request.user and request.user.is_authenticated:
             return request.user
         return None
+
+    def _get_role(self, obj):
+        """현재 사용자의 역할 (요청 단위 권한 맵에서 조회)"""
+        user = self._get_user()
+        if user is None:
+            return None
+        return obj.get_role(user, get_permissions_from_context(self.context))
         
     def get_is_admin(self, obj):
         """현재 사용자가 관리자인지"""
-        request = self.context.get('request')
-        if request and request.user:
-            return obj.is_admin(request.user)
-        return False
+        return self._get_role(obj) in ('owner', 'admin')
 
     def get_can_leave(self, obj):
         """현재 사용자가 나갈 수 있는지"""
-        request = self.context.get('request')
-        if request and request.user:
-            return obj.can_leave(request.user)
-        return False
+        return self._get_role(obj) in ('admin', 'member')
 
     def get_can_delete(self, obj):
         """현재 사용자가 삭제할 수 있는지"""
-        request = self.context.get('request')
-        if request and request.user:
-            return obj.can_delete(request.user)
-        return False
+        return self._get_role(obj) in ('owner', 'admin')
 
 
 class CalendarInvitationSerializer(serializers.ModelSerializer):
@@ -106,12 +138,22 @@ class CalendarInvitationSerializer(serializers.ModelSerializer):
         ]
 
 
+class SentInvitationSerializer(serializers.ModelSerializer):
+    """초대 발송 결과 (캘린더/초대한 사람을 중첩하지 않아 초대 수와 관계없이 추가 쿼리 없음)"""
+    calendar_id = serializers.UUIDField(read_only=True)
+
+    class Meta:
+        model = CalendarInvitation
+        fields = ['id', 'calendar_id', 'invitee_email', 'role', 'status', 'expires_at']
+        read_only_fields = fields
+
+
 class SendInvitationSerializer(serializers.Serializer):
     """초대 발송 시리얼라이저"""
     emails = serializers.ListField(
         child=serializers.EmailField(),
         min_length=1,
-        max_length=10,
+        max_length=INVITATION_MAX_EMAILS,
         help_text="초대할 이메일 목록"
     )
     role = serializers.ChoiceField(
@@ -129,10 +171,15 @@ class SendInvitationSerializer(serializers.Serializer):
 class EventSerializer(serializers.ModelSerializer):
     """일정 시리얼라이저"""
     created_by = UserSerializer(read_only=True)
+    calendar = PreloadedPrimaryKeyRelatedField('calendars', queryset=Calendar.objects.all())
     calendar_name = serializers.CharField(source='calendar.name', read_only=True)
+    recurrence_parent = PreloadedPrimaryKeyRelatedField(
+        'events', queryset=Event.objects.all(), default=None, allow_null=True
+    )
     tag = CalendarTagSerializer(read_only=True)
     tag_id = serializers.UUIDField(write_only=True, required=False, allow_null=True)
     color = serializers.ReadOnlyField()
+    is_recurring = serializers.ReadOnlyField()
     can_edit = serializers.SerializerMethodField()
     can_delete = serializers.SerializerMethodField()
 
@@ -143,19 +190,27 @@ class EventSerializer(serializers.ModelSerializer):
             'title', 'description', 'location',
             'tag', 'tag_id', 'color',
             'start_date', 'end_date', 'all_day',
+            'recurrence_rule', 'recurrence_exdates', 'recurrence_end',
+            'recurrence_parent', 'recurrence_id', 'is_recurring',
             'created_by', 'can_edit', 'can_delete',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_by', 'color', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_by', 'color', 'recurrence_end', 'created_at', 'updated_at']
 
     def validate_tag_id(self, value):
         """태그가 해당 캘린더의 태그인지 확인"""
         if value:
-            calendar_id = self.initial_data.get('calendar')
-            if not CalendarTag.objects.filter(
-                id=value,
-                calendar_id=calendar_id
-            ).exists():
+            calendar_id = self.initial_data.get('calendar') or (
+                self.instance.calendar_id if self.instance else None
+            )
+            tags = self.context.get('tags')
+            if tags is not None:
+                # 일괄 처리: 미리 로드한 태그에서 확인
+                tag = tags.get(value)
+                valid = tag is not None and str(tag.calendar_id) == str(calendar_id)
+            else:
+                valid = CalendarTag.objects.filter(id=value, calendar_id=calendar_id).exists()
+            if not valid:
                 raise serializers.ValidationError("유효하지 않은 태그입니다.")
         return value
 
@@ -163,22 +218,23 @@ class EventSerializer(serializers.ModelSerializer):
         """현재 사용자가 수정할 수 있는지"""
         request = self.context.get('request')
         if request and request.user:
-            return obj.can_edit(request.user)
+            return obj.can_edit(request.user, get_permissions_from_context(self.context))
         return False
 
     def get_can_delete(self, obj):
         """현재 사용자가 삭제할 수 있는지"""
         request = self.context.get('request')
         if request and request.user:
-            return obj.can_delete(request.user)
+            return obj.can_delete(request.user, get_permissions_from_context(self.context))
         return False
 
     def validate(self, data):
         """캘린더 멤버인지 확인"""
         request = self.context.get('request')
+        calendar = data.get('calendar') or (self.instance.calendar if self.instance else None)
         if request and request.user:
-            calendar = data.get('calendar') or self.instance.calendar if self.instance else None
-            if calendar and not calendar.can_edit_event(request.user):
+            permissions = get_permissions_from_context(self.context)
+            if calendar and not calendar.can_edit_event(request.user, permissions):
                 raise serializers.ValidationError("이 캘린더에 일정을 추가/수정할 권한이 없습니다.")
         
         # 시작 시간과 종료 시간 검증
@@ -186,15 +242,63 @@ class EventSerializer(serializers.ModelSerializer):
         end_date = data.get('end_date')
         if start_date and end_date and start_date > end_date:
             raise serializers.ValidationError("종료 시간은 시작 시간 이후여야 합니다.")
+
+        # 구간 조회가 start_date 하한을 두므로 너무 긴 일정은 받지 않는다
+        start_date = start_date or getattr(self.instance, 'start_date', None)
+        end_date = end_date or getattr(self.instance, 'end_date', None)
+        if start_date and end_date and end_date - start_date > MAX_EVENT_DURATION:
+            raise serializers.ValidationError(
+                f"일정 길이는 최대 {MAX_EVENT_DURATION.days}일까지 가능합니다."
+            )
+
+        self._validate_recurrence(data, calendar)
         
         return data
 
+    def _validate_recurrence(self, data, calendar):
+        """반복 규칙 / 개별 수정 발생 검증"""
+        def current(field):
+            if field in data:
+                return data[field]
+            return getattr(self.instance, field, None) if self.instance else None
+
+        rule = current('recurrence_rule')
+        if rule:
+            try:
+                build_rule(rule, current('start_date'))
+                parse_exdates(current('recurrence_exdates'))
+            except ValueError as e:
+                raise serializers.ValidationError({'recurrence_rule': str(e)})
+
+        parent = current('recurrence_parent')
+        if parent:
+            if not parent.recurrence_rule or parent.recurrence_parent_id:
+                raise serializers.ValidationError({'recurrence_parent': '반복 일정의 원본이 아닙니다.'})
+            if calendar and parent.calendar_id != calendar.pk:
+                raise serializers.ValidationError({'recurrence_parent': '같은 캘린더의 일정이어야 합니다.'})
+            if rule:
+                raise serializers.ValidationError({'recurrence_rule': '개별 수정된 발생에는 반복 규칙을 지정할 수 없습니다.'})
+            if not current('recurrence_id'):
+                raise serializers.ValidationError({'recurrence_id': '원래 발생 시간이 필요합니다.'})
+
     def create(self, validated_data):
         """일정 생성"""
         validated_data['created_by'] = self.context['request'].user
         return super().create(validated_data)
 
 
+class EventSearchResultSerializer(EventSerializer):
+    """일정 검색 결과 (순위 + 일치한 필드별 강조 위치)"""
+    rank = serializers.FloatField(read_only=True)
+    highlights = serializers.SerializerMethodField()
+
+    class Meta(EventSerializer.Meta):
+        fields = EventSerializer.Meta.fields + ['rank', 'highlights']
+
+    def get_highlights(self, obj):
+        return event_highlights(obj, self.context.get('search_terms', []))
+
+
 class CreateEventSerializer(serializers.ModelSerializer):
     """일정 생성 전용 시리얼라이저"""
     class Meta:
@@ -209,7 +313,7 @@ class CreateEventSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if request and request.user:
             calendar = data.get('calendar')
-            if not calendar.can_edit_event(request.user):
+            if not calendar.can_edit_event(request.user, get_permissions_from_context(self.context)):
                 raise serializers.ValidationError("이 캘린더에 일정을 추가할 권한이 없습니다.")
         
         # 시작 시간과 종료 시간 검증
@@ -237,7 +341,7 @@ class UpdateEventSerializer(serializers.ModelSerializer):
         """권한 및 데이터 검증"""
         request = self.context.get('request')
         if request and request.user and self.instance:
-            if not self.instance.can_edit(request.user):
+            if not self.instance.can_edit(request.user, get_permissions_from_context(self.context)):
                 raise serializers.ValidationError("이 일정을 수정할 권한이 없습니다.")
         
         # 시작 시간과 종료 시간 검증
@@ -248,19 +352,39 @@ class UpdateEventSerializer(serializers.ModelSerializer):
         
         return data
 
+class EventImportSerializer(serializers.ModelSerializer):
+    """iCalendar 가져오기 작업 시리얼라이저"""
+    progress = serializers.ReadOnlyField()
+
+    class Meta:
+        model = EventImport
+        fields = [
+            'id', 'calendar', 'file_name', 'status', 'progress',
+            'size', 'bytes_read', 'created_count', 'updated_count', 'skipped_count',
+            'error', 'created_at', 'updated_at', 'finished_at'
+        ]
+        read_only_fields = fields
+
+
+class UpdateTagItemSerializer(serializers.Serializer):
+    """태그 일괄 업데이트 항목"""
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=50)
+    color = serializers.RegexField(r'^#[0-9A-Fa-f]{6}$', required=False)
+    order = serializers.IntegerField(required=False)
+
+
 class UpdateTagsSerializer(serializers.Serializer):
     """태그 일괄 업데이트 시리얼라이저"""
-    tags = serializers.ListField(
-        child=serializers.DictField(),
+    tags = UpdateTagItemSerializer(
+        many=True,
         help_text="태그 업데이트 정보 목록"
     )
     
     def validate_tags(self, value):
-        for tag_info in value:
-            if 'id' not in tag_info:
-                raise serializers.ValidationError("각 태그는 id를 포함해야 합니다.")
-            if 'name' not in tag_info:
-                raise serializers.ValidationError("각 태그는 name을 포함해야 합니다.")
+        ids = [tag_info['id'] for tag_info in value]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("같은 태그가 여러 번 포함되어 있습니다.")
         return value
 
 class AcceptInvitationSerializer(serializers.Serializer):
@@ -278,6 +402,14 @@ class ChangeRoleSerializer(serializers.Serializer):
     )
 
 
+class CalendarTagStatsSerializer(serializers.Serializer):
+    """태그별 일정 수 (tag가 null이면 태그 없는 일정)"""
+    tag = serializers.UUIDField(allow_null=True)
+    total = serializers.IntegerField()
+    upcoming = serializers.IntegerField()
+    past = serializers.IntegerField()
+
+
 class CalendarStatsSerializer(serializers.Serializer):
     """캘린더 통계 시리얼라이저"""
     total_events = serializers.IntegerField()
@@ -286,3 +418,4 @@ class CalendarStatsSerializer(serializers.Serializer):
     total_members = serializers.IntegerField()
     admins = serializers.IntegerField()
     members = serializers.IntegerField()
+    tags = CalendarTagStatsSerializer(many=True)
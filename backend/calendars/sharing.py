@@ -0,0 +1,78 @@
+"""
+공유 링크 공개 캘린더 정보 캐시
+get_by_share_token은 인증 없이 링크를 연 모든 사람이 호출하므로,
+직렬화한 결과(익명 사용자 기준)를 캐시해 두고 캘린더/태그/멤버가 바뀔 때만 다시 만든다.
+
+캐시 키
+- calendars:share:<token>   -> 캘린더 ID (토큰 재생성 시 삭제)
+- calendars:public:<id>     -> {'etag', 'data'} (캘린더/태그/멤버 변경 시 삭제)
+캘린더 ID로 스냅샷을 저장하므로 변경 시그널에서 토큰을 조회할 필요가 없다.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+# 스냅샷 보관 시간 (변경 시 즉시 삭제되며, 일정 수(event_count)는 이 시간 안에서 늦게 반영될 수 있음)
+SHARE_SNAPSHOT_TIMEOUT = getattr(settings, 'SHARE_SNAPSHOT_TIMEOUT', 60 * 10)
+
+# 브라우저/프록시가 재검증 없이 사용할 수 있는 시간
+SHARE_RESPONSE_MAX_AGE = getattr(settings, 'SHARE_RESPONSE_MAX_AGE', 60)
+
+
+def share_token_key(token):
+    return f'calendars:share:{token}'
+
+
+def snapshot_key(calendar_id):
+    return f'calendars:public:{calendar_id}'
+
+
+def build_snapshot(calendar):
+    """익명 사용자 기준으로 직렬화한 공개 캘린더 정보와 ETag"""
+    from .serializers import CalendarSerializer
+
+    data = CalendarSerializer(calendar, context={}).data
+    raw = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+    return {'etag': hashlib.sha1(raw.encode()).hexdigest(), 'data': json.loads(raw)}
+
+
+def get_public_snapshot(token):
+    """share_token -> {'etag', 'data'} (유효하지 않은 토큰이면 None)
+
+    캐시가 모두 살아 있으면 DB를 조회하지 않는다.
+    """
+    from .models import Calendar
+
+    calendar_id = cache.get(share_token_key(token))
+    if calendar_id is not None:
+        snapshot = cache.get(snapshot_key(calendar_id))
+        # 토큰이 재생성된 직후의 오래된 매핑은 무시
+        if snapshot is not None and snapshot['data'].get('share_token') == token:
+            return snapshot
+
+    calendar = Calendar.objects.with_details().filter(share_token=token).first()
+    if calendar is None:
+        return None
+    snapshot = build_snapshot(calendar)
+    cache.set_many({
+        share_token_key(token): calendar.pk,
+        snapshot_key(calendar.pk): snapshot,
+    }, SHARE_SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def invalidate_public_snapshot(calendar_id):
+    """캘린더/태그/멤버 변경 시 스냅샷 삭제
+    커밋 전에 다른 요청이 이전 데이터로 다시 캐시하지 않도록 커밋 후 삭제한다.
+    """
+    transaction.on_commit(lambda: cache.delete(snapshot_key(calendar_id)))
+
+
+def forget_share_token(token):
+    """공유 링크 재생성/캘린더 삭제 시 이전 토큰 매핑 삭제"""
+    if token:
+        transaction.on_commit(lambda: cache.delete(share_token_key(token)))
@@ -1,8 +1,16 @@
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from .models import Calendar, CalendarTag, DEFAULT_TAG_COLORS, DEFAULT_TAG_NAMES
+from .models import (
+    Calendar, CalendarTag, CalendarMember, Event, EventTombstone,
+    DEFAULT_TAG_COLORS, DEFAULT_TAG_NAMES,
+)
+from .permissions import invalidate_user_roles
+from .realtime import publish_change
+from .sharing import forget_share_token, invalidate_public_snapshot
+from .stats import invalidate_calendar_stats
 
 
 @receiver(post_save, sender=Calendar)
@@ -34,3 +42,134 @@ def create_default_tags_after_calendar_saved(sender, instance: Calendar, created
     transaction.on_commit(_create_tags)
 
 
+@receiver(post_save, sender=Calendar)
+@receiver(post_delete, sender=Calendar)
+def invalidate_owner_roles(sender, instance: Calendar, created: bool = False, **kwargs):
+    """캘린더 생성/삭제 시 소유자의 역할 맵 캐시를 지운다.
+    (삭제 시 멤버들은 CalendarMember 연쇄 삭제 시그널에서 처리)
+    """
+    if kwargs.get('signal') is post_save and not created:
+        return
+    invalidate_user_roles(instance.owner_id)
+
+
+@receiver(post_save, sender=CalendarMember)
+@receiver(post_delete, sender=CalendarMember)
+def invalidate_member_roles(sender, instance: CalendarMember, **kwargs):
+    """멤버 추가/역할 변경/삭제 시 해당 사용자의 역할 맵 캐시를 지운다."""
+    invalidate_user_roles(instance.user_id)
+
+
+@receiver(post_delete, sender=Event)
+def record_event_tombstone(sender, instance: Event, origin=None, **kwargs):
+    """일정 삭제 기록을 남겨 증분 동기화에서 삭제를 전달한다.
+    캘린더/사용자 삭제로 연쇄 삭제된 경우는 캘린더 목록에서 사라지므로 기록하지 않는다.
+    """
+    deleted_directly = isinstance(origin, Event) or (
+        isinstance(origin, QuerySet) and origin.model is Event
+    )
+    if not deleted_directly:
+        return
+    EventTombstone.objects.create(event_id=instance.pk, calendar_id=instance.calendar_id)
+
+
+def _publish_on_commit(calendar_id, kind, action, object_id, **extra):
+    transaction.on_commit(lambda: publish_change(calendar_id, kind, action, object_id, **extra))
+
+
+@receiver(post_save, sender=Event)
+def publish_event_saved(sender, instance: Event, created: bool, **kwargs):
+    """일정 생성/수정 알림
+
+    다른 캘린더로 옮겨진 일정은 원래 캘린더에 삭제, 새 캘린더에 생성으로 알린다.
+    """
+    previous_calendar_id = instance.previous_calendar_id
+    if previous_calendar_id:
+        _publish_on_commit(previous_calendar_id, 'event', 'deleted', instance.pk)
+    _publish_on_commit(
+        instance.calendar_id, 'event', 'created' if created or previous_calendar_id else 'updated',
+        instance.pk, updated_at=instance.updated_at.isoformat(),
+    )
+
+
+@receiver(post_delete, sender=Event)
+def publish_event_deleted(sender, instance: Event, **kwargs):
+    """일정 삭제 알림"""
+    _publish_on_commit(instance.calendar_id, 'event', 'deleted', instance.pk)
+
+
+@receiver(post_save, sender=CalendarTag)
+def publish_tag_saved(sender, instance: CalendarTag, created: bool, **kwargs):
+    """태그 생성/수정 알림"""
+    _publish_on_commit(instance.calendar_id, 'tag', 'created' if created else 'updated', instance.pk)
+
+
+@receiver(post_delete, sender=CalendarTag)
+def publish_tag_deleted(sender, instance: CalendarTag, **kwargs):
+    """태그 삭제 알림"""
+    _publish_on_commit(instance.calendar_id, 'tag', 'deleted', instance.pk)
+
+
+@receiver(post_save, sender=CalendarMember)
+def publish_member_saved(sender, instance: CalendarMember, created: bool, **kwargs):
+    """멤버 추가/역할 변경 알림"""
+    _publish_on_commit(
+        instance.calendar_id, 'member', 'created' if created else 'updated', instance.user_id,
+        role=instance.role,
+    )
+
+
+@receiver(post_delete, sender=CalendarMember)
+def publish_member_deleted(sender, instance: CalendarMember, **kwargs):
+    """멤버 삭제(나가기/내보내기) 알림 (해당 사용자의 연결은 이 알림 후 닫힘)"""
+    _publish_on_commit(instance.calendar_id, 'member', 'deleted', instance.user_id)
+
+
+@receiver(post_save, sender=Calendar)
+def publish_calendar_saved(sender, instance: Calendar, created: bool, **kwargs):
+    """캘린더 정보 수정 알림"""
+    if not created:
+        _publish_on_commit(instance.pk, 'calendar', 'updated', instance.pk)
+
+
+@receiver(post_delete, sender=Calendar)
+def publish_calendar_deleted(sender, instance: Calendar, **kwargs):
+    """캘린더 삭제 알림 (구독 중인 연결은 이 알림 후 닫힘)"""
+    _publish_on_commit(instance.pk, 'calendar', 'deleted', instance.pk)
+
+
+@receiver(post_save, sender=Calendar)
+@receiver(post_delete, sender=Calendar)
+@receiver(post_save, sender=CalendarTag)
+@receiver(post_delete, sender=CalendarTag)
+@receiver(post_save, sender=CalendarMember)
+@receiver(post_delete, sender=CalendarMember)
+def invalidate_share_snapshot(sender, instance, **kwargs):
+    """공유 링크 공개 정보에 포함되는 캘린더/태그/멤버가 바뀌면 스냅샷을 지운다."""
+    calendar_id = instance.pk if sender is Calendar else instance.calendar_id
+    invalidate_public_snapshot(calendar_id)
+    if sender is Calendar and kwargs.get('signal') is post_delete:
+        forget_share_token(instance.share_token)
+
+
+@receiver(post_save, sender=Event)
+def invalidate_moved_event_snapshots(sender, instance: Event, **kwargs):
+    """다른 캘린더로 옮겨진 일정은 양쪽 캘린더의 일정 수가 바뀌므로 스냅샷을 지운다."""
+    previous_calendar_id = instance.previous_calendar_id
+    if previous_calendar_id:
+        invalidate_public_snapshot(previous_calendar_id)
+        invalidate_public_snapshot(instance.calendar_id)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=CalendarMember)
+@receiver(post_delete, sender=CalendarMember)
+@receiver(post_delete, sender=CalendarTag)
+def invalidate_stats(sender, instance, **kwargs):
+    """일정/멤버 변경, 태그 삭제(일정의 태그가 비워짐) 시 캘린더 통계 캐시를 지운다.
+    (다른 캘린더로 옮겨진 일정은 원래 캘린더도)
+    """
+    invalidate_calendar_stats(instance.calendar_id)
+    if sender is Event and instance.previous_calendar_id:
+        invalidate_calendar_stats(instance.previous_calendar_id)
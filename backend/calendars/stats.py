@@ -0,0 +1,108 @@
+"""
+캘린더 통계 (GET /api/calendars/<id>/stats/)
+일정(태그별 전체/예정/지난)과 멤버(역할별) 수를 조건부 집계 한 번의 쿼리(UNION ALL)로 계산하고
+캘린더별로 캐시한다. 일정/멤버/태그가 바뀌면 캐시를 지우고, 시간이 지나 예정 일정이
+지난 일정이 되는 시점이 오면 그 전에 만료되도록 캐시 시간을 줄인다.
+
+- 예정(upcoming): 아직 끝나지 않은 일정 (반복 일정은 반복이 끝나지 않은 시리즈)
+- 지난(past): 이미 끝난 일정
+- 멤버 수는 소유자 포함, 소유자는 관리자로 센다
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, CharField, Count, DateTimeField, F, IntegerField, Min, Q, Value, When
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from .models import CalendarMember, Event
+
+# 통계 캐시 최대 보관 시간 (초)
+CALENDAR_STATS_TIMEOUT = getattr(settings, 'CALENDAR_STATS_TIMEOUT', 60 * 5)
+
+COLUMNS = ('kind', 'key', 'total', 'upcoming', 'next_change')
+
+
+def stats_cache_key(calendar_id):
+    return f'calendars:stats:{calendar_id}'
+
+
+def _upcoming(now):
+    single = Q(recurrence_rule='', end_date__gte=now)
+    series = ~Q(recurrence_rule='') & (Q(recurrence_end__isnull=True) | Q(recurrence_end__gte=now))
+    return single | series
+
+
+def load_calendar_stats(calendar_id, now=None):
+    """DB에서 통계를 계산한다. 반환값: (통계 dict, 다음으로 예정 -> 지난 일정이 되는 시각)"""
+    now = now or timezone.now()
+    upcoming = _upcoming(now)
+
+    events = Event.objects.filter(calendar_id=calendar_id).order_by().values('tag_id').annotate(
+        kind=Value('tag', output_field=CharField()),
+        key=Cast('tag_id', CharField()),
+        total=Count('pk'),
+        upcoming=Count('pk', filter=upcoming),
+        # 예정 일정이 끝나는 가장 이른 시각 (반복 일정은 반복 종료 시각)
+        next_change=Min(
+            Case(When(recurrence_rule='', then=F('end_date')), default=F('recurrence_end')),
+            filter=upcoming,
+        ),
+    ).values_list(*COLUMNS)
+    members = CalendarMember.objects.filter(calendar_id=calendar_id).order_by().values('role').annotate(
+        kind=Value('role', output_field=CharField()),
+        key=F('role'),
+        total=Count('pk'),
+        upcoming=Value(0, output_field=IntegerField()),
+        next_change=Value(None, output_field=DateTimeField()),
+    ).values_list(*COLUMNS)
+
+    stats = {
+        'total_events': 0, 'upcoming_events': 0, 'past_events': 0,
+        # 소유자는 CalendarMember 행이 없으므로 관리자 1명으로 미리 셈
+        'total_members': 1, 'admins': 1, 'members': 0,
+        'tags': [],
+    }
+    next_change = None
+    for kind, key, total, upcoming_count, changes_at in events.union(members, all=True):
+        if kind == 'role':
+            stats['total_members'] += total
+            stats['admins' if key == 'admin' else 'members'] += total
+            continue
+        stats['total_events'] += total
+        stats['upcoming_events'] += upcoming_count
+        stats['past_events'] += total - upcoming_count
+        stats['tags'].append({
+            # 태그 없음은 None (SQLite는 UUID를 하이픈 없이 저장하므로 형식을 맞춤)
+            'tag': str(uuid.UUID(key)) if key else None,
+            'total': total,
+            'upcoming': upcoming_count,
+            'past': total - upcoming_count,
+        })
+        if changes_at is not None and (next_change is None or changes_at < next_change):
+            next_change = changes_at
+    stats['tags'].sort(key=lambda item: (-item['total'], item['tag'] or ''))
+    return stats, next_change
+
+
+def get_calendar_stats(calendar_id):
+    """캐시된 통계 (없으면 계산 후 캐시)"""
+    key = stats_cache_key(calendar_id)
+    stats = cache.get(key)
+    if stats is None:
+        now = timezone.now()
+        stats, next_change = load_calendar_stats(calendar_id, now)
+        timeout = CALENDAR_STATS_TIMEOUT
+        if next_change is not None:
+            timeout = max(1, min(timeout, int((next_change - now).total_seconds()) + 1))
+        cache.set(key, stats, timeout)
+    return stats
+
+
+def invalidate_calendar_stats(*calendar_ids):
+    """일정/멤버/태그 변경 시 통계 캐시 삭제 (커밋 후)"""
+    keys = [stats_cache_key(calendar_id) for calendar_id in set(calendar_ids) if calendar_id]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
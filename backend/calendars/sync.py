@@ -0,0 +1,113 @@
+"""
+일정 증분 동기화
+커서 이후에 생성/수정된 일정(updated_at)과 삭제된 일정(EventTombstone)만 반환한다.
+
+커서는 (updated_at, id) / (deleted_at, id) 키셋 위치와 동기화 당시 보이던 캘린더 집합의
+해시를 담은 불투명 문자열이다. 캘린더에 참여/탈퇴해 보이는 캘린더가 바뀌면 증분으로는
+새 캘린더의 기존 일정이나 빠진 캘린더의 삭제를 알릴 수 없으므로 전체 동기화(reset)를 요구한다.
+"""
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# 커밋이 늦게 끝난 트랜잭션의 변경을 놓치지 않도록 최근 N초의 변경은 다음 동기화로 미룬다
+SYNC_SETTLE_SECONDS = getattr(settings, 'EVENT_SYNC_SETTLE_SECONDS', 2)
+
+# 삭제 기록 보관 기간 (이보다 오래된 커서는 전체 동기화 필요)
+TOMBSTONE_RETENTION_DAYS = getattr(settings, 'EVENT_TOMBSTONE_RETENTION_DAYS', 30)
+
+DEFAULT_SYNC_LIMIT = 500
+MAX_SYNC_LIMIT = 1000
+
+
+class CursorExpired(Exception):
+    """삭제 기록 보관 기간이 지났거나 보이는 캘린더가 바뀐 커서"""
+
+
+def calendar_set_hash(calendar_ids):
+    """캘린더 ID 집합의 해시 (순서 무관)"""
+    raw = ','.join(sorted(str(calendar_id) for calendar_id in calendar_ids))
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def encode_cursor(changed, deleted, calendars):
+    payload = {
+        'c': [changed[0].isoformat(), str(changed[1])] if changed else None,
+        'd': [deleted[0].isoformat(), deleted[1]],
+        'v': calendars,
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 -> (changed 위치 또는 None, deleted 위치, 캘린더 집합 해시)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        changed = payload['c']
+        if changed is not None:
+            changed = (parse_datetime(changed[0]), uuid.UUID(changed[1]))
+        deleted = (parse_datetime(payload['d'][0]), int(payload['d'][1]))
+        calendars = payload.get('v')
+    except (binascii.Error, ValueError, KeyError, TypeError, IndexError):
+        raise ValueError('유효하지 않은 동기화 커서입니다.')
+    if (changed and changed[0] is None) or deleted[0] is None:
+        raise ValueError('유효하지 않은 동기화 커서입니다.')
+    return changed, deleted, calendars
+
+
+def after(queryset, field, position):
+    """키셋 조건: (field, id) > position"""
+    value, pk = position
+    return queryset.filter(Q(**{f'{field}__gt': value}) | Q(**{field: value, 'id__gt': pk}))
+
+
+def get_sync_page(events, tombstones, calendar_ids, cursor=None, limit=DEFAULT_SYNC_LIMIT):
+    """동기화 한 페이지를 계산한다.
+
+    events/tombstones는 이미 접근 가능한 캘린더(calendar_ids)로 제한된 queryset이다.
+    커서가 없으면 전체 일정을 처음부터 내려주고, 삭제 기록은 지금 이후 것만 추적한다.
+    커서를 만들 때와 calendar_ids가 다르면 CursorExpired (전체 동기화 필요)
+    반환값: (변경된 일정 목록, 삭제된 일정 ID 목록, 다음 커서, 남은 페이지 여부)
+    """
+    upper = timezone.now() - timedelta(seconds=SYNC_SETTLE_SECONDS)
+    calendars = calendar_set_hash(calendar_ids)
+
+    if cursor:
+        changed_position, deleted_position, cursor_calendars = decode_cursor(cursor)
+        if deleted_position[0] < timezone.now() - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+            raise CursorExpired
+        if cursor_calendars != calendars:
+            raise CursorExpired
+    else:
+        changed_position, deleted_position = None, (upper, 0)
+
+    events = events.filter(updated_at__lte=upper)
+    if changed_position:
+        events = after(events, 'updated_at', changed_position)
+    events = list(events.order_by('updated_at', 'id')[:limit + 1])
+
+    tombstones = after(tombstones.filter(deleted_at__lte=upper), 'deleted_at', deleted_position)
+    tombstones = list(
+        tombstones.order_by('deleted_at', 'id').values_list('id', 'event_id', 'deleted_at')[:limit + 1]
+    )
+
+    has_more = len(events) > limit or len(tombstones) > limit
+    events, tombstones = events[:limit], tombstones[:limit]
+
+    if events:
+        changed_position = (events[-1].updated_at, events[-1].id)
+    if tombstones:
+        deleted_position = (tombstones[-1][2], tombstones[-1][0])
+
+    deleted_ids = [event_id for _, event_id, _ in tombstones]
+    return events, deleted_ids, encode_cursor(changed_position, deleted_position, calendars), has_more
@@ -1,3 +1,1615 @@
+import asyncio
+import io
+import json
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.db.models import Count, F
+from django.db.models.signals import post_delete
 from django.test import TestCase
+from django.template.loader import render_to_string
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from .imports import EventImporter, ImportAborted
+from .models import (
+    Calendar, CalendarInvitation, CalendarMember, CalendarTag, Event, EventImport, EventTombstone,
+)
+from .realtime import websocket_application
+
+
+def aware(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+class CalendarTestMixin:
+    """캘린더 테스트 공용 데이터"""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(email='owner@planpie.com', password='password123')
+        self.member = User.objects.create_user(email='member@planpie.com', password='password123')
+        self.outsider = User.objects.create_user(email='outsider@planpie.com', password='password123')
+        self.calendar = Calendar.objects.create(name='팀 캘린더', owner=self.owner, calendar_type='shared')
+        CalendarMember.objects.create(calendar=self.calendar, user=self.member, role='member')
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def create_event(self, title, start, hours=1, **kwargs):
+        return Event.objects.create(
+            calendar=kwargs.pop('calendar', self.calendar),
+            title=title,
+            start_date=start,
+            end_date=start + timedelta(hours=hours),
+            created_by=kwargs.pop('created_by', self.owner),
+            **kwargs
+        )
+
+
+class EventWindowTests(CalendarTestMixin, TestCase):
+    """start_date/end_date 구간 조회"""
+
+    def setUp(self):
+        super().setUp()
+        self.old = self.create_event('작년 회의', aware(2024, 9, 10, 9))
+        self.inside = self.create_event('9월 회의', aware(2025, 9, 10, 9))
+        # 8월 말에 시작해서 9월까지 이어지는 일정
+        self.overlapping = self.create_event('워크숍', aware(2025, 8, 31, 20), hours=8)
+        self.after = self.create_event('10월 회의', aware(2025, 10, 1, 0))
+
+    def titles(self, response):
+        self.assertEqual(response.status_code, 200, response.data)
+        return {event['title'] for event in response.data}
+
+    def test_calendar_events_returns_overlapping_events_only(self):
+        response = self.client.get(
+            f'/api/calendars/{self.calendar.id}/events/',
+            {'start_date': '2025-09-01', 'end_date': '2025-10-01'},
+        )
+        self.assertEqual(self.titles(response), {'9월 회의', '워크숍'})
+
+    def test_event_list_applies_window(self):
+        response = self.client.get(
+            '/api/events/',
+            {'start_date': '2025-09-01T00:00:00+09:00', 'end_date': '2025-10-01T00:00:00+09:00'},
+        )
+        self.assertEqual(self.titles(response), {'9월 회의', '워크숍'})
+
+    def test_without_window_returns_all_events(self):
+        response = self.client.get(f'/api/calendars/{self.calendar.id}/events/')
+        self.assertEqual(len(self.titles(response)), 4)
+
+    def test_window_wider_than_cap_is_rejected(self):
+        response = self.client.get(
+            '/api/events/', {'start_date': '2024-01-01', 'end_date': '2025-01-01'}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_calendar_id_is_rejected(self):
+        response = self.client.get('/api/events/', {'calendar_id': 'bad'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/events/', {
+            'calendar_id': str(self.calendar.id), 'start_date': '2025-09-01', 'end_date': '2025-10-01',
+        })
+        self.assertEqual(self.titles(response), {'9월 회의', '워크숍'})
+
+    def test_long_event_within_max_duration(self):
+        # 시작이 구간보다 한참 앞서도 최대 길이 이내면 겹치는 일정으로 포함
+        self.create_event('장기 프로젝트', aware(2025, 3, 1), hours=24 * 200)
+        response = self.client.get(
+            '/api/events/', {'start_date': '2025-09-01', 'end_date': '2025-10-01'}
+        )
+        self.assertEqual(self.titles(response), {'9월 회의', '워크숍', '장기 프로젝트'})
+
+    def test_event_longer_than_max_duration_is_rejected(self):
+        response = self.client.post('/api/events/', {
+            'calendar': str(self.calendar.id), 'title': '너무 긴 일정',
+            'start_date': '2024-01-01T00:00:00+09:00', 'end_date': '2025-06-01T00:00:00+09:00',
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.patch(
+            f'/api/events/{self.inside.id}/', {'end_date': '2027-01-01T00:00:00+09:00'}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        with self.assertRaises(ValueError):
+            self.create_event('너무 긴 일정', aware(2024, 1, 1), hours=24 * 400)
+
+    def test_invalid_window_is_rejected(self):
+        response = self.client.get(
+            '/api/events/', {'start_date': '2025-09-10', 'end_date': '2025-09-01'}
+        )
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/events/', {'start_date': 'not-a-date'})
+        self.assertEqual(response.status_code, 400)
+
+
+class CalendarListQueryTests(CalendarTestMixin, TestCase):
+    """CalendarViewSet.list 쿼리 수"""
+
+    def create_calendars(self, count):
+        for index in range(count):
+            calendar = Calendar.objects.create(name=f'캘린더 {index}', owner=self.owner)
+            CalendarMember.objects.create(calendar=calendar, user=self.member, role='admin')
+            self.create_event(f'일정 {index}', aware(2025, 9, 1, 9), calendar=calendar)
+
+    def test_list_query_count_is_constant(self):
+        self.create_calendars(30)
+        # 캘린더(카운트 annotate + 소유자) 1 + 멤버/사용자 1 + 태그 1 + 역할 맵 1
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/calendars/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 31)
+
+    def test_list_counts_and_roles(self):
+        self.create_calendars(2)
+        self.create_event('팀 일정', aware(2025, 9, 1, 9))
+
+        self.client.force_authenticate(self.member)
+        response = self.client.get('/api/calendars/')
+        by_name = {calendar['name']: calendar for calendar in response.data}
+
+        shared = by_name['팀 캘린더']
+        self.assertEqual(shared['member_count'], 2)
+        self.assertEqual(shared['event_count'], 1)
+        self.assertFalse(shared['is_admin'])
+        self.assertTrue(shared['can_leave'])
+        self.assertFalse(shared['can_delete'])
+
+        admin_calendar = by_name['캘린더 0']
+        self.assertTrue(admin_calendar['is_admin'])
+        self.assertTrue(admin_calendar['can_delete'])
+        self.assertEqual(admin_calendar['event_count'], 1)
+
+    def test_owner_cannot_leave(self):
+        response = self.client.get(f'/api/calendars/{self.calendar.id}/')
+        self.assertTrue(response.data['is_admin'])
+        self.assertFalse(response.data['can_leave'])
+        self.assertTrue(response.data['can_delete'])
+
+
+class EventPermissionTests(CalendarTestMixin, TestCase):
+    """요청 단위 권한 맵"""
+
+    def test_event_list_permission_checks_do_not_query_per_event(self):
+        for index in range(50):
+            self.create_event(f'일정 {index}', aware(2025, 9, 1, 9), created_by=self.member)
+
+        self.client.force_authenticate(self.member)
+        # 이벤트(캘린더/태그/생성자 조인) 1 + 역할 맵 1 + ETag 집계 1
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/api/calendars/{self.calendar.id}/events/')
+        self.assertEqual(len(response.data), 50)
+        self.assertTrue(all(event['can_edit'] and event['can_delete'] for event in response.data))
+
+    def test_member_cannot_delete_other_members_event(self):
+        event = self.create_event('소유자 일정', aware(2025, 9, 1, 9))
+        self.client.force_authenticate(self.member)
+
+        response = self.client.get(f'/api/events/{event.id}/')
+        self.assertTrue(response.data['can_edit'])
+        self.assertFalse(response.data['can_delete'])
+
+        response = self.client.delete(f'/api/events/{event.id}/')
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(Event.objects.filter(id=event.id).exists())
+
+    def test_outsider_cannot_create_event(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.post('/api/events/', {
+            'calendar': str(self.calendar.id),
+            'title': '침입',
+            'start_date': '2025-09-01T09:00:00+09:00',
+            'end_date': '2025-09-01T10:00:00+09:00',
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Event.objects.filter(title='침입').exists())
+
+    def test_join_by_link_adds_member(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.post('/api/calendars/join/', {'share_token': self.calendar.share_token})
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertTrue(response.data['calendar']['can_leave'])
+
+        response = self.client.post('/api/calendars/join/', {'share_token': self.calendar.share_token})
+        self.assertEqual(response.status_code, 400)
+
+    def test_only_admin_can_delete_calendar(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.delete(f'/api/calendars/{self.calendar.id}/')
+        self.assertEqual(response.status_code, 403)
+
+
+class CachedRoleMapTests(CalendarTestMixin, TestCase):
+    """역할 맵 캐시와 시그널 무효화"""
+
+    def calendar_names(self):
+        response = self.client.get('/api/calendars/')
+        return {calendar['name'] for calendar in response.data}
+
+    def test_role_map_is_served_from_cache(self):
+        self.client.get('/api/calendars/')
+        # 캐시 적중 시 역할 맵 쿼리 없음: 캘린더 1 + 멤버 1 + 태그 1
+        with self.assertNumQueries(3):
+            self.client.get('/api/calendars/')
+
+    def test_membership_changes_invalidate_cache(self):
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.calendar_names(), set())
+
+        membership = CalendarMember.objects.create(calendar=self.calendar, user=self.outsider)
+        self.assertEqual(self.calendar_names(), {'팀 캘린더'})
+
+        membership.role = 'admin'
+        membership.save()
+        response = self.client.get(f'/api/calendars/{self.calendar.id}/')
+        self.assertTrue(response.data['is_admin'])
+
+        membership.delete()
+        self.assertEqual(self.calendar_names(), set())
+
+    def test_calendar_create_and_delete_invalidate_owner_cache(self):
+        self.assertEqual(self.calendar_names(), {'팀 캘린더'})
+        calendar = Calendar.objects.create(name='새 캘린더', owner=self.owner)
+        self.assertEqual(self.calendar_names(), {'팀 캘린더', '새 캘린더'})
+
+        calendar.delete()
+        self.assertEqual(self.calendar_names(), {'팀 캘린더'})
+
+    def test_calendar_delete_invalidates_member_cache(self):
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.calendar_names(), {'팀 캘린더'})
+        self.calendar.delete()
+        self.assertEqual(self.calendar_names(), set())
+
+    def test_check_calendars_uses_role_map(self):
+        Calendar.objects.create(name='개인', owner=self.member)
+        self.client.force_authenticate(self.member)
+        response = self.client.get('/api/calendars/check_calendars/')
+        self.assertEqual(response.data['owned_count'], 1)
+        self.assertEqual(response.data['member_count'], 1)
+        self.assertTrue(response.data['has_calendars'])
+
+
+class VisibilityQueryTests(CalendarTestMixin, TestCase):
+    """DISTINCT 없는 가시성 쿼리"""
+
+    def setUp(self):
+        super().setUp()
+        # 소유자이면서 멤버로도 등록된 경우에도 일정이 중복되면 안 된다
+        CalendarMember.objects.create(calendar=self.calendar, user=self.owner, role='admin')
+        Calendar.objects.create(name='다른 캘린더', owner=self.outsider)
+        self.event = self.create_event('회의', aware(2025, 9, 1, 9))
+
+    def test_event_visible_to_has_no_duplicates_or_distinct(self):
+        queryset = Event.objects.visible_to(self.owner)
+        self.assertNotIn('DISTINCT', str(queryset.query))
+        self.assertEqual(list(queryset), [self.event])
+        self.assertEqual(list(Event.objects.visible_to(self.outsider)), [])
+
+    def test_calendar_visible_to(self):
+        self.assertEqual(list(Calendar.objects.visible_to(self.member)), [self.calendar])
+        self.assertEqual(list(Calendar.objects.visible_to(self.owner)), [self.calendar])
+
+    def test_large_calendar_sets_use_subquery(self):
+        with mock.patch('calendars.permissions.MAX_INLINE_CALENDAR_IDS', 0):
+            response = self.client.get('/api/events/')
+        self.assertEqual([event['title'] for event in response.data['results']], ['회의'])
+
+
+class RecurringEventTests(CalendarTestMixin, TestCase):
+    """반복 일정 전개"""
+
+    def setUp(self):
+        super().setUp()
+        # 매주 월요일 09:00 (KST), 10년
+        self.series = self.create_event(
+            '주간 회의', aware(2025, 9, 1, 9), recurrence_rule='FREQ=WEEKLY;BYDAY=MO;COUNT=520'
+        )
+
+    def get_events(self, start, end):
+        response = self.client.get(
+            f'/api/calendars/{self.calendar.id}/events/', {'start_date': start, 'end_date': end}
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_series_is_stored_as_single_row(self):
+        self.assertEqual(Event.objects.count(), 1)
+        self.assertEqual(self.series.recurrence_end, aware(2035, 8, 13, 10))
+
+    def test_occurrences_are_expanded_in_window(self):
+        events = self.get_events('2025-09-01', '2025-10-01')
+        self.assertEqual(
+            [event['start_date'][:10] for event in events],
+            ['2025-09-01', '2025-09-08', '2025-09-15', '2025-09-22', '2025-09-29'],
+        )
+        self.assertTrue(all(event['id'] == str(self.series.id) for event in events))
+        self.assertTrue(all(event['is_recurring'] for event in events))
+
+        # 수년 뒤 구간도 같은 한 행에서 계산
+        events = self.get_events('2030-01-01', '2030-01-15')
+        self.assertEqual([event['start_date'][:10] for event in events], ['2030-01-07', '2030-01-14'])
+
+    def test_exdates_and_overrides(self):
+        self.series.recurrence_exdates = ['2025-09-08T09:00:00+09:00']
+        self.series.save()
+        response = self.client.post('/api/events/', {
+            'calendar': str(self.calendar.id),
+            'title': '주간 회의 (장소 변경)',
+            'start_date': '2025-09-15T14:00:00+09:00',
+            'end_date': '2025-09-15T15:00:00+09:00',
+            'recurrence_parent': str(self.series.id),
+            'recurrence_id': '2025-09-15T09:00:00+09:00',
+        })
+        self.assertEqual(response.status_code, 201, response.data)
+
+        events = self.get_events('2025-09-01', '2025-09-22')
+        self.assertEqual(
+            [(event['title'], event['start_date'][:16]) for event in events],
+            [
+                ('주간 회의', '2025-09-01T09:00'),
+                ('주간 회의 (장소 변경)', '2025-09-15T14:00'),
+            ],
+        )
+
+    def test_finished_series_is_filtered_out(self):
+        self.create_event('끝난 반복', aware(2020, 1, 1, 9), recurrence_rule='FREQ=DAILY;COUNT=3')
+        events = self.get_events('2025-09-01', '2025-09-02')
+        self.assertEqual([event['title'] for event in events], ['주간 회의'])
+
+    def test_invalid_rule_is_rejected(self):
+        response = self.client.post('/api/events/', {
+            'calendar': str(self.calendar.id),
+            'title': '잘못된 반복',
+            'start_date': '2025-09-01T09:00:00+09:00',
+            'end_date': '2025-09-01T10:00:00+09:00',
+            'recurrence_rule': 'FREQ=MINUTELY',
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('recurrence_rule', response.data)
+
+    def test_unbounded_rules_are_rejected(self):
+        for rule in (
+            'FREQ=DAILY;UNTIL=99991231T000000Z',
+            'FREQ=DAILY;BYHOUR=0,1,2,3;BYMINUTE=0,30',
+        ):
+            response = self.client.post('/api/events/', {
+                'calendar': str(self.calendar.id),
+                'title': '무한에 가까운 반복',
+                'start_date': '2025-09-01T09:00:00+09:00',
+                'end_date': '2025-09-01T10:00:00+09:00',
+                'recurrence_rule': rule,
+            })
+            self.assertEqual(response.status_code, 400, rule)
+            self.assertIn('recurrence_rule', response.data)
+
+        # 모델에 직접 저장해도 전체 발생을 만들지 않고 거부
+        with self.assertRaises(ValueError):
+            self.create_event('먼 UNTIL', aware(2025, 9, 1, 9), recurrence_rule='FREQ=DAILY;UNTIL=99991231T000000Z')
+
+    def test_until_within_limit_sets_recurrence_end(self):
+        event = self.create_event(
+            '긴 반복', aware(2025, 9, 1, 9), recurrence_rule='FREQ=DAILY;UNTIL=20450831T000000Z'
+        )
+        self.assertEqual(event.recurrence_end, aware(2045, 8, 31, 10))
+
+    def test_until_forms(self):
+        # 날짜만(그날 포함), 로컬 시간(floating), UTC
+        for until, last_start in (
+            ('20250915', aware(2025, 9, 15, 9)),
+            ('20250915T090000', aware(2025, 9, 15, 9)),
+            ('20250915T000000Z', aware(2025, 9, 15, 9)),
+            ('20250915T085959', aware(2025, 9, 8, 9)),
+        ):
+            response = self.client.post('/api/events/', {
+                'calendar': str(self.calendar.id),
+                'title': f'UNTIL {until}',
+                'start_date': '2025-09-01T09:00:00+09:00',
+                'end_date': '2025-09-01T10:00:00+09:00',
+                'recurrence_rule': f'FREQ=WEEKLY;UNTIL={until}',
+            })
+            self.assertEqual(response.status_code, 201, (until, response.data))
+            event = Event.objects.get(pk=response.data['id'])
+            self.assertEqual(event.recurrence_end, last_start + timedelta(hours=1), until)
+
+
+@mock.patch('calendars.sync.SYNC_SETTLE_SECONDS', 0)
+class EventSyncTests(CalendarTestMixin, TestCase):
+    """증분 동기화"""
+
+    def sync(self, cursor=None, **params):
+        if cursor:
+            params['cursor'] = cursor
+        response = self.client.get('/api/events/sync/', params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_initial_sync_then_deltas(self):
+        first = self.create_event('첫 일정', aware(2025, 9, 1, 9))
+        second = self.create_event('둘째 일정', aware(2025, 9, 2, 9))
+
+        data = self.sync()
+        self.assertEqual({event['title'] for event in data['events']}, {'첫 일정', '둘째 일정'})
+        self.assertEqual(data['deleted'], [])
+
+        # 변경 없음
+        data = self.sync(data['cursor'])
+        self.assertEqual(data['events'], [])
+
+        first.title = '첫 일정 (수정)'
+        first.save()
+        second_id = second.id
+        second.delete()
+        data = self.sync(data['cursor'])
+        self.assertEqual([event['title'] for event in data['events']], ['첫 일정 (수정)'])
+        self.assertEqual(data['deleted'], [second_id])
+        self.assertFalse(data['has_more'])
+
+    def test_pagination(self):
+        for index in range(5):
+            self.create_event(f'일정 {index}', aware(2025, 9, 1, 9))
+
+        titles = []
+        data = self.sync(limit=2)
+        titles += [event['title'] for event in data['events']]
+        while data['has_more']:
+            data = self.sync(data['cursor'], limit=2)
+            titles += [event['title'] for event in data['events']]
+        self.assertEqual(sorted(titles), [f'일정 {index}' for index in range(5)])
+
+    def test_other_users_changes_are_not_visible(self):
+        data = self.sync()
+        other = Calendar.objects.create(name='남의 캘린더', owner=self.outsider)
+        event = self.create_event('비공개', aware(2025, 9, 1, 9), calendar=other)
+        event.delete()
+        data = self.sync(data['cursor'])
+        self.assertEqual(data['events'], [])
+        self.assertEqual(data['deleted'], [])
+
+    def test_calendar_delete_does_not_write_tombstones(self):
+        self.create_event('일정', aware(2025, 9, 1, 9))
+        self.calendar.delete()
+        self.assertFalse(EventTombstone.objects.exists())
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/events/sync/', {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/events/sync/', {'calendar_id': 'bad'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_joining_or_leaving_calendar_requires_reset(self):
+        data = self.sync()
+        other = Calendar.objects.create(name='팀 캘린더', owner=self.outsider)
+        self.create_event('예전 팀 일정', aware(2025, 8, 1, 9), calendar=other)
+
+        # 참여 전 일정은 updated_at이 커서보다 앞서도 전체 동기화로 받아야 함
+        membership = CalendarMember.objects.create(calendar=other, user=self.owner, role='member')
+        response = self.client.get('/api/events/sync/', {'cursor': data['cursor']})
+        self.assertEqual(response.status_code, 410)
+        self.assertTrue(response.data['reset'])
+
+        data = self.sync()
+        self.assertIn('예전 팀 일정', {event['title'] for event in data['events']})
+        self.assertEqual(self.sync(data['cursor'])['events'], [])
+
+        # 탈퇴하면 빠진 캘린더의 일정을 지우도록 다시 전체 동기화
+        membership.delete()
+        response = self.client.get('/api/events/sync/', {'cursor': data['cursor']})
+        self.assertEqual(response.status_code, 410)
+        self.assertNotIn('예전 팀 일정', {event['title'] for event in self.sync()['events']})
+
+
+class RealtimeTests(CalendarTestMixin, TestCase):
+    """캘린더 변경 알림 WebSocket"""
+
+    def connect(self, user, actions):
+        """WebSocket 앱에 접속해 actions(동기 함수)를 실행하고 받은 메시지를 반환한다."""
+        token = str(RefreshToken.for_user(user).access_token) if user else ''
+
+        async def run():
+            incoming = asyncio.Queue()
+            sent = []
+            await incoming.put({'type': 'websocket.connect'})
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {
+                'type': 'websocket',
+                'path': f'/ws/calendars/{self.calendar.id}/',
+                'query_string': f'token={token}'.encode(),
+            }
+            app = asyncio.ensure_future(websocket_application(scope, incoming.get, send))
+            await asyncio.sleep(0.05)
+            if sent and sent[0]['type'] == 'websocket.accept':
+                await sync_to_async(actions)()
+                await asyncio.sleep(0.05)
+            await incoming.put({'type': 'websocket.disconnect', 'code': 1000})
+            await asyncio.wait_for(app, timeout=1)
+            return sent
+
+        return async_to_sync(run)()
+
+    def test_member_receives_changes(self):
+        def actions():
+            with self.captureOnCommitCallbacks(execute=True):
+                event = self.create_event('회의', aware(2025, 9, 1, 9))
+            with self.captureOnCommitCallbacks(execute=True):
+                event.delete()
+
+        sent = self.connect(self.member, actions)
+        self.assertEqual(sent[0]['type'], 'websocket.accept')
+        messages = [json.loads(message['text']) for message in sent[1:]]
+        self.assertEqual([message['type'] for message in messages], ['event.created', 'event.deleted'])
+        self.assertEqual(messages[0]['calendar_id'], str(self.calendar.id))
+
+    def test_non_member_is_rejected(self):
+        sent = self.connect(self.outsider, lambda: None)
+        self.assertEqual(sent, [{'type': 'websocket.close', 'code': 4403}])
+
+    def test_missing_token_is_rejected(self):
+        sent = self.connect(None, lambda: None)
+        self.assertEqual(sent, [{'type': 'websocket.close', 'code': 4403}])
+
+    def test_removed_member_is_disconnected(self):
+        def actions():
+            with self.captureOnCommitCallbacks(execute=True):
+                CalendarMember.objects.filter(calendar=self.calendar, user=self.member).delete()
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create_event('내보낸 뒤 일정', aware(2025, 9, 1, 9))
+
+        sent = self.connect(self.member, actions)
+        self.assertEqual(json.loads(sent[1]['text'])['type'], 'member.deleted')
+        self.assertEqual(sent[2:], [{'type': 'websocket.close', 'code': 4403}])
+
+    def test_other_members_stay_connected(self):
+        other = User.objects.create_user(email='other@planpie.com', password='password123')
+        CalendarMember.objects.create(calendar=self.calendar, user=other, role='member')
+
+        def actions():
+            with self.captureOnCommitCallbacks(execute=True):
+                CalendarMember.objects.filter(calendar=self.calendar, user=other).delete()
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create_event('회의', aware(2025, 9, 1, 9))
+
+        sent = self.connect(self.member, actions)
+        self.assertEqual(
+            [json.loads(message['text'])['type'] for message in sent[1:]], ['member.deleted', 'event.created']
+        )
+
+    def test_calendar_delete_disconnects(self):
+        def actions():
+            with self.captureOnCommitCallbacks(execute=True):
+                self.calendar.delete()
+
+        # 소유자는 멤버 행이 없으므로 캘린더 삭제 알림으로 닫힘
+        sent = self.connect(self.owner, actions)
+        self.assertEqual(json.loads(sent[-2]['text'])['type'], 'calendar.deleted')
+        self.assertEqual(sent[-1], {'type': 'websocket.close', 'code': 4403})
+
+
+class ConditionalGetTests(CalendarTestMixin, TestCase):
+    """ETag / If-None-Match"""
+
+    def setUp(self):
+        super().setUp()
+        self.event = self.create_event('회의', aware(2025, 9, 10, 9))
+
+    def revalidate(self, url, params=None):
+        first = self.client.get(url, params)
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+        return etag, self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_resources_return_not_modified(self):
+        for url in ('', 'tags/', 'members/', 'events/'):
+            with self.subTest(url=url):
+                _, response = self.revalidate(f'/api/calendars/{self.calendar.id}/{url}')
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b'')
+
+    def test_not_modified_skips_serialization(self):
+        etag, _ = self.revalidate(f'/api/calendars/{self.calendar.id}/events/')
+        # ETag 집계 1 (역할 맵은 캐시)
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                f'/api/calendars/{self.calendar.id}/events/', HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_event_change_updates_etag(self):
+        url = f'/api/calendars/{self.calendar.id}/events/'
+        etag, _ = self.revalidate(url)
+        self.event.title = '변경된 회의'
+        self.event.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_event_delete_updates_etag(self):
+        url = f'/api/calendars/{self.calendar.id}/events/'
+        etag, _ = self.revalidate(url)
+        self.event.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_window_is_part_of_etag(self):
+        url = f'/api/calendars/{self.calendar.id}/events/'
+        etag, _ = self.revalidate(url, {'start_date': '2025-09-01', 'end_date': '2025-10-01'})
+        response = self.client.get(
+            url, {'start_date': '2025-10-01', 'end_date': '2025-11-01'}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_override_moved_out_of_window_updates_etag(self):
+        series = self.create_event('주간 회의', aware(2025, 9, 1, 9), recurrence_rule='FREQ=WEEKLY;COUNT=10')
+        url = f'/api/calendars/{self.calendar.id}/events/'
+        window = {'start_date': '2025-09-01', 'end_date': '2025-10-01'}
+        etag, _ = self.revalidate(url, window)
+
+        # 9/8 발생을 11월로 옮기면 구간 안의 행은 그대로지만 9월 발생이 하나 줄어듦
+        self.create_event(
+            '주간 회의 (이동)', aware(2025, 11, 3, 9),
+            recurrence_parent=series, recurrence_id=aware(2025, 9, 8, 9),
+        )
+        response = self.client.get(url, window, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len([event for event in response.data if event['title'] == '주간 회의']), 4)
+
+    def test_member_role_change_updates_etag(self):
+        url = f'/api/calendars/{self.calendar.id}/members/'
+        etag, _ = self.revalidate(url)
+        membership = CalendarMember.objects.get(calendar=self.calendar, user=self.member)
+        membership.role = 'admin'
+        membership.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_depends_on_user_role(self):
+        url = f'/api/calendars/{self.calendar.id}/'
+        owner_etag, _ = self.revalidate(url)
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=owner_etag).status_code, 200)
+
+    def test_outsider_gets_not_found_without_etag(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.get(f'/api/calendars/{self.calendar.id}/tags/', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header('ETag'))
+
+
+class KeysetPaginationTests(CalendarTestMixin, TestCase):
+    """(start_date, id) / (created_at, id) 키셋 페이지네이션"""
+
+    def follow(self, url, params):
+        pages = []
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200, response.data)
+            pages.append(response.data['results'])
+            url, params = response.data['next'], None
+        return pages
+
+    def test_event_pages_follow_meta_ordering_with_ties(self):
+        start = aware(2025, 9, 1, 9)
+        # 같은 시작 시간이 페이지 경계에 걸치도록 구성
+        events = [self.create_event(f'동시 {index}', start) for index in range(5)]
+        events.append(self.create_event('나중', start + timedelta(days=1)))
+
+        pages = self.follow('/api/events/', {'limit': 2})
+        self.assertEqual([len(page) for page in pages], [2, 2, 2])
+        ids = [event['id'] for page in pages for event in page]
+        expected = sorted(events, key=lambda event: (event.start_date, str(event.id)))
+        self.assertEqual(ids, [str(event.id) for event in expected])
+
+    def test_insert_before_cursor_does_not_shift_pages(self):
+        for day in range(1, 5):
+            self.create_event(f'{day}일', aware(2025, 9, day, 9))
+        first = self.client.get('/api/events/', {'limit': 2}).data
+        self.create_event('앞쪽 추가', aware(2025, 8, 1, 9))
+        second = self.client.get(first['next']).data
+        self.assertEqual([event['title'] for event in second['results']], ['3일', '4일'])
+        self.assertIsNone(second['next'])
+
+    def test_window_query_still_returns_array(self):
+        self.create_event('회의', aware(2025, 9, 10, 9))
+        response = self.client.get('/api/events/', {'start_date': '2025-09-01', 'end_date': '2025-10-01'})
+        self.assertIsInstance(response.data, list)
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get('/api/events/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_calendar_list_paginates_only_when_requested(self):
+        for index in range(3):
+            Calendar.objects.create(name=f'개인 {index}', owner=self.owner)
+        self.assertIsInstance(self.client.get('/api/calendars/').data, list)
+
+        pages = self.follow('/api/calendars/', {'limit': 3})
+        self.assertEqual([len(page) for page in pages], [3, 1])
+        created = [calendar['created_at'] for page in pages for calendar in page]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+
+class EventBatchTests(CalendarTestMixin, TestCase):
+    """POST /api/events/batch/"""
+
+    def setUp(self):
+        super().setUp()
+        self.tag = self.calendar.tags.create(name='업무', color='#123456')
+        self.existing = self.create_event('기존 일정', aware(2025, 9, 1, 9))
+        self.removed = self.create_event('지울 일정', aware(2025, 9, 2, 9))
+
+    def new_event(self, title, day):
+        return {
+            'calendar': str(self.calendar.id),
+            'title': title,
+            'tag_id': str(self.tag.id),
+            'start_date': aware(2025, 9, day, 9).isoformat(),
+            'end_date': aware(2025, 9, day, 10).isoformat(),
+        }
+
+    def test_mixed_operations_in_one_request(self):
+        before = timezone.now()
+        operations = [{'op': 'create', 'data': self.new_event(f'일정 {day}', day)} for day in range(3, 23)]
+        operations += [
+            {'op': 'update', 'id': str(self.existing.id), 'data': {'title': '옮긴 일정', 'tag_id': str(self.tag.id)}},
+            {'op': 'delete', 'id': str(self.removed.id)},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/events/batch/', {'operations': operations}, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+
+        results = response.data['results']
+        self.assertEqual([result['status'] for result in results], [201] * 20 + [200, 204])
+        self.assertEqual(results[0]['event']['tag']['id'], str(self.tag.id))
+        self.assertEqual(Event.objects.filter(calendar=self.calendar).count(), 21)
+
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.title, '옮긴 일정')
+        # bulk_update에서도 증분 동기화 기준 시간이 갱신된다
+        self.assertGreaterEqual(self.existing.updated_at, before)
+        self.assertTrue(EventTombstone.objects.filter(event_id=self.removed.id).exists())
+
+    def test_query_count_does_not_grow_with_operations(self):
+        def run(count, offset):
+            operations = [
+                {'op': 'create', 'data': self.new_event(f'일정 {day}', day)}
+                for day in range(offset, offset + count)
+            ]
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post('/api/events/batch/', {'operations': operations}, format='json')
+            self.assertEqual(response.status_code, 200, response.data)
+            return len(queries)
+
+        self.assertEqual(run(2, 3), run(20, 5))
+
+    def test_any_failure_rolls_back_everything(self):
+        operations = [
+            {'op': 'create', 'data': self.new_event('정상', 3)},
+            {'op': 'create', 'data': {**self.new_event('태그 오류', 4), 'tag_id': str(uuid.uuid4())}},
+            {'op': 'delete', 'id': str(uuid.uuid4())},
+        ]
+        response = self.client.post('/api/events/batch/', {'operations': operations}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([(r['index'], r['status']) for r in response.data['results']], [(1, 400), (2, 404)])
+        self.assertIn('tag_id', response.data['results'][0]['errors'])
+        self.assertFalse(Event.objects.filter(title='정상').exists())
+
+    def test_member_cannot_delete_others_events(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.post(
+            '/api/events/batch/', {'operations': [{'op': 'delete', 'id': str(self.existing.id)}]}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['results'][0]['status'], 403)
+        self.assertTrue(Event.objects.filter(pk=self.existing.pk).exists())
+
+    def test_outsider_cannot_write_to_calendar(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.post(
+            '/api/events/batch/', {'operations': [{'op': 'create', 'data': self.new_event('침입', 3)}]}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('calendar', response.data['results'][0]['errors'])
+
+    def test_duplicate_override_conflicts(self):
+        series = self.create_event('매일', aware(2025, 9, 1, 9), recurrence_rule='FREQ=DAILY;COUNT=10')
+        self.create_event(
+            '변경됨', aware(2025, 9, 2, 11), recurrence_parent=series, recurrence_id=aware(2025, 9, 2, 9),
+        )
+
+        def override(day):
+            return {'op': 'create', 'data': {
+                **self.new_event(f'변경 {day}', day),
+                'recurrence_parent': str(series.id), 'recurrence_id': aware(2025, 9, day, 9).isoformat(),
+            }}
+
+        response = self.client.post('/api/events/batch/', {'operations': [
+            override(2), override(3), override(3), override(4),
+        ]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([(r['index'], r['status']) for r in response.data['results']], [(0, 409), (2, 409)])
+        self.assertEqual(series.overrides.count(), 1)
+
+    def test_other_integrity_errors_are_generic_conflicts(self):
+        with mock.patch.object(Event.objects, 'bulk_create', side_effect=IntegrityError('other constraint')):
+            response = self.client.post(
+                '/api/events/batch/', {'operations': [{'op': 'create', 'data': self.new_event('일정', 3)}]},
+                format='json',
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['results'][0]['status'], 409)
+        self.assertNotIn('개별 수정', response.data['results'][0]['errors']['error'])
+
+    def test_operation_limit(self):
+        operations = [{'op': 'delete', 'id': str(uuid.uuid4())} for _ in range(101)]
+        response = self.client.post('/api/events/batch/', {'operations': operations}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('100', response.data['error'])
+
+
+class UpdateTagsTests(CalendarTestMixin, TestCase):
+    """PUT /api/calendars/<id>/update_tags/"""
+
+    def setUp(self):
+        super().setUp()
+        self.tags = [
+            self.calendar.tags.create(name=f'태그 {index}', color=f'#00000{index}', order=index)
+            for index in range(10)
+        ]
+
+    def put(self, tags):
+        return self.client.put(
+            f'/api/calendars/{self.calendar.id}/update_tags/', {'tags': tags}, format='json'
+        )
+
+    def payload(self, tag, **changes):
+        return {'id': str(tag.id), 'name': tag.name, 'color': tag.color, 'order': tag.order, **changes}
+
+    def test_color_swap(self):
+        first, second = self.tags[:2]
+        response = self.put([
+            self.payload(first, color=second.color),
+            self.payload(second, color=first.color),
+        ])
+        self.assertEqual(response.status_code, 200, response.data)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.color, second.color), ('#000001', '#000000'))
+
+    def test_constant_query_count(self):
+        # 캘린더 1 + 역할 맵 1 + 태그 1 + 임시 색상 1 + 최종 저장 1 (+ 트랜잭션 savepoint 2)
+        rotated = [
+            self.payload(tag, name=f'새 이름 {index}', color=self.tags[(index + 1) % 10].color)
+            for index, tag in enumerate(self.tags)
+        ]
+        with self.assertNumQueries(7):
+            response = self.put(rotated)
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            [tag['color'] for tag in response.data],
+            [f'#00000{(index + 1) % 10}' for index in range(10)],
+        )
+
+    def test_duplicate_color_is_rejected(self):
+        response = self.put([self.payload(self.tags[0], color=self.tags[1].color)])
+        self.assertEqual(response.status_code, 400)
+        self.tags[0].refresh_from_db()
+        self.assertEqual(self.tags[0].color, '#000000')
+
+    def test_invalid_color_is_rejected(self):
+        response = self.put([self.payload(self.tags[0], color='red')])
+        self.assertEqual(response.status_code, 400)
+
+    def test_member_cannot_update_tags(self):
+        self.client.force_authenticate(self.member)
+        response = self.put([self.payload(self.tags[0], name='변경')])
+        self.assertEqual(response.status_code, 403)
+
+
+class ICalendarExportTests(CalendarTestMixin, TestCase):
+    """GET /api/calendars/<id>/export/, /api/calendars/export/"""
+
+    def read(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        content = b''.join(response.streaming_content).decode()
+        self.assertTrue(all(len(line.encode()) <= 75 for line in content.split('\r\n')))
+        # 접힌 줄을 펼쳐서 비교
+        return content.replace('\r\n ', '').split('\r\n')
+
+    def test_calendar_export(self):
+        tag = self.calendar.tags.create(name='업무', color='#123456')
+        self.create_event('회의; 주간, 정기' * 5, aware(2025, 9, 1, 9), tag=tag, description='1줄\n2줄')
+        Event.objects.create(
+            calendar=self.calendar, title='휴가', all_day=True, created_by=self.owner,
+            start_date=aware(2025, 9, 10, 0), end_date=aware(2025, 9, 12, 23, 59, 59),
+        )
+        series = self.create_event(
+            '스탠드업', aware(2025, 9, 1, 9), recurrence_rule='FREQ=DAILY;COUNT=5',
+            recurrence_exdates=[aware(2025, 9, 2, 9).isoformat()],
+        )
+        self.create_event(
+            '스탠드업 (변경)', aware(2025, 9, 3, 10),
+            recurrence_parent=series, recurrence_id=aware(2025, 9, 3, 9),
+        )
+
+        lines = self.read(self.client.get(f'/api/calendars/{self.calendar.id}/export/'))
+        self.assertEqual((lines[0], lines[-2]), ('BEGIN:VCALENDAR', 'END:VCALENDAR'))
+        self.assertEqual(lines.count('BEGIN:VEVENT'), 4)
+        # TZID가 참조하는 시간대 정의가 일정보다 먼저 나온다
+        vtimezone = lines[lines.index('BEGIN:VTIMEZONE'):lines.index('END:VTIMEZONE') + 1]
+        self.assertLess(lines.index('END:VTIMEZONE'), lines.index('BEGIN:VEVENT'))
+        self.assertEqual(vtimezone[:8], [
+            'BEGIN:VTIMEZONE', 'TZID:Asia/Seoul', 'BEGIN:STANDARD', 'DTSTART:19700101T090000',
+            'TZOFFSETFROM:+0900', 'TZOFFSETTO:+0900', 'TZNAME:KST', 'END:STANDARD',
+        ])
+        # 1987~88년 서머타임 전환도 포함
+        self.assertIn('DTSTART:19870510T020000', vtimezone)
+        self.assertIn('TZOFFSETTO:+1000', vtimezone)
+        self.assertIn('SUMMARY:' + '회의\; 주간\\, 정기' * 5, lines)
+        self.assertIn('DESCRIPTION:1줄\\n2줄', lines)
+        self.assertIn('CATEGORIES:업무', lines)
+        # 종일 일정: 9/10~9/12 -> DTEND는 배타적 종료일 9/13
+        self.assertIn('DTSTART;VALUE=DATE:20250910', lines)
+        self.assertIn('DTEND;VALUE=DATE:20250913', lines)
+        self.assertIn('RRULE:FREQ=DAILY;COUNT=5', lines)
+        # 반복 일정은 규칙을 펼치는 기준인 현지 시각(TZID)으로
+        self.assertIn('DTSTART;TZID=Asia/Seoul:20250901T090000', lines)
+        self.assertIn('EXDATE;TZID=Asia/Seoul:20250902T090000', lines)
+        self.assertEqual(lines.count(f'UID:{series.id}@planpie'), 2)
+        self.assertIn('RECURRENCE-ID;TZID=Asia/Seoul:20250903T090000', lines)
+
+    def test_recurring_round_trip(self):
+        # 현지 08:00은 UTC로 전날 23:00이라 UTC로 펼치면 BYDAY 요일이 달라짐
+        weekly = self.create_event(
+            '정기 회의', aware(2025, 9, 1, 8), recurrence_rule='FREQ=WEEKLY;BYDAY=MO,WE;COUNT=6',
+            recurrence_exdates=[aware(2025, 9, 3, 8).isoformat()],
+        )
+        self.create_event(
+            '정기 회의 (변경)', aware(2025, 9, 8, 11),
+            recurrence_parent=weekly, recurrence_id=aware(2025, 9, 8, 8),
+        )
+        daily = Event.objects.create(
+            calendar=self.calendar, title='당직', all_day=True, created_by=self.owner,
+            start_date=aware(2025, 9, 1, 0), end_date=aware(2025, 9, 1, 23, 59, 59),
+            recurrence_rule='FREQ=DAILY;COUNT=4', recurrence_exdates=[aware(2025, 9, 2, 0).isoformat()],
+        )
+        Event.objects.create(
+            calendar=self.calendar, title='당직 (변경)', all_day=True, created_by=self.owner,
+            start_date=aware(2025, 9, 3, 0), end_date=aware(2025, 9, 3, 23, 59, 59),
+            recurrence_parent=daily, recurrence_id=aware(2025, 9, 3, 0),
+        )
+
+        response = self.client.get(f'/api/calendars/{self.calendar.id}/export/')
+        content = b''.join(response.streaming_content)
+        lines = content.decode().replace('\r\n ', '').split('\r\n')
+        self.assertIn('DTSTART;TZID=Asia/Seoul:20250901T080000', lines)
+        self.assertIn('EXDATE;VALUE=DATE:20250902', lines)
+        self.assertIn('RECURRENCE-ID;VALUE=DATE:20250903', lines)
+
+        copy = Calendar.objects.create(name='사본', owner=self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f'/api/calendars/{copy.id}/import/',
+                {'file': SimpleUploadedFile('export.ics', content, content_type='text/calendar')},
+                format='multipart',
+            )
+        self.assertEqual(response.status_code, 202, response.data)
+
+        def occurrences(calendar):
+            response = self.client.get(
+                f'/api/calendars/{calendar.id}/events/',
+                {'start_date': '2025-09-01', 'end_date': '2025-09-30'},
+            )
+            return sorted((event['title'], event['start_date'], event['all_day']) for event in response.data)
+
+        original = occurrences(self.calendar)
+        self.assertEqual(len(original), 5 + 3)
+        self.assertEqual(occurrences(copy), original)
+
+    def test_accepts_text_calendar(self):
+        response = self.client.get(
+            f'/api/calendars/{self.calendar.id}/export/', HTTP_ACCEPT='text/calendar'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_user_export_covers_visible_calendars_only(self):
+        personal = Calendar.objects.create(name='개인', owner=self.owner)
+        hidden = Calendar.objects.create(name='남의 캘린더', owner=self.outsider)
+        self.create_event('팀 일정', aware(2025, 9, 1, 9))
+        self.create_event('개인 일정', aware(2025, 9, 2, 9), calendar=personal)
+        self.create_event('비공개 일정', aware(2025, 9, 3, 9), calendar=hidden, created_by=self.outsider)
+
+        lines = self.read(self.client.get('/api/calendars/export/'))
+        summaries = {line for line in lines if line.startswith('SUMMARY:')}
+        self.assertEqual(summaries, {'SUMMARY:팀 일정', 'SUMMARY:개인 일정'})
+
+    def test_outsider_cannot_export(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.get(f'/api/calendars/{self.calendar.id}/export/')
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('detail', response.json())
+
+
+SAMPLE_ICS = '\r\n'.join([
+    'BEGIN:VCALENDAR',
+    'VERSION:2.0',
+    'PRODID:-//Other App//EN',
+    'BEGIN:VTIMEZONE',
+    'TZID:Asia/Seoul',
+    'BEGIN:STANDARD',
+    'DTSTART:19700101T000000',
+    'TZOFFSETFROM:+0900',
+    'TZOFFSETTO:+0900',
+    'END:STANDARD',
+    'END:VTIMEZONE',
+    'BEGIN:VEVENT',
+    'UID:meeting-1',
+    'DTSTART;TZID=Asia/Seoul:20250901T090000',
+    'DTEND;TZID=Asia/Seoul:20250901T100000',
+    'SUMMARY:주간 회의\\, 팀 공유',
+    'DESCRIPTION:안건 정리\\n자료 공유를 위한 아주 긴 설명입니다. 줄이 75옥텟을 넘어서 ',
+    ' 접혀 있습니다.',
+    'CATEGORIES:업무,중요',
+    'BEGIN:VALARM',
+    'TRIGGER:-PT15M',
+    'DESCRIPTION:알림',
+    'END:VALARM',
+    'END:VEVENT',
+    'BEGIN:VEVENT',
+    'UID:vacation-1',
+    'DTSTART;VALUE=DATE:20250910',
+    'DTEND;VALUE=DATE:20250913',
+    'SUMMARY:휴가',
+    'CATEGORIES:개인',
+    'END:VEVENT',
+    'BEGIN:VEVENT',
+    'UID:standup-1',
+    'DTSTART:20250901T000000Z',
+    'DURATION:PT15M',
+    'RRULE:FREQ=DAILY;COUNT=5',
+    'EXDATE:20250902T000000Z',
+    'SUMMARY:스탠드업',
+    'END:VEVENT',
+    'BEGIN:VEVENT',
+    'UID:standup-1',
+    'RECURRENCE-ID:20250903T000000Z',
+    'DTSTART:20250903T010000Z',
+    'DTEND:20250903T011500Z',
+    'SUMMARY:스탠드업 (변경)',
+    'END:VEVENT',
+    'BEGIN:VEVENT',
+    'UID:broken-1',
+    'SUMMARY:시작 시간 없음',
+    'END:VEVENT',
+    'BEGIN:VEVENT',
+    'UID:hourly-1',
+    'DTSTART:20250901T000000Z',
+    'RRULE:FREQ=HOURLY',
+    'SUMMARY:지원하지 않는 반복',
+    'END:VEVENT',
+    'END:VCALENDAR',
+    '',
+]).encode()
+
+
+class ICalendarImportTests(CalendarTestMixin, TestCase):
+    """POST /api/calendars/<id>/import/ + import_ics 명령"""
+
+    def upload(self, content=SAMPLE_ICS):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f'/api/calendars/{self.calendar.id}/import/',
+                {'file': SimpleUploadedFile('other.ics', content, content_type='text/calendar')},
+                format='multipart',
+            )
+        self.assertEqual(response.status_code, 202, response.data)
+        return self.client.get(f'/api/calendars/{self.calendar.id}/imports/{response.data["id"]}/').data
+
+    def test_import_creates_events_and_tags(self):
+        job = self.upload()
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual(job['progress'], 100)
+        self.assertEqual((job['created_count'], job['updated_count'], job['skipped_count']), (4, 0, 2))
+
+        meeting = Event.objects.get(ical_uid='meeting-1')
+        self.assertEqual(meeting.title, '주간 회의, 팀 공유')
+        self.assertEqual(meeting.start_date, aware(2025, 9, 1, 9))
+        self.assertIn('75옥텟을 넘어서 접혀 있습니다.', meeting.description)
+        self.assertEqual(meeting.tag.name, '업무')
+
+        vacation = Event.objects.get(ical_uid='vacation-1')
+        self.assertTrue(vacation.all_day)
+        self.assertEqual(vacation.end_date, aware(2025, 9, 12, 23, 59, 59))
+        self.assertEqual(set(self.calendar.tags.values_list('name', flat=True)), {'업무', '개인'})
+
+        series = Event.objects.get(ical_uid='standup-1', recurrence_parent__isnull=True)
+        self.assertEqual(series.recurrence_rule, 'FREQ=DAILY;COUNT=5')
+        self.assertIsNotNone(series.recurrence_end)
+        override = series.overrides.get()
+        self.assertEqual(override.title, '스탠드업 (변경)')
+        response = self.client.get(
+            f'/api/calendars/{self.calendar.id}/events/',
+            {'start_date': '2025-09-01', 'end_date': '2025-09-08'},
+        )
+        standups = [event['title'] for event in response.data if event['title'].startswith('스탠드업')]
+        self.assertEqual(len(standups), 4)  # 5회 - EXDATE 1회 (변경된 발생 포함)
+
+    def test_reimport_updates_instead_of_duplicating(self):
+        self.upload()
+        job = self.upload(SAMPLE_ICS.replace('휴가'.encode(), '여름 휴가'.encode()))
+        self.assertEqual((job['created_count'], job['updated_count']), (0, 4))
+        self.assertEqual(Event.objects.filter(calendar=self.calendar).count(), 4)
+        self.assertTrue(Event.objects.filter(title='여름 휴가').exists())
+
+    def test_chunks_dedupe_uid_across_chunks(self):
+        events = '\r\n'.join(
+            f'BEGIN:VEVENT\r\nUID:same\r\nDTSTART:2025090{day}T000000Z\r\nSUMMARY:버전 {day}\r\nEND:VEVENT'
+            for day in range(1, 6)
+        )
+        content = f'BEGIN:VCALENDAR\r\n{events}\r\nEND:VCALENDAR\r\n'.encode()
+        with mock.patch('calendars.imports.EVENT_IMPORT_CHUNK_SIZE', 2):
+            job = self.upload(content)
+        self.assertEqual(Event.objects.filter(ical_uid='same').get().title, '버전 5')
+        self.assertEqual(job['created_count'] + job['updated_count'] + job['skipped_count'], 5)
+
+    def test_outsider_cannot_import(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.post(
+            f'/api/calendars/{self.calendar.id}/import/',
+            {'file': SimpleUploadedFile('other.ics', SAMPLE_ICS)},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_management_command(self):
+        with tempfile.NamedTemporaryFile(suffix='.ics') as file:
+            file.write(SAMPLE_ICS)
+            file.flush()
+            call_command('import_ics', str(self.calendar.id), file.name, stdout=io.StringIO())
+        self.assertEqual(Event.objects.filter(calendar=self.calendar).count(), 4)
+
+    def test_overrides_saved_in_chunks(self):
+        def vevent(uid, summary, start, recurrence_id=None, rule=None):
+            lines = ['BEGIN:VEVENT', f'UID:{uid}', f'DTSTART:{start}', f'SUMMARY:{summary}']
+            if recurrence_id:
+                lines.append(f'RECURRENCE-ID:{recurrence_id}')
+            if rule:
+                lines.append(f'RRULE:{rule}')
+            return lines + ['END:VEVENT']
+
+        # 원본보다 먼저 나오는 발생, 원본 뒤의 발생 5건, 원본이 없는 발생
+        lines = ['BEGIN:VCALENDAR']
+        lines += vevent('series', '변경 9', '20250909T020000Z', recurrence_id='20250909T000000Z')
+        lines += vevent('series', '원본', '20250901T000000Z', rule='FREQ=DAILY;COUNT=10')
+        for day in range(2, 7):
+            lines += vevent('series', f'변경 {day}', f'2025090{day}T010000Z', recurrence_id=f'2025090{day}T000000Z')
+        lines += vevent('missing', '고아', '20250902T000000Z', recurrence_id='20250902T000000Z')
+        content = '\r\n'.join(lines + ['END:VCALENDAR', '']).encode()
+
+        with mock.patch('calendars.imports.EVENT_IMPORT_CHUNK_SIZE', 2), \
+                mock.patch('calendars.imports.EventImporter.save_overrides',
+                           autospec=True, side_effect=EventImporter.save_overrides) as save_overrides:
+            job = self.upload(content)
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual((job['created_count'], job['skipped_count']), (7, 1))
+        self.assertTrue(all(len(call.args[1]) <= 2 for call in save_overrides.call_args_list))
+        series = Event.objects.get(ical_uid='series', recurrence_parent__isnull=True)
+        self.assertEqual(series.overrides.count(), 6)
+
+    def test_all_day_series_with_date_until(self):
+        content = '\r\n'.join([
+            'BEGIN:VCALENDAR',
+            'BEGIN:VEVENT',
+            'UID:weekly-all-day',
+            'DTSTART;VALUE=DATE:20251201',
+            'DTEND;VALUE=DATE:20251202',
+            'RRULE:FREQ=WEEKLY;UNTIL=20251231',
+            'SUMMARY:주간 보고',
+            'END:VEVENT',
+            'BEGIN:VEVENT',
+            'UID:daily-floating',
+            'DTSTART:20251201T090000',
+            'RRULE:FREQ=DAILY;UNTIL=20251205T090000',
+            'SUMMARY:아침 점검',
+            'END:VEVENT',
+            'END:VCALENDAR',
+            '',
+        ]).encode()
+        job = self.upload(content)
+        self.assertEqual((job['created_count'], job['skipped_count']), (2, 0))
+
+        weekly = Event.objects.get(ical_uid='weekly-all-day')
+        self.assertEqual(weekly.recurrence_end, aware(2025, 12, 29, 23, 59, 59))
+        daily = Event.objects.get(ical_uid='daily-floating')
+        self.assertEqual(daily.recurrence_end, aware(2025, 12, 5, 9))
+
+    def test_stale_running_import_marked_failed(self):
+        job = EventImport.objects.create(calendar=self.calendar, created_by=self.owner, status='running')
+        url = f'/api/calendars/{self.calendar.id}/imports/{job.id}/'
+        self.assertEqual(self.client.get(url).data['status'], 'running')
+
+        EventImport.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+        data = self.client.get(url).data
+        self.assertEqual(data['status'], 'failed')
+        self.assertTrue(data['error'])
+
+        # 멈춘 줄 알았던 작업이 다시 진행을 기록하려 하면 중단
+        job.status = 'running'
+        with self.assertRaises(ImportAborted):
+            EventImporter(job).save_progress()
+
+    def test_fail_stale_command(self):
+        job = EventImport.objects.create(calendar=self.calendar, created_by=self.owner, status='running')
+        EventImport.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+        call_command('import_ics', '--fail-stale', stdout=io.StringIO())
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+
+
+class ShareSnapshotTests(CalendarTestMixin, TestCase):
+    """공유 링크 공개 캘린더 정보 캐시"""
+
+    def setUp(self):
+        super().setUp()
+        self.public = APIClient()
+
+    def get_shared(self, token=None, **headers):
+        return self.public.get(
+            '/api/calendars/share/', {'share_token': token or self.calendar.share_token}, headers=headers
+        )
+
+    def test_warm_cache_skips_database(self):
+        response = self.get_shared()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], '팀 캘린더')
+        self.assertFalse(response.data['is_admin'])
+        self.assertIn('public', response['Cache-Control'])
+
+        with self.assertNumQueries(0):
+            cached = self.get_shared()
+        self.assertEqual(cached.data, response.data)
+
+        with self.assertNumQueries(0):
+            not_modified = self.get_shared(**{'If-None-Match': response['ETag']})
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_same_response_for_authenticated_visitor(self):
+        anonymous = self.get_shared()
+        self.public.force_authenticate(self.owner)
+        self.assertEqual(self.get_shared().data, anonymous.data)
+
+    def test_tag_and_member_changes_rebuild_snapshot(self):
+        tag = CalendarTag.objects.create(calendar=self.calendar, name='회의', color='#FF0000')
+        self.get_shared()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                f'/api/calendars/{self.calendar.id}/update_tags/',
+                {'tags': [{'id': str(tag.id), 'name': '바뀐 태그'}]},
+                format='json',
+            )
+        self.assertEqual(response.status_code, 200)
+        names = [item['name'] for item in self.get_shared().data['tags']]
+        self.assertIn('바뀐 태그', names)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CalendarMember.objects.filter(calendar=self.calendar, user=self.member).delete()
+        self.assertEqual(self.get_shared().data['member_count'], 1)
+
+    def test_regenerated_link_invalidates_old_token(self):
+        old_token = self.calendar.share_token
+        self.assertEqual(self.get_shared(old_token).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/calendars/{self.calendar.id}/generate_share_link/')
+        self.assertEqual(self.get_shared(old_token).status_code, 404)
+        self.assertEqual(self.get_shared(response.data['share_token']).status_code, 200)
+
+    def test_unknown_token(self):
+        self.assertEqual(self.get_shared('missing').status_code, 404)
+
+
+class FreeBusyTests(CalendarTestMixin, TestCase):
+    """바쁜 시간 조회"""
+
+    url = '/api/events/free_busy/'
+
+    def setUp(self):
+        super().setUp()
+        self.window = {'start_date': '2025-09-10T00:00:00', 'end_date': '2025-09-11T00:00:00'}
+        self.create_event('비밀 회의', aware(2025, 9, 10, 9), hours=2)
+        self.create_event('겹치는 회의', aware(2025, 9, 10, 10), hours=2)
+        self.create_event('맞닿은 회의', aware(2025, 9, 10, 12))
+        self.create_event('오후', aware(2025, 9, 10, 15))
+        self.create_event('다른 날', aware(2025, 9, 12, 9))
+        self.personal = Calendar.objects.create(name='개인', owner=self.member)
+        self.create_event('개인 일정', aware(2025, 9, 10, 20), calendar=self.personal, created_by=self.member)
+
+    def test_merges_intervals_without_details(self):
+        response = self.client.get(self.url, self.window)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(item['start'], item['end']) for item in response.data['busy']],
+            [(aware(2025, 9, 10, 9), aware(2025, 9, 10, 13)), (aware(2025, 9, 10, 15), aware(2025, 9, 10, 16))],
+        )
+        self.assertNotIn('비밀 회의', response.content.decode())
+
+    def test_recurring_events_and_clipping(self):
+        self.create_event('매일', aware(2025, 9, 9, 23), hours=2, recurrence_rule='FREQ=DAILY')
+        busy = self.client.get(self.url, self.window).data['busy']
+        self.assertEqual(busy[0]['start'], aware(2025, 9, 10, 0))
+        self.assertEqual(busy[0]['end'], aware(2025, 9, 10, 1))
+        self.assertEqual(busy[-1]['start'], aware(2025, 9, 10, 23))
+        self.assertEqual(busy[-1]['end'], aware(2025, 9, 11, 0))
+
+    def test_members_of_shared_calendar(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {**self.window, 'members_of': str(self.calendar.id)})
+        self.assertEqual(response.status_code, 200)
+        by_user = {item['user']: item['busy'] for item in response.data['members']}
+        self.assertEqual(len(by_user[self.owner.id]), 2)
+        # 멤버는 공유 캘린더 일정 + 본인 개인 캘린더 일정
+        self.assertEqual(by_user[self.member.id][-1]['start'], aware(2025, 9, 10, 20))
+
+    def test_requires_window_and_access(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        response = self.client.get(self.url, {**self.window, 'calendars': str(self.personal.id)})
+        self.assertEqual(response.status_code, 403)
+        self.client.force_authenticate(self.outsider)
+        response = self.client.get(self.url, {**self.window, 'members_of': str(self.calendar.id)})
+        self.assertEqual(response.status_code, 403)
+
+
+class EventSearchTests(CalendarTestMixin, TestCase):
+    """일정 검색 (테스트 DB는 SQLite 폴백 사용)"""
+
+    url = '/api/events/search/'
+
+    def setUp(self):
+        super().setUp()
+        self.title_match = self.create_event('주간 회의', aware(2025, 9, 10, 9))
+        self.description_match = self.create_event(
+            '점심', aware(2025, 9, 11, 12), description='회의록 정리 후 식사'
+        )
+        self.create_event('운동', aware(2025, 9, 12, 7), location='헬스장')
+        other = Calendar.objects.create(name='남의 캘린더', owner=self.outsider)
+        self.create_event('비공개 회의', aware(2025, 9, 10, 9), calendar=other, created_by=self.outsider)
+
+    def test_ranked_results_with_highlights(self):
+        response = self.client.get(self.url, {'q': '회의'})
+        self.assertEqual(response.status_code, 200)
+        results = response.data['results']
+        # 접근 가능한 캘린더만, 제목 일치가 메모 일치보다 먼저
+        self.assertEqual([item['id'] for item in results], [str(self.title_match.id), str(self.description_match.id)])
+        self.assertGreater(results[0]['rank'], results[1]['rank'])
+        self.assertEqual(results[0]['highlights']['title'], {'text': '주간 회의', 'matches': [[3, 5]]})
+        self.assertEqual(list(results[1]['highlights']), ['description'])
+
+    def test_all_terms_must_match(self):
+        response = self.client.get(self.url, {'q': '회의 식사'})
+        self.assertEqual([item['id'] for item in response.data['results']], [str(self.description_match.id)])
+
+    def test_keyset_pagination(self):
+        for index in range(3):
+            self.create_event(f'회의 {index}', aware(2025, 9, 13 + index, 9))
+        response = self.client.get(self.url, {'q': '회의', 'limit': 2})
+        seen = [item['id'] for item in response.data['results']]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            seen += [item['id'] for item in response.data['results']]
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_requires_query(self):
+        self.assertEqual(self.client.get(self.url, {'q': '  '}).status_code, 400)
+
+    def test_calendar_filter(self):
+        response = self.client.get(self.url, {'q': '회의', 'calendar_id': str(self.calendar.id)})
+        self.assertEqual(len(response.data['results']), 2)
+        response = self.client.get(self.url, {'q': 'a', 'calendar_id': 'bad'})
+        self.assertEqual(response.status_code, 400)
+
+
+class CalendarStatsTests(CalendarTestMixin, TestCase):
+    """캘린더 통계"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = f'/api/calendars/{self.calendar.id}/stats/'
+        self.tag = CalendarTag.objects.create(calendar=self.calendar, name='회의', color='#FF0000')
+        now = timezone.now()
+        self.create_event('지난 회의', now - timedelta(days=2), tag=self.tag)
+        self.create_event('다음 회의', now + timedelta(days=1), tag=self.tag)
+        self.create_event('매주', now - timedelta(days=30), recurrence_rule='FREQ=WEEKLY')
+        admin = User.objects.create_user(email='admin@planpie.com', password='password123')
+        CalendarMember.objects.create(calendar=self.calendar, user=admin, role='admin')
+
+    def test_single_query_then_cached(self):
+        self.client.get('/api/calendars/')  # 역할 맵 캐시
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {key: value for key, value in response.data.items() if key != 'tags'},
+            {'total_events': 3, 'upcoming_events': 2, 'past_events': 1,
+             'total_members': 3, 'admins': 2, 'members': 1},
+        )
+        self.assertEqual(
+            [dict(item) for item in response.data['tags']],
+            [{'tag': str(self.tag.id), 'total': 2, 'upcoming': 1, 'past': 1},
+             {'tag': None, 'total': 1, 'upcoming': 1, 'past': 0}],
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).data, response.data)
+
+    def test_invalidated_on_event_and_member_changes(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_event('새 일정', timezone.now() + timedelta(days=3))
+        self.assertEqual(self.client.get(self.url).data['total_events'], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CalendarMember.objects.filter(calendar=self.calendar, user=self.member).delete()
+        self.assertEqual(self.client.get(self.url).data['members'], 0)
+
+    def test_moving_event_invalidates_both_calendars(self):
+        other = Calendar.objects.create(name='다른 캘린더', owner=self.owner)
+        other_url = f'/api/calendars/{other.id}/stats/'
+        event = self.create_event('옮길 일정', timezone.now() + timedelta(days=2))
+        self.client.get(self.url)
+        self.client.get(other_url)
+
+        with mock.patch('calendars.signals.publish_change') as publish, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                f'/api/events/{event.id}/', {'calendar': str(other.id)}, format='json'
+            )
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(self.client.get(self.url).data['total_events'], 3)
+        self.assertEqual(self.client.get(other_url).data['total_events'], 1)
+        self.assertEqual(
+            [call.args for call in publish.call_args_list],
+            [(self.calendar.id, 'event', 'deleted', event.id), (other.id, 'event', 'created', event.id)],
+        )
+
+    def test_outsider_gets_404(self):
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_invalid_or_unknown_id_gets_404(self):
+        self.assertEqual(self.client.get('/api/calendars/not-a-uuid/stats/').status_code, 404)
+        self.assertEqual(self.client.get(f'/api/calendars/{uuid.uuid4()}/stats/').status_code, 404)
+
+
+class InvitationEmailTests(CalendarTestMixin, TestCase):
+    """초대 생성 / 이메일 백그라운드 발송"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = f'/api/calendars/{self.calendar.id}/invite/'
+
+    def invite(self, emails, **data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(self.url, {'emails': emails, **data}, format='json')
+
+    def test_bulk_invite_renders_template_once(self):
+        emails = [f'user{index}@example.com' for index in range(30)]
+        with mock.patch(
+            'calendars.invitations.render_to_string', wraps=render_to_string
+        ) as render:
+            response = self.invite(emails + ['member@planpie.com', 'USER0@example.com'], message='같이 써요')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data['sent']), 30)
+        self.assertEqual(response.data['errors'], ['member@planpie.com: 이미 캘린더 멤버입니다.'])
+        self.assertEqual(render.call_count, 1)
+
+        self.assertEqual(len(mail.outbox), 30)
+        invitation = CalendarInvitation.objects.get(invitee_email='user3@example.com')
+        self.assertEqual(invitation.email_status, 'sent')
+        message = next(message for message in mail.outbox if message.to == ['user3@example.com'])
+        self.assertIn(invitation.invitation_token, message.body)
+
+    def test_invite_query_count_does_not_grow_with_emails(self):
+        def count_queries(emails):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.invite(emails)
+            self.assertEqual(response.status_code, 201)
+            return len(queries)
+
+        count_queries(['warmup@example.com'])  # 역할 맵 캐시 채우기
+        few = count_queries([f'few{index}@example.com' for index in range(2)])
+        many = count_queries([f'many{index}@example.com' for index in range(40)])
+        self.assertEqual(few, many)
+        mail.outbox.clear()
+        sent = self.invite(['flat@example.com']).data['sent'][0]
+        self.assertEqual(sent['calendar_id'], str(self.calendar.id))
+        self.assertEqual((sent['invitee_email'], sent['status']), ('flat@example.com', 'pending'))
+
+    def test_pending_invitation_is_not_duplicated(self):
+        self.invite(['new@example.com'])
+        response = self.invite(['new@example.com'])
+        self.assertEqual(response.data['sent'], [])
+        self.assertEqual(len(response.data['errors']), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_failed_send_is_retried_with_backoff(self):
+        with mock.patch(
+            'django.core.mail.EmailMessage.send', side_effect=ConnectionError('smtp down')
+        ), self.assertLogs('calendars.invitations', 'WARNING'):
+            self.invite(['retry@example.com'])
+        invitation = CalendarInvitation.objects.get(invitee_email='retry@example.com')
+        self.assertEqual((invitation.email_status, invitation.email_attempts), ('pending', 1))
+        self.assertGreater(invitation.email_next_attempt_at, timezone.now() + timedelta(seconds=30))
+        self.assertEqual(len(mail.outbox), 0)
+
+        # 예약 시간이 지나면 명령으로 다시 발송
+        CalendarInvitation.objects.filter(pk=invitation.pk).update(email_next_attempt_at=timezone.now())
+        call_command('send_invitation_emails', stdout=io.StringIO())
+        invitation.refresh_from_db()
+        self.assertEqual((invitation.email_status, invitation.email_attempts), ('sent', 2))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_member_cannot_invite(self):
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.invite(['x@example.com']).status_code, 403)
+
+
+class SeedBenchmarkTests(TestCase):
+    def test_seed_skews_events_across_calendars(self):
+        call_command(
+            'seed', users=5, calendars=12, events=600, members=3, tags=2, batch_size=100, stdout=io.StringIO(),
+        )
+        self.assertEqual(User.objects.filter(email__endswith='@planpie.seed').count(), 5)
+        self.assertEqual(Calendar.objects.filter(calendar_type='personal').count(), 5)
+        self.assertEqual(CalendarMember.objects.count(), 7 * 3)
+        self.assertEqual(CalendarTag.objects.count(), 12 * 2)
+        self.assertEqual(Event.objects.count(), 600)
+
+        counts = sorted(
+            Event.objects.values('calendar_id').annotate(count=Count('pk')).values_list('count', flat=True)
+        )
+        self.assertGreater(counts[-1], 3 * counts[0])
+        self.assertFalse(Event.objects.exclude(tag=None).exclude(tag__calendar=F('calendar')).exists())
+
+        # 일정은 행 단위 삭제(시그널) 없이 지움
+        deleted = mock.Mock()
+        post_delete.connect(deleted, sender=Event)
+        try:
+            call_command('seed', clear=True, stdout=io.StringIO())
+        finally:
+            post_delete.disconnect(deleted, sender=Event)
+        deleted.assert_not_called()
+        self.assertFalse(Calendar.objects.exists())
+        self.assertFalse(Event.objects.exists())
+        self.assertFalse(User.objects.filter(email__endswith='@planpie.seed').exists())
+
+    def test_benchmark_writes_json_results(self):
+        call_command('seed', users=4, calendars=8, events=200, members=2, stdout=io.StringIO())
+        with tempfile.NamedTemporaryFile(suffix='.json') as output:
+            call_command('benchmark_api', runs=3, warmup=1, output=output.name, stdout=io.StringIO())
+            results = json.load(open(output.name, encoding='utf-8'))
+            call_command('benchmark_api', runs=1, warmup=0, only=['login'], compare=output.name, stdout=io.StringIO())
 
-# Create your tests here.
+        self.assertEqual(results['dataset']['events'], 200)
+        self.assertEqual(set(results['endpoints']), {
+            'calendars_list', 'calendar_events', 'events_list_window', 'events_list_page', 'share_token', 'login',
+        })
+        for result in results['endpoints'].values():
+            self.assertEqual(result['status'], [200])
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+        # 사용자/역할 맵이 캐시된 뒤에는 인증 쿼리가 없음
+        self.assertLess(results['endpoints']['calendars_list']['queries'],
+                        results['endpoints']['calendars_list']['first_queries'])
@@ -80,6 +80,22 @@ urlpatterns = [
          views.CalendarViewSet.as_view({'get': 'get_by_share_token'}), 
          name='calendar-get-by-share-token'),
     
+    path('api/calendars/<uuid:pk>/export/', 
+         views.CalendarViewSet.as_view({'get': 'export'}), 
+         name='calendar-export'),
+    
+    path('api/calendars/<uuid:pk>/import/', 
+         views.CalendarViewSet.as_view({'post': 'import_ics'}), 
+         name='calendar-import'),
+    
+    path('api/calendars/<uuid:pk>/imports/<uuid:import_id>/', 
+         views.CalendarViewSet.as_view({'get': 'import_status'}), 
+         name='calendar-import-status'),
+    
+    path('api/calendars/export/', 
+         views.CalendarViewSet.as_view({'get': 'export_all'}), 
+         name='calendar-export-all'),
+    
     path('api/calendars/join/', 
          views.CalendarViewSet.as_view({'post': 'join_by_link'}), 
          name='calendar-join'),
@@ -0,0 +1,119 @@
+"""
+캘린더 앱 공용 유틸리티
+"""
+import copy
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Event, MAX_EVENT_DURATION
+from .recurrence import iter_occurrences, parse_exdates
+
+# 한 번에 조회할 수 있는 최대 기간 (월 보기 6주 + 여유)
+MAX_EVENT_WINDOW_DAYS = getattr(settings, 'EVENT_QUERY_MAX_WINDOW_DAYS', 62)
+
+
+def parse_query_datetime(value):
+    """쿼리 파라미터의 날짜/시간 문자열을 aware datetime으로 변환한다.
+
+    ISO 8601 datetime('2025-09-01T09:00:00+09:00')과
+    날짜('2025-09-01', 해당 일 00:00)를 모두 허용한다.
+    """
+    if not value:
+        return None
+
+    parsed = parse_datetime(value)
+    if parsed is None:
+        date_value = parse_date(value)
+        if date_value is None:
+            raise ValueError(f'잘못된 날짜 형식입니다: {value}')
+        parsed = datetime.combine(date_value, time.min)
+
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_event_window(params, max_days=MAX_EVENT_WINDOW_DAYS):
+    """start_date/end_date 쿼리 파라미터로 조회 구간 [start, end)을 만든다.
+
+    둘 다 없으면 None을 반환한다. 한쪽만 있으면 최대 기간만큼 구간을 채운다.
+    구간이 뒤집혔거나 최대 기간을 넘으면 ValueError를 발생시킨다.
+    """
+    start = parse_query_datetime(params.get('start_date'))
+    end = parse_query_datetime(params.get('end_date'))
+
+    if start is None and end is None:
+        return None
+
+    max_width = timedelta(days=max_days)
+    if start is None:
+        start = end - max_width
+    elif end is None:
+        end = start + max_width
+
+    if end <= start:
+        raise ValueError('end_date는 start_date 이후여야 합니다.')
+    if end - start > max_width:
+        raise ValueError(f'조회 기간은 최대 {max_days}일까지 가능합니다.')
+
+    return start, end
+
+
+def filter_events_in_window(queryset, start, end):
+    """구간 [start, end)과 겹치는 이벤트만 남긴다.
+
+    start_date < end 조건이 (calendar, start_date) 인덱스의 범위 조건이 되고,
+    일반 일정은 end_date, 반복 일정은 recurrence_end로 이미 끝난 것을 걸러낸다.
+    (길이가 0인 일정은 시작 시간이 구간 안에 있으면 포함)
+
+    일반 일정(개별 수정된 발생 포함)은 저장 시 길이가 MAX_EVENT_DURATION 이하로
+    제한되므로 start - MAX_EVENT_DURATION 이전에 시작한 일정은 구간에 닿을 수 없다.
+    이 하한으로 인덱스 범위를 [start - MAX_EVENT_DURATION, end)로 좁혀
+    과거 일정 전체를 훑지 않게 한다. 반복 일정은 원본 시작 시간이 오래될 수 있어
+    하한 없이 recurrence_end로만 거른다.
+    """
+    single = Q(recurrence_rule='', start_date__gte=start - MAX_EVENT_DURATION) & (
+        Q(end_date__gt=start) | Q(start_date__gte=start)
+    )
+    series = ~Q(recurrence_rule='') & (
+        Q(recurrence_end__isnull=True) | Q(recurrence_end__gte=start)
+    )
+    return queryset.filter(Q(start_date__lt=end) & (single | series))
+
+
+def expand_occurrences(events, start, end):
+    """반복 일정을 구간 [start, end) 안의 발생들로 펼친다.
+
+    각 발생은 시리즈 원본의 복사본으로, start_date/end_date와
+    recurrence_id(원래 발생 시작 시간)만 다르다. EXDATE와 개별 수정된
+    발생(override 행)은 건너뛰며, override 행은 일반 일정처럼 그대로 반환된다.
+    """
+    events = list(events)
+    masters = [event for event in events if event.recurrence_rule]
+    if not masters:
+        return events
+
+    overridden = {}
+    for parent_id, recurrence_id in Event.objects.filter(
+        recurrence_parent__in=masters
+    ).values_list('recurrence_parent_id', 'recurrence_id'):
+        overridden.setdefault(parent_id, set()).add(recurrence_id)
+
+    result = [event for event in events if not event.recurrence_rule]
+    for master in masters:
+        excluded = parse_exdates(master.recurrence_exdates) | overridden.get(master.pk, set())
+        for occurrence_start, occurrence_end in iter_occurrences(
+            master.recurrence_rule, master.start_date, master.end_date, start, end, excluded
+        ):
+            occurrence = copy.copy(master)
+            occurrence.start_date = occurrence_start
+            occurrence.end_date = occurrence_end
+            occurrence.recurrence_id = occurrence_start
+            result.append(occurrence)
+
+    result.sort(key=lambda event: event.start_date)
+    return result
@@ -1,29 +1,76 @@
 # calendars/views.py
+import uuid
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from django.db import models
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from .models import Calendar, CalendarTag, CalendarMember, Event
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags
+from django.views.decorators.http import condition
+from .batch import BatchFailed, parse_operations, run_event_batch
+from .imports import EVENT_IMPORT_MAX_BYTES, fail_stale_imports, start_import
+from .invitations import create_invitations, queue_invitation_emails
+from .models import Calendar, CalendarTag, CalendarMember, Event, EventImport, EventTombstone
 from .serializers import (
     CalendarSerializer,
     CalendarTagSerializer,
     CalendarMemberSerializer,
+    CalendarStatsSerializer,
     EventSerializer,
+    EventSearchResultSerializer,
+    EventImportSerializer,
+    SendInvitationSerializer,
+    SentInvitationSerializer,
+    UpdateTagsSerializer,
+)
+from .pagination import CalendarPagination, EventPagination, EventSearchPagination
+from .permissions import get_calendar_permissions
+from .realtime import publish_change
+from .sharing import (
+    SHARE_RESPONSE_MAX_AGE, forget_share_token, get_public_snapshot, invalidate_public_snapshot,
 )
+from .ical import ICalendarRenderer, iter_ics
+from .search import search_events, search_terms
+from .stats import get_calendar_stats
+from .freebusy import calendars_free_busy, members_free_busy
+from .etags import calendar_etag, calendar_tags_etag, calendar_members_etag, calendar_events_etag
+from .sync import get_sync_page, CursorExpired, DEFAULT_SYNC_LIMIT, MAX_SYNC_LIMIT
+from .utils import parse_event_window, filter_events_in_window, expand_occurrences
+
+def ics_response(content, filename):
+    """iCalendar 스트리밍 응답"""
+    response = StreamingHttpResponse(content, content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 
 class CalendarViewSet(viewsets.ModelViewSet):
     """캘린더 ViewSet"""
     serializer_class = CalendarSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = None  # 페이지네이션 비활성화
+    pagination_class = CalendarPagination  # cursor/limit 파라미터가 있을 때만 페이지네이션
     
     def get_permissions(self):
         """action에 따라 permission 설정"""
         if self.action == 'get_by_share_token':
             return [AllowAny()]
         return [IsAuthenticated()]
+
+    def get_renderers(self):
+        """.ics 내보내기는 Accept: text/calendar 요청도 받는다
+        (urls.py의 명시적 경로는 @action의 renderer_classes가 적용되지 않음)
+        """
+        if self.action in ('export', 'export_all'):
+            return [JSONRenderer(), ICalendarRenderer()]
+        return super().get_renderers()
     
     def get_queryset(self):
         """사용자가 접근 가능한 캘린더만 반환"""
@@ -36,27 +83,43 @@ class CalendarViewSet(viewsets.ModelViewSet):
             # (실제로는 get_by_share_token에서 직접 조회하므로 사용되지 않음)
             return Calendar.objects.none()
 
-        # 소유자이거나 멤버인 캘린더
-        return Calendar.objects.filter(
-            models.Q(owner=user) | 
-            models.Q(members__user=user)
-        ).distinct()
+        # 소유자이거나 멤버인 캘린더 (캐시된 역할 맵 사용, 조인/DISTINCT 없음)
+        queryset = get_calendar_permissions(self.request).filter_visible(
+            Calendar.objects.all(), 'id'
+        )
+
+        # 직렬화 응답을 만드는 action은 카운트/멤버/태그를 미리 로드
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.with_details()
+        return queryset
     
+    @method_decorator(condition(etag_func=calendar_etag))
+    def retrieve(self, request, *args, **kwargs):
+        """캘린더 상세 조회 (If-None-Match가 일치하면 304)"""
+        return super().retrieve(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         """캘린더 생성 시 소유자 설정"""
         serializer.save(owner=self.request.user)
+        get_calendar_permissions(self.request).reset()
+
+    def perform_destroy(self, instance):
+        """캘린더 삭제 (관리자만)"""
+        if not instance.can_delete(self.request.user, get_calendar_permissions(self.request)):
+            raise PermissionDenied('캘린더를 삭제할 권한이 없습니다.')
+        instance.delete()
     
     @action(detail=False, methods=['get'])
     def check_calendars(self, request):
         """캘린더 존재 여부 확인"""
-        calendars = self.get_queryset()
-        owned_count = calendars.filter(owner=request.user).count()
-        member_count = calendars.exclude(owner=request.user).count()
+        roles = get_calendar_permissions(request).roles
+        owned_count = sum(1 for role in roles.values() if role == 'owner')
+        member_count = len(roles) - owned_count
         return Response({
-            'has_calendars': calendars.exists(),
+            'has_calendars': bool(roles),
             'owned_count': owned_count,
             'member_count': member_count,
-            'should_redirect_to_create': not calendars.exists(),  # 생성 페이지 리다이렉트 여부
+            'should_redirect_to_create': not roles,  # 생성 페이지 리다이렉트 여부
             'user_info': {
                 'id': request.user.id,
                 'email': request.user.email,
@@ -65,6 +128,7 @@ class CalendarViewSet(viewsets.ModelViewSet):
         })
     
     @action(detail=True, methods=['get'])
+    @method_decorator(condition(etag_func=calendar_tags_etag))
     def tags(self, request, pk=None):
         """캘린더 태그 조회"""
         calendar = self.get_object()
@@ -74,33 +138,72 @@ class CalendarViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['put'])
     def update_tags(self, request, pk=None):
-        """캘린더 태그 업데이트"""
+        """캘린더 태그 업데이트
+
+        캘린더의 태그를 한 번에 불러와 메모리에서 변경한 뒤 bulk_update로 저장한다.
+        (calendar, color) 유니크 제약 때문에 색상을 서로 바꾸는 경우를 위해
+        색상이 바뀌는 태그는 먼저 임시 색상으로 옮긴 뒤 최종 값으로 저장한다.
+        요청에 없는 태그 id는 무시한다.
+        """
         calendar = self.get_object()
         
         # 관리자 권한 확인
-        if not calendar.is_admin(request.user):
+        if not calendar.is_admin(request.user, get_calendar_permissions(request)):
             return Response(
                 {'error': '권한이 없습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        tags_data = request.data.get('tags', [])
-        
-        for tag_data in tags_data:
-            tag_id = tag_data.get('id')
-            if tag_id:
-                tag = CalendarTag.objects.filter(id=tag_id, calendar=calendar).first()
-                if tag:
-                    tag.name = tag_data.get('name', tag.name)
-                    tag.color = tag_data.get('color', tag.color)
-                    tag.order = tag_data.get('order', tag.order)
-                    tag.save()
-        
-        tags = calendar.tags.all().order_by('order')
+        serializer = UpdateTagsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        tags = {tag.pk: tag for tag in calendar.tags.all()}
+        changed, recolored = [], []
+        for tag_data in serializer.validated_data['tags']:
+            tag = tags.get(tag_data['id'])
+            if tag is None:
+                continue
+            if tag_data.get('color', tag.color) != tag.color:
+                recolored.append((tag, tag.color))
+            for field, value in tag_data.items():
+                setattr(tag, field, value)
+            changed.append(tag)
+
+        colors = [tag.color.upper() for tag in tags.values()]
+        if len(colors) != len(set(colors)):
+            return Response(
+                {'error': '태그 색상이 중복되었습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if changed:
+            now = timezone.now()
+            with transaction.atomic():
+                if len(recolored) > 1:
+                    # 1단계: 색상이 바뀌는 태그를 겹치지 않는 임시 값(7자)으로 옮김
+                    final_colors = [tag.color for tag, _ in recolored]
+                    for index, (tag, _) in enumerate(recolored):
+                        tag.color = f'~{index:06d}'
+                    CalendarTag.objects.bulk_update([tag for tag, _ in recolored], ['color'])
+                    for (tag, _), color in zip(recolored, final_colors):
+                        tag.color = color
+                # bulk_update는 auto_now를 갱신하지 않으므로 직접 설정 (ETag/동기화 기준)
+                for tag in changed:
+                    tag.updated_at = now
+                CalendarTag.objects.bulk_update(changed, ['name', 'color', 'order', 'updated_at'])
+                # bulk_update는 post_save 시그널을 보내지 않으므로 직접 알림/공유 스냅샷 삭제
+                invalidate_public_snapshot(calendar.pk)
+                transaction.on_commit(lambda: [
+                    publish_change(calendar.pk, 'tag', 'updated', tag.pk) for tag in changed
+                ])
+
+        tags = sorted(tags.values(), key=lambda tag: (tag.order, tag.name))
         serializer = CalendarTagSerializer(tags, many=True)
         return Response(serializer.data)
     
     @action(detail=True, methods=['get'])
+    @method_decorator(condition(etag_func=calendar_members_etag))
     def members(self, request, pk=None):
         """캘린더 멤버 조회"""
         calendar = self.get_object()
@@ -109,20 +212,129 @@ class CalendarViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
     
     @action(detail=True, methods=['get'])
+    def stats(self, request, pk=None):
+        """캘린더 통계 (일정/멤버 수, 태그별 일정 수)
+
+        캐시된 역할 맵으로 접근 권한만 확인하고 통계도 캐시에서 읽으므로,
+        캐시가 살아 있으면 DB를 조회하지 않는다.
+        """
+        try:
+            calendar_id = uuid.UUID(str(pk))
+        except ValueError:
+            calendar_id = None
+        if calendar_id is None or get_calendar_permissions(request).get_role(calendar_id) is None:
+            return Response(
+                {'error': '캘린더를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(CalendarStatsSerializer(get_calendar_stats(calendar_id)).data)
+
+    @action(detail=True, methods=['get'])
+    @method_decorator(condition(etag_func=calendar_events_etag))
     def events(self, request, pk=None):
         """캘린더 이벤트 조회"""
         calendar = self.get_object()
-        events = calendar.events.all()
-        serializer = EventSerializer(events, many=True)
+        events = calendar.events.select_related('calendar', 'tag', 'created_by')
+        try:
+            window = parse_event_window(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if window:
+            events = expand_occurrences(filter_events_in_window(events, *window), *window)
+        serializer = EventSerializer(events, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
     
+    @action(detail=True, methods=['get'])
+    def export(self, request, pk=None):
+        """캘린더 iCalendar(.ics) 내보내기 (스트리밍)"""
+        calendar = self.get_object()
+        return ics_response(
+            iter_ics(Event.objects.filter(calendar=calendar), calendar.name),
+            f'planpie-{calendar.pk}.ics'
+        )
+
+    @action(detail=False, methods=['get'])
+    def export_all(self, request):
+        """접근 가능한 모든 캘린더의 일정을 하나의 .ics로 내보내기 (스트리밍)"""
+        events = get_calendar_permissions(request).filter_visible(Event.objects.all(), 'calendar_id')
+        return ics_response(iter_ics(events, 'PlanPie'), 'planpie.ics')
+
+    @action(detail=True, methods=['post'], url_path='import')
+    def import_ics(self, request, pk=None):
+        """iCalendar(.ics) 가져오기 시작 (처리는 백그라운드, 202 + 작업 정보 반환)"""
+        calendar = self.get_object()
+        if not calendar.can_edit_event(request.user, get_calendar_permissions(request)):
+            return Response(
+                {'error': '이 캘린더에 일정을 추가할 권한이 없습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'file이 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        if upload.size > EVENT_IMPORT_MAX_BYTES:
+            return Response(
+                {'error': f'파일은 최대 {EVENT_IMPORT_MAX_BYTES // (1024 * 1024)}MB까지 가져올 수 있습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        job = EventImport.objects.create(
+            calendar=calendar,
+            created_by=request.user,
+            file=upload,
+            file_name=upload.name[:255],
+            size=upload.size,
+        )
+        start_import(job)
+        return Response(EventImportSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['get'], url_path=r'imports/(?P<import_id>[^/.]+)')
+    def import_status(self, request, pk=None, import_id=None):
+        """가져오기 진행 상황 조회 (오래 진행이 없는 작업은 실패로 표시)"""
+        calendar = self.get_object()
+        job = get_object_or_404(EventImport, pk=import_id, calendar=calendar)
+        if job.status == 'running' and fail_stale_imports(EventImport.objects.filter(pk=job.pk)):
+            job.refresh_from_db()
+        return Response(EventImportSerializer(job).data)
+
+    @action(detail=True, methods=['post'])
+    def invite(self, request, pk=None):
+        """이메일로 캘린더 초대
+
+        초대 행을 한 번에 저장하고 바로 응답하며, 이메일은 커밋 후 백그라운드에서 발송한다.
+        (이미 멤버이거나 대기 중인 초대가 있는 이메일은 errors로 반환)
+        """
+        calendar = self.get_object()
+
+        # 관리자 권한 확인
+        if not calendar.is_admin(request.user, get_calendar_permissions(request)):
+            return Response(
+                {'error': '권한이 없습니다.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = SendInvitationSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        invitations, errors = create_invitations(
+            calendar, request.user, serializer.validated_data['emails'],
+            role=serializer.validated_data['role'],
+            message=serializer.validated_data.get('message', ''),
+        )
+        queue_invitation_emails(invitations)
+        return Response({
+            'sent': SentInvitationSerializer(invitations, many=True).data,
+            'errors': errors,
+        }, status=status.HTTP_201_CREATED if invitations else status.HTTP_200_OK)
+
     @action(detail=True, methods=['get'])
     def share_link(self, request, pk=None):
         """공유 링크 조회"""
         calendar = self.get_object()
         
         # 관리자 권한 확인
-        if not calendar.is_admin(request.user):
+        if not calendar.is_admin(request.user, get_calendar_permissions(request)):
             return Response(
                 {'error': '권한이 없습니다.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -145,16 +357,18 @@ class CalendarViewSet(viewsets.ModelViewSet):
         calendar = self.get_object()
         
         # 관리자 권한 확인
-        if not calendar.is_admin(request.user):
+        if not calendar.is_admin(request.user, get_calendar_permissions(request)):
             return Response(
                 {'error': '권한이 없습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # share_token 재생성
+        # share_token 재생성 (이전 링크는 캐시에서도 바로 무효화)
         import secrets
+        previous_token = calendar.share_token
         calendar.share_token = secrets.token_urlsafe(32)
         calendar.save()
+        forget_share_token(previous_token)
         
         return Response({
             'share_token': calendar.share_token,
@@ -173,18 +387,23 @@ class CalendarViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            # get_queryset을 사용하지 않고 직접 조회
-            calendar = Calendar.objects.get(share_token=share_token)
-            # 공개 API이므로 request.user가 없을 수 있음
-            # serializer에서 request.user를 사용하는 필드가 있을 수 있으므로 주의
-            serializer = CalendarSerializer(calendar, context={'request': request})
-            return Response(serializer.data)
-        except Calendar.DoesNotExist:
+        # 모든 방문자에게 같은 응답을 주도록 익명 사용자 기준으로 직렬화한 스냅샷을 사용
+        # (역할에 따른 is_admin/can_leave/can_delete는 항상 false)
+        snapshot = get_public_snapshot(share_token)
+        if snapshot is None:
             return Response(
                 {'error': '유효하지 않은 공유 링크입니다.'},
                 status=status.HTTP_404_NOT_FOUND
             )
+
+        etag = f'"{snapshot["etag"]}"'
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(snapshot['data'])
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, max_age=SHARE_RESPONSE_MAX_AGE)
+        return response
     
     @action(detail=False, methods=['post'])
     def join_by_link(self, request):
@@ -200,15 +419,17 @@ class CalendarViewSet(viewsets.ModelViewSet):
         try:
             calendar = Calendar.objects.get(share_token=share_token)
             user = request.user
+            permissions = get_calendar_permissions(request)
+            role = calendar.get_role(user, permissions)
             
             # 이미 멤버인지 확인
-            if calendar.owner == user:
+            if role == 'owner':
                 return Response(
                     {'error': '이미 캘린더 소유자입니다.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            if calendar.members.filter(user=user).exists():
+            if role is not None:
                 return Response(
                     {'error': '이미 캘린더 멤버입니다.'},
                     status=status.HTTP_400_BAD_REQUEST
@@ -220,6 +441,7 @@ class CalendarViewSet(viewsets.ModelViewSet):
                 user=user,
                 role='member'
             )
+            permissions.reset()
             
             serializer = CalendarSerializer(calendar, context={'request': request})
             return Response({
@@ -238,31 +460,235 @@ class EventViewSet(viewsets.ModelViewSet):
     """이벤트 ViewSet"""
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = EventPagination
     
     def get_queryset(self):
         """사용자가 접근 가능한 이벤트만 반환"""
-        user = self.request.user
-        return Event.objects.filter(
-            calendar__in=Calendar.objects.filter(
-                models.Q(owner=user) | 
-                models.Q(members__user=user)
-            )
-        ).distinct()
+        return get_calendar_permissions(self.request).filter_visible(
+            Event.objects.all(), 'calendar_id'
+        ).select_related('calendar', 'tag', 'created_by')
+    
+    def filter_queryset(self, queryset):
+        """목록 조회 시 calendar_id, start_date/end_date 필터 적용"""
+        queryset = super().filter_queryset(queryset)
+        if self.action not in ('list', 'calendar_events'):
+            return queryset
+
+        calendar_id = self.get_calendar_id_param()
+        if calendar_id and self.action == 'list':
+            queryset = queryset.filter(calendar_id=calendar_id)
+
+        # 조회 구간과 겹치는 이벤트만 반환
+        window = self.get_window()
+        if window:
+            queryset = filter_events_in_window(queryset, *window)
+        return queryset
+
+    def get_calendar_id_param(self):
+        """calendar_id 쿼리 파라미터 (없으면 None, 형식이 틀리면 400)"""
+        value = self.request.query_params.get('calendar_id')
+        if not value:
+            return None
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            raise ValidationError({'error': 'calendar_id 형식이 올바르지 않습니다.'})
+
+    def get_window(self):
+        """start_date/end_date 쿼리 파라미터의 조회 구간 (없으면 None)"""
+        try:
+            return parse_event_window(self.request.query_params)
+        except ValueError as e:
+            raise ValidationError({'error': str(e)})
+
+    def expand(self, events):
+        """조회 구간이 있으면 반복 일정을 구간 안의 발생들로 펼친다."""
+        window = self.get_window()
+        if window:
+            return expand_occurrences(events, *window)
+        return events
+
+    def list(self, request, *args, **kwargs):
+        """이벤트 목록 조회
+
+        조회 구간이 없으면 (start_date, id) 키셋 페이지네이션으로 반환하고,
+        구간이 있으면 (최대 기간으로 제한됨) 반복 일정을 펼친 배열로 반환한다.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.get_window() is None:
+            page = self.paginate_queryset(queryset)
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(self.expand(queryset), many=True)
+        return Response(serializer.data)
     
     def perform_create(self, serializer):
         """이벤트 생성 시 생성자 설정"""
         serializer.save(created_by=self.request.user)
+
+    def perform_destroy(self, instance):
+        """일정 생성자 또는 캘린더 관리자만 삭제 가능"""
+        if not instance.can_delete(self.request.user, get_calendar_permissions(self.request)):
+            raise PermissionDenied('이 일정을 삭제할 권한이 없습니다.')
+        instance.delete()
     
     @action(detail=False, methods=['get'])
-    def calendar_events(self, request):
+    @method_decorator(condition(etag_func=calendar_events_etag))
+    def calendar_events(self, request, calendar_id=None):
         """특정 캘린더의 이벤트 조회"""
-        calendar_id = request.query_params.get('calendar_id')
+        calendar_id = calendar_id or request.query_params.get('calendar_id')
         if not calendar_id:
             return Response(
                 {'error': 'calendar_id is required'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        events = self.get_queryset().filter(calendar_id=calendar_id)
-        serializer = self.get_serializer(events, many=True)
+        events = self.filter_queryset(self.get_queryset().filter(calendar_id=calendar_id))
+        serializer = self.get_serializer(self.expand(events), many=True)
         return Response(serializer.data)
+
+    @action(detail=False, methods=['post'])
+    def batch(self, request):
+        """일정 일괄 생성/수정/삭제 (한 트랜잭션, 하나라도 실패하면 모두 취소)"""
+        try:
+            operations = parse_operations(request.data)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            results = run_event_batch(operations, self.get_serializer_context())
+        except BatchFailed as e:
+            return Response(
+                {'error': '처리할 수 없는 작업이 있어 아무것도 저장하지 않았습니다.', 'results': e.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({'results': results})
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """일정 검색 (제목/장소/메모, 접근 가능한 캘린더만)
+
+        q: 검색어 (단어마다 접두어 일치, 모든 단어가 일치해야 함)
+        calendar_id: 특정 캘린더로 제한 (선택)
+        순위 내림차순 키셋 페이지네이션 ({next, results}), 결과마다 rank와 highlights 포함
+        """
+        terms = search_terms(request.query_params.get('q'))
+        if not terms:
+            return Response(
+                {'error': '검색어(q)가 필요합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = self.get_queryset()
+        calendar_id = self.get_calendar_id_param()
+        if calendar_id:
+            queryset = queryset.filter(calendar_id=calendar_id)
+
+        paginator = EventSearchPagination()
+        page = paginator.paginate_queryset(search_events(queryset, terms), request, view=self)
+        serializer = EventSearchResultSerializer(
+            page, many=True, context={**self.get_serializer_context(), 'search_terms': terms}
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def free_busy(self, request):
+        """바쁜 시간 조회 (일정 내용 없이 합쳐진 구간만 반환)
+
+        start_date/end_date는 필수이며 다음 중 하나로 대상을 정한다.
+        - calendars=<id>,<id>: 선택한 캘린더 (없으면 접근 가능한 모든 캘린더)를 합친 구간
+        - members_of=<공유 캘린더 id>: 해당 캘린더 멤버별로 각자 속한 모든 캘린더를 합친 구간
+        """
+        window = self.get_window()
+        if window is None:
+            return Response(
+                {'error': 'start_date와 end_date가 필요합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        start, end = window
+        permissions = get_calendar_permissions(request)
+
+        members_of = request.query_params.get('members_of')
+        if members_of:
+            try:
+                calendar_id = uuid.UUID(members_of)
+            except ValueError:
+                calendar_id = None
+            # 자신이 속한 캘린더의 멤버만 조회 가능
+            if permissions.get_role(calendar_id) is None:
+                return Response(
+                    {'error': '권한이 없습니다.'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            return Response({
+                'start': start, 'end': end,
+                'members': members_free_busy(calendar_id, start, end),
+            })
+
+        visible = set(permissions.calendar_ids())
+        calendar_ids = visible
+        if request.query_params.get('calendars'):
+            try:
+                calendar_ids = {
+                    uuid.UUID(value) for value in request.query_params['calendars'].split(',') if value
+                }
+            except ValueError:
+                return Response(
+                    {'error': 'calendars 형식이 올바르지 않습니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if not calendar_ids <= visible:
+                return Response(
+                    {'error': '권한이 없습니다.'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+        return Response({
+            'start': start, 'end': end,
+            'busy': calendars_free_busy(calendar_ids, start, end),
+        })
+
+    @action(detail=False, methods=['get'])
+    def sync(self, request):
+        """증분 동기화: 커서 이후 변경/삭제된 일정만 반환
+
+        첫 요청은 cursor 없이 보내 전체 일정을 받고, 이후에는 응답의 cursor를 보낸다.
+        410(reset)을 받으면 가진 일정을 버리고 cursor 없이 다시 받는다.
+        반복 일정은 펼치지 않고 시리즈 원본/개별 수정 행 그대로 반환한다.
+        """
+        try:
+            limit = min(int(request.query_params.get('limit', DEFAULT_SYNC_LIMIT)), MAX_SYNC_LIMIT)
+        except ValueError:
+            limit = DEFAULT_SYNC_LIMIT
+        limit = max(limit, 1)
+
+        permissions = get_calendar_permissions(request)
+        calendar_ids = permissions.calendar_ids()
+        events = self.get_queryset()
+        tombstones = EventTombstone.objects.filter(calendar_id__in=calendar_ids)
+        calendar_id = self.get_calendar_id_param()
+        if calendar_id:
+            events = events.filter(calendar_id=calendar_id)
+            tombstones = tombstones.filter(calendar_id=calendar_id)
+            calendar_ids = [pk for pk in calendar_ids if pk == calendar_id]
+
+        try:
+            events, deleted, cursor, has_more = get_sync_page(
+                events, tombstones, calendar_ids, request.query_params.get('cursor'), limit
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except CursorExpired:
+            # 보관 기간 초과 또는 캘린더 참여/탈퇴로 증분 동기화 불가
+            return Response(
+                {'error': '동기화 커서가 만료되었습니다. 전체 동기화가 필요합니다.', 'reset': True},
+                status=status.HTTP_410_GONE
+            )
+
+        serializer = self.get_serializer(events, many=True)
+        return Response({
+            'events': serializer.data,
+            'deleted': deleted,
+            'cursor': cursor,
+            'has_more': has_more,
+        })
@@ -13,4 +13,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Django 초기화 이후에 import (모델 사용)
+from calendars.realtime import websocket_application  # noqa: E402
+
+
+async def application(scope, receive, send):
+    """HTTP는 Django로, WebSocket은 캘린더 실시간 알림으로 전달"""
+    if scope['type'] == 'websocket':
+        await websocket_application(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
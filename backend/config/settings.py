@@ -89,10 +89,25 @@ CACHES = {
         "LOCATION": "redis://127.0.0.1:6379/1",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # 캐시 장애 시 DB 조회로 대체 (캐시는 최적화 용도)
+            "IGNORE_EXCEPTIONS": True,
         }
-    }
+    },
+    # refresh 토큰 블랙리스트 - 장애를 무시하면 폐기된 토큰이 다시 통과하므로 오류를 그대로 올림
+    "tokens": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://127.0.0.1:6379/1",
+        "KEY_PREFIX": "tokens",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": False,
+        }
+    },
 }
 
+# 실시간 알림 (WebSocket) 브로커 - 여러 워커 간 Redis pub/sub
+REALTIME_REDIS_URL = "redis://127.0.0.1:6379/2"
+
 HOLIDAY_API_KEY = 'NBU363lwCRjoUYzYX8jo83%2Bn%2FLxNbymJhfxrEtEaHI7bJiMLOaJ3SU9sBuP%2Fs64i5d75Gu5ZuuD0TJFJ2s4mWQ%3D%3D'
 
 # Database
@@ -172,7 +187,7 @@ CORS_ALLOW_ALL_ORIGINS = True  # 개발 환경: 모든 origin 허용
 # REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -192,4 +207,7 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
+    # 블랙리스트는 token_blacklist 앱 대신 캐시(Redis)에 jti로 저장 (accounts/tokens.py)
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.tokens.TokenRefreshSerializer',
+    'TOKEN_VERIFY_SERIALIZER': 'accounts.tokens.TokenVerifySerializer',
 }
\ No newline at end of file
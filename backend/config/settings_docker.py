@@ -28,10 +28,24 @@ CACHES = {
         "LOCATION": "redis://redis:6379/1",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # 캐시 장애 시 DB 조회로 대체 (캐시는 최적화 용도)
+            "IGNORE_EXCEPTIONS": True,
         }
-    }
+    },
+    "tokens": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://redis:6379/1",
+        "KEY_PREFIX": "tokens",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": False,
+        }
+    },
 }
 
+# Docker용 실시간 알림 브로커
+REALTIME_REDIS_URL = "redis://redis:6379/2"
+
 # Docker용 프론트엔드 URL
 FRONTEND_URL = 'http://localhost:3000'
 
@@ -26,9 +26,16 @@ CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "unique-snowflake",
-    }
+    },
+    "tokens": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "unique-snowflake-tokens",
+    },
 }
 
+# 로컬 개발용 실시간 알림 (단일 프로세스 in-memory 브로커)
+REALTIME_REDIS_URL = None
+
 # 로컬 개발용 정적 파일 설정
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
@@ -0,0 +1,47 @@
+"""
+테스트 환경 설정
+PostgreSQL/Redis 없이 `python manage.py test --settings=config.settings_test`로 실행한다.
+"""
+import tempfile
+
+from .settings import *
+
+# 테스트용 데이터베이스 설정 (메모리 SQLite)
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# 테스트용 캐시 설정
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "planpie-test",
+    },
+    "tokens": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "planpie-test-tokens",
+    },
+}
+
+# 테스트 속도를 위한 빠른 비밀번호 해시
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+DEFAULT_FROM_EMAIL = 'noreply@planpie.com'
+
+# 실시간 알림은 in-memory 브로커 사용
+REALTIME_REDIS_URL = None
+
+# 업로드 파일은 임시 디렉터리에 저장
+MEDIA_ROOT = tempfile.mkdtemp(prefix='planpie-test-media-')
+
+# 일정 가져오기는 커밋 직후 같은 스레드에서 처리
+EVENT_IMPORT_IN_THREAD = False
+
+# 초대 이메일은 커밋 직후 같은 스레드에서 발송
+INVITATION_EMAIL_IN_THREAD = False
@@ -100,10 +100,6 @@ interface CalendarAPIResponse {
   data?: Calendar[] | { calendars?: Calendar[]; data?: Calendar[] } | any;
 }
 
-interface EventAPIResponse {
-  data?: Event[] | { events?: Event[]; data?: Event[] } | any;
-}
-
 export const CalendarProvider: React.FC<CalendarProviderProps> = ({ children }) => {
   // 상태 정의 - 초기값을 명확하게 설정
   const [calendars, setCalendars] = useState<Calendar[]>([]);
@@ -171,23 +167,9 @@ export const CalendarProvider: React.FC<CalendarProviderProps> = ({ children })
     try {
       setIsLoading(true);
       
-      const response = await calendarAPI.getEvents() as EventAPIResponse;
-      console.log('API 응답 결과 ===>', response)
-      console.log('응답 데이터 타입:', typeof response.data)
-      console.log('응답 데이터:', response.data)
-      
-      // 응답 구조 확인 - 타입 안전하게 처리
-      let eventsData: Event[] = [];
-      
-      if (response.data) {
-        if (response.data.results && Array.isArray(response.data.results)) {
-          eventsData = response.data.results;
-        } else if (Array.isArray(response.data)) {
-          eventsData = response.data;
-        } else {
-          console.warn('예상하지 못한 응답 구조:', response.data);
-        }
-      }
+      // 조회 구간 없이 요청하면 페이지 단위로 내려오므로 마지막 페이지까지 모두 가져온다
+      const eventsData: Event[] = await calendarAPI.getAllEvents();
+      console.log('불러온 이벤트 수:', eventsData.length)
 
       const uniqueEvents = eventsData.filter((event, index, self) => {
         const firstIndex = self.findIndex(e => 
@@ -17,6 +17,14 @@ import {
   CalendarStatsResponse,
   InvitationResponse,
   EventFilters,
+  EventSyncResponse,
+  EventBatchOperation,
+  EventBatchResult,
+  EventImportStatus,
+  EventSearchResult,
+  FreeBusyResponse,
+  Holiday,
+  PaginatedResponse,
   CalendarFilters,
 } from '../types/calendar.types';
 
@@ -163,10 +171,43 @@ export const calendarAPI = {
   joinByShareLink: (token: string) => 
     api.post<{ calendar: Calendar; message: string }>('/calendars/join/', { share_token: token }),
 
+  // iCalendar(.ics) 내보내기 (calendarId가 없으면 접근 가능한 모든 캘린더)
+  exportCalendar: (calendarId?: string) =>
+    api.get<Blob>(calendarId ? `/calendars/${calendarId}/export/` : '/calendars/export/', {
+      responseType: 'blob',
+    }),
+
+  // iCalendar(.ics) 가져오기 시작 (백그라운드 처리, getImportStatus로 진행 상황 조회)
+  importCalendar: (calendarId: string, file: File) => {
+    const formData = new FormData();
+    formData.append('file', file);
+    return api.post<EventImportStatus>(`/calendars/${calendarId}/import/`, formData, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
+  },
+
+  getImportStatus: (calendarId: string, importId: string) =>
+    api.get<EventImportStatus>(`/calendars/${calendarId}/imports/${importId}/`),
+
   // ===== 이벤트 관련 =====
   // 이벤트 목록 조회
+  // (start_date/end_date가 없으면 { next, results } 형태의 페이지 응답)
   getEvents: (filters?: EventFilters) => 
-    api.get<Event[]>('/events/', { params: filters }),
+    api.get<Event[] | PaginatedResponse<Event>>('/events/', { params: filters }),
+
+  // 전체 이벤트 조회 (다음 페이지 커서를 끝까지 따라감)
+  getAllEvents: async (filters?: Omit<EventFilters, 'cursor'>) => {
+    const events: Event[] = [];
+    let cursor: string | undefined;
+    do {
+      const { data } = await api.get<PaginatedResponse<Event>>('/events/', {
+        params: { ...filters, cursor },
+      });
+      events.push(...data.results);
+      cursor = data.next ? new URL(data.next).searchParams.get('cursor') ?? undefined : undefined;
+    } while (cursor);
+    return events;
+  },
   
   // 특정 이벤트 조회
   getEvent: (id: string) => 
@@ -187,6 +228,39 @@ export const calendarAPI = {
   // 캘린더별 이벤트 조회
   getCalendarEvents: (calendarId: string, filters?: Omit<EventFilters, 'calendar_id'>) => 
     api.get<Event[]>(`/calendars/${calendarId}/events/`, { params: filters }),
+
+  // 증분 동기화 (cursor 없이 호출하면 전체, 이후에는 응답의 cursor 전달)
+  syncEvents: (cursor?: string, calendarId?: string) => 
+    api.get<EventSyncResponse>('/events/sync/', { params: { cursor, calendar_id: calendarId } }),
+
+  // 일정 일괄 생성/수정/삭제 (최대 100개, 한 트랜잭션)
+  batchEvents: (operations: EventBatchOperation[]) =>
+    api.post<{ results: EventBatchResult[] }>('/events/batch/', { operations }),
+
+  // 일정 검색 (순위순, 다음 페이지는 응답의 next 커서 사용)
+  searchEvents: (q: string, options: { calendarId?: string; cursor?: string; limit?: number } = {}) =>
+    api.get<PaginatedResponse<EventSearchResult>>('/events/search/', {
+      params: { q, calendar_id: options.calendarId, cursor: options.cursor, limit: options.limit },
+    }),
+
+  // 공휴일 조회 ([startDate, endDate), YYYY-MM-DD)
+  getHolidays: (startDate: string, endDate: string, country = 'KR') =>
+    api.get<Holiday[]>('/holidays/', { params: { start_date: startDate, end_date: endDate, country } }),
+
+  // 바쁜 시간 조회 (calendarIds 또는 membersOf 중 하나, 구간은 필수)
+  getFreeBusy: (
+    startDate: string,
+    endDate: string,
+    options: { calendarIds?: string[]; membersOf?: string } = {}
+  ) =>
+    api.get<FreeBusyResponse>('/events/free_busy/', {
+      params: {
+        start_date: startDate,
+        end_date: endDate,
+        calendars: options.calendarIds?.join(','),
+        members_of: options.membersOf,
+      },
+    }),
 };
 
 export default api;
\ No newline at end of file
@@ -74,6 +74,13 @@ export interface Event {
   created_by?: User;
   can_edit?: boolean;
   can_delete?: boolean;
+  // 반복 일정 (RFC 5545 RRULE) - 구간 조회 시 발생별로 펼쳐서 내려옴
+  recurrence_rule?: string;
+  recurrence_exdates?: string[];
+  recurrence_end?: string | null;
+  recurrence_parent?: string | null;
+  recurrence_id?: string | null;  // 발생의 원래 시작 시간
+  is_recurring?: boolean;
   created_at: string;
   updated_at: string;
 }
@@ -105,6 +112,55 @@ export interface CreateUpdateEventRequest {
   description?: string;
   tag_id?: string | null;
   location?: string;
+  recurrence_rule?: string;
+  recurrence_exdates?: string[];
+  recurrence_parent?: string | null;
+  recurrence_id?: string | null;
+}
+
+// 일정 일괄 처리 (/events/batch/) - 하나라도 실패하면 아무것도 저장되지 않음
+export type EventBatchOperation =
+  | { op: 'create'; data: Omit<CreateUpdateEventRequest, 'id'> }
+  | { op: 'update'; id: string; data: Partial<Omit<CreateUpdateEventRequest, 'id'>> }
+  | { op: 'delete'; id: string };
+
+export interface EventBatchResult {
+  index: number;
+  op: EventBatchOperation['op'];
+  status: number;
+  event?: Event;
+  id?: string;
+  errors?: Record<string, unknown>;
+}
+
+// 공휴일 (/holidays/)
+export interface Holiday {
+  date: string;  // YYYY-MM-DD
+  name: string;
+}
+
+// 일정 검색 결과 (/events/search/) - matches는 text 안의 [시작, 끝) 위치
+export interface SearchHighlight {
+  text: string;
+  matches: [number, number][];
+}
+
+export interface EventSearchResult extends Event {
+  rank: number;
+  highlights: Partial<Record<'title' | 'location' | 'description', SearchHighlight>>;
+}
+
+// 바쁜 시간 조회 (/events/free_busy/) - 일정 내용 없이 합쳐진 구간만 반환
+export interface BusyInterval {
+  start: string;
+  end: string;
+}
+
+export interface FreeBusyResponse {
+  start: string;
+  end: string;
+  busy?: BusyInterval[];  // calendars 조회
+  members?: { user: string; busy: BusyInterval[] }[];  // members_of 조회
 }
 
 export interface SendInvitationRequest {
@@ -127,13 +183,24 @@ export interface CalendarStatsResponse {
   total_events: number;
   upcoming_events: number;
   past_events: number;
-  total_members: number;
-  admins: number;
+  total_members: number;  // 소유자 포함
+  admins: number;  // 소유자 포함
   members: number;
+  tags: { tag: string | null; total: number; upcoming: number; past: number }[];  // 태그별 일정 수
+}
+
+// 초대 발송 결과 (캘린더 정보는 중첩하지 않음)
+export interface SentInvitation {
+  id: string;
+  calendar_id: string;
+  invitee_email: string;
+  role: 'admin' | 'member';
+  status: 'pending' | 'accepted' | 'declined';
+  expires_at: string;
 }
 
 export interface InvitationResponse {
-  sent: CalendarInvitation[];
+  sent: SentInvitation[];
   errors: string[];
 }
 
@@ -143,17 +210,54 @@ export interface CalendarCheckResponse {
   member_count: number;
 }
 
+// 증분 동기화 응답 (/events/sync/)
+// 커서가 만료되었거나 참여 캘린더가 바뀌면 410 { reset: true } -> cursor 없이 전체 동기화
+export interface EventSyncResponse {
+  events: Event[];
+  deleted: string[];  // 삭제된 일정 ID
+  cursor: string;
+  has_more: boolean;
+}
+
+// iCalendar 가져오기 작업 (/calendars/{id}/imports/{importId}/)
+export interface EventImportStatus {
+  id: string;
+  calendar: string;
+  file_name: string;
+  status: 'pending' | 'running' | 'completed' | 'failed';
+  progress: number;  // 0~100
+  size: number;
+  bytes_read: number;
+  created_count: number;
+  updated_count: number;
+  skipped_count: number;
+  error: string;
+  created_at: string;
+  updated_at: string;  // 마지막 진행 시각
+  finished_at: string | null;
+}
+
+// 키셋 페이지네이션 응답 (next: 다음 페이지 URL, 마지막 페이지면 null)
+export interface PaginatedResponse<T> {
+  next: string | null;
+  results: T[];
+}
+
 // 필터 타입들
 export interface EventFilters {
   calendar_id?: string;
   start_date?: string;
   end_date?: string;
   color?: string;
+  cursor?: string;
+  limit?: number;
 }
 
 export interface CalendarFilters {
   calendar_type?: 'personal' | 'shared';
   is_admin?: boolean;
+  cursor?: string;  // cursor/limit을 보내면 { next, results } 페이지 응답
+  limit?: number;
 }
 
 // 로컬 상태 관리용 (Calendar + 화면 표시 여부)